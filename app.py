@@ -2,11 +2,28 @@ import asyncio
 import logging
 import sys
 
-from aiogram import executor
-from bot import bot, dp, logger
-from config import bot_token
-from database import initialize_database
-from tortoise import Tortoise, run_async
+# Imported first: its import time is the zero point of --profile-startup
+from startup_profile import StartupProfiler
+
+import runtime_config
+from channel_breaker import channel_breaker
+from deferred_verification import deferred_verifier
+from giveaway_routing import routing_index
+from group_prefilter import comment_prefilter
+from instance_lease import InstanceLease
+from lifecycle import drain_shutdown, request_stop, run_until_stopped, run_warmups
+from member_snapshot import member_snapshots
+from membership_index import membership_index
+from outbound import BULK, outbound_priority
+from participant_buffer import participant_buffer
+from participant_sets import participant_sets
+from reply_coalescer import reply_coalescer
+from subscription_cache import subscription_cache
+
+logger = logging.getLogger(__name__)
+
+lease = InstanceLease()
+profiler = StartupProfiler(enabled="--profile-startup" in sys.argv)
 
 
 async def on_startup(dispatcher):
@@ -19,30 +36,111 @@ async def on_startup(dispatcher):
             manage_active_giveaways,
         )
 
-        asyncio.create_task(manage_active_giveaways())
+        # Results posts and winner DMs yield to interactive replies
+        with outbound_priority(BULK):
+            asyncio.create_task(manage_active_giveaways())
         logger.info("Giveaway monitoring started")
 
+        # Pending participants of verify-later giveaways
+        deferred_verifier.start()
+        # MTProto member snapshots, when a session is configured
+        member_snapshots.start()
+
+        if lease.held:
+
+            def on_lease_lost():
+                # Another instance took over: stop before we fight over updates
+                request_stop("instance lease lost")
+                dispatcher.stop_polling()
+
+            asyncio.create_task(lease.keep_alive(on_lease_lost))
+
     except Exception as e:
         logger.error(f"Failed to start bot services: {e}")
         raise
 
+    profiler.mark_ready()
+
 
 async def on_shutdown(dispatcher):
     """Bot shutdown handler"""
+    from tortoise import Tortoise
+
     logger.info("Bot is shutting down...")
 
+    # Intake is stopped: finish in-flight participations, sends and writes
+    await drain_shutdown(runtime_config.SHUTDOWN_TIMEOUT)
+    scheduler = getattr(dispatcher.bot, "scheduler", None)
+    if scheduler:
+        logger.info(f"Outbound sends: {scheduler.stats()}")
+    logger.info(f"Giveaway routing: {routing_index.stats()}")
+    logger.info(f"Group comment pre-filter: {comment_prefilter.stats()}")
+    logger.info(f"Participant sets: {participant_sets.stats()}")
+    logger.info(f"Participant buffer: {participant_buffer.stats()}")
+    logger.info(f"Participation replies: {reply_coalescer.stats()}")
+    logger.info(f"Subscription cache: {subscription_cache.stats()}")
+    logger.info(f"Channel breaker: {channel_breaker.stats()}")
+    logger.info(f"Membership index: {membership_index.stats()}")
+    logger.info(f"Deferred verification: {deferred_verifier.stats()}")
+    logger.info(f"Member snapshots: {member_snapshots.stats()}")
+
+    # Persist FSM states of admins in the middle of a wizard
+    await dispatcher.storage.close()
+    await dispatcher.storage.wait_closed()
+
     # Close bot session
-    if bot:
-        await bot.close()
+    await dispatcher.bot.close()
 
     # Close database connections
     await Tortoise.close_connections()
 
+    # Let a standby instance take over right away
+    lease.release()
+
     logger.info("Bot shutdown complete")
 
 
+async def initialize():
+    """Database init, handler registration and cache warm-up, overlapped"""
+    from database import initialize_database
+
+    database = asyncio.create_task(profiler.timed("database init", initialize_database()))
+    # Let the connection get going before the (blocking) handler imports
+    await asyncio.sleep(0)
+
+    with profiler.phase("import handlers"):
+        # Importing handlers registers them with the dispatcher
+        import handlers
+        # Hot-path caches read by the handlers; importing registers their warm-up
+        import giveaway_keywords
+        import keyword_matcher
+        import subscription_cache
+        from bot import dp
+
+        subscription_cache.register_admin_commands(dp)
+
+    logger.info("All handlers imported and registered")
+
+    await database
+    logger.info("Database initialized successfully")
+
+    # Caches read from the database, so they go once it is up. A possible
+    # standby only reads: warm-ups that write wait for the lease
+    requires_lease = False if runtime_config.LEASE_ENABLED else None
+    await profiler.timed("cache warm-up", run_warmups(requires_lease))
+
+
 def main():
     """Main function to run the bot"""
+    # One event loop for the whole process. It has to exist before bot.py
+    # creates the Bot, which binds to the current loop
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    with profiler.phase("import bot"):
+        from bot import bot, chat_dispatcher, dp
+        from config import bot_token
+
     if not bot_token:
         logger.error("BOT_TOKEN is not set. Please check your .env file")
         sys.exit(1)
@@ -51,25 +149,71 @@ def main():
         logger.error("Bot or Dispatcher not initialized. Check your configuration.")
         sys.exit(1)
 
-    # Initialize database
-    run_async(initialize_database())
-    logger.info("Database initialized successfully")
-
-    # Import all handlers (this registers them with the dispatcher)
-    import handlers
-
-    logger.info("All handlers imported and registered")
-    logger.info("Starting bot polling...")
-
     try:
-        executor.start_polling(
-            dp, skip_updates=True, on_startup=on_startup, on_shutdown=on_shutdown
-        )
+        loop.run_until_complete(initialize())
+
+        if runtime_config.LEASE_ENABLED:
+            standby = []
+
+            async def on_standby():
+                standby.append(True)
+
+            # Standby instances park here, already warm, until the lease frees up
+            loop.run_until_complete(profiler.timed("instance lease", lease.acquire(on_standby)))
+            if standby:
+                # The active instance kept changing the database while we
+                # waited: routes, participants and keywords are stale by now
+                loop.run_until_complete(profiler.timed("cache re-warm", run_warmups()))
+            else:
+                loop.run_until_complete(profiler.timed("lease warm-up", run_warmups(True)))
+
+        if runtime_config.BOT_MODE == "webhook":
+            from webhook import serve_webhook
+
+            logger.info("Starting bot in webhook mode...")
+            run_until_stopped(
+                loop,
+                serve_webhook(
+                    dp,
+                    on_startup=on_startup,
+                    on_shutdown=on_shutdown,
+                    chat_dispatcher=chat_dispatcher,
+                    catch_up=runtime_config.CATCH_UP_ON_START,
+                )
+            )
+        elif runtime_config.BOT_MODE == "executor":
+            from aiogram import executor
+
+            logger.info("Starting bot polling...")
+            executor.start_polling(
+                dp,
+                skip_updates=not runtime_config.CATCH_UP_ON_START,
+                on_startup=on_startup,
+                on_shutdown=on_shutdown,
+            )
+        else:
+            from polling import serve_polling
+
+            logger.info("Starting pipelined bot polling...")
+            run_until_stopped(
+                loop,
+                serve_polling(
+                    dp,
+                    on_startup=on_startup,
+                    on_shutdown=on_shutdown,
+                    skip_updates=not runtime_config.CATCH_UP_ON_START,
+                    chat_dispatcher=chat_dispatcher,
+                    catch_up=runtime_config.CATCH_UP_ON_START,
+                )
+            )
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
         logger.error(f"Bot encountered an error: {e}")
         sys.exit(1)
+    finally:
+        if not loop.is_closed():
+            loop.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SQLiteStorage against aiogram's MemoryStorage.
+
+Simulates the dispatcher's state lookups for a stream of group commenters
+(get_state on every message) mixed with admins walking through a wizard
+(set_state/update_data).
+
+Usage: python bench_fsm_storage.py [--ops 100000] [--users 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+from aiogram.contrib.fsm_storage.memory import MemoryStorage
+from fsm_storage import SQLiteStorage
+from state_store import StateStore
+
+GROUP_ID = -1001234567890
+
+
+async def workload(storage, ops, users, admins=20):
+    rng = random.Random(42)
+    started = time.perf_counter()
+    for i in range(ops):
+        if i % 50 == 0:
+            admin = rng.randrange(admins)
+            await storage.set_state(chat=admin, user=admin, state=f"CreateGiveStates:step{i % 7}")
+            await storage.update_data(chat=admin, user=admin, data={"step": i})
+        else:
+            user = rng.randrange(users)
+            await storage.get_state(chat=GROUP_ID, user=user)
+    return time.perf_counter() - started
+
+
+async def run(args):
+    memory = MemoryStorage()
+    elapsed = await workload(memory, args.ops, args.users)
+    entries = sum(len(users) for users in memory.data.values())
+    print(f"{args.ops} operations over {args.users} users")
+    print(f"  memory   {elapsed:7.3f}s  {args.ops / elapsed:10.0f} ops/sec  {entries} entries kept")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StateStore(os.path.join(tmp, "state.sqlite3"))
+        sqlite = SQLiteStorage(store, max_entries=args.cache_size)
+        elapsed = await workload(sqlite, args.ops, args.users)
+        await sqlite.close()
+        stats = sqlite.stats()
+        print(
+            f"  sqlite   {elapsed:7.3f}s  {args.ops / elapsed:10.0f} ops/sec  "
+            f"{stats['cached']} entries kept, {stats['flushes']} flushes, "
+            f"{stats['rows_written']} rows written"
+        )
+
+        # Cold start: a new process reads the persisted wizard states back
+        restarted = SQLiteStorage(store)
+        started = time.perf_counter()
+        for admin in range(20):
+            await restarted.get_state(chat=admin, user=admin)
+        print(f"  restart  {(time.perf_counter() - started) * 1000:7.2f}ms to restore 20 admin states")
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--cache-size", type=int, default=10000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
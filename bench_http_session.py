@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request overhead of the Bot API client before and after the
+shared connection pool.
+
+Runs against fake_telegram.FakeTelegramServer over plain HTTP on localhost,
+so the numbers only show connection setup and client overhead; with TLS to
+api.telegram.org every avoided connection also saves a handshake.
+
+Usage: python bench_http_session.py [--requests 500] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+import http_session
+from aiogram import Bot
+from aiogram.bot import api
+from fake_telegram import FAKE_TOKEN, FakeTelegramServer
+from http_session import PooledBot
+
+logging.basicConfig(level=logging.WARNING, handlers=[logging.StreamHandler(sys.stdout)])
+
+
+async def session_per_call(args):
+    # What the scripts did: a fresh Bot (and session) for each use
+    for _ in range(args.requests):
+        bot = Bot(token=FAKE_TOKEN)
+        await bot.get_me()
+        await bot.close()
+
+
+async def sequential(bot, args):
+    for _ in range(args.requests):
+        await bot.get_me()
+
+
+async def concurrent(bot, args):
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def call():
+        async with semaphore:
+            await bot.get_me()
+
+    await asyncio.gather(*(call() for _ in range(args.requests)))
+
+
+async def measure(name, scenario, results, args):
+    started = time.perf_counter()
+    await scenario
+    elapsed = time.perf_counter() - started
+    results.append((name, elapsed / args.requests * 1000))
+
+
+async def run(args):
+    server = FakeTelegramServer([])
+    await server.start()
+    api.API_URL = server.api_url
+    results = []
+
+    await measure("session per call", session_per_call(args), results, args)
+
+    bot = Bot(token=FAKE_TOKEN)
+    await bot.get_me()
+    await measure("default session, sequential", sequential(bot, args), results, args)
+    await measure("default session, concurrent", concurrent(bot, args), results, args)
+    await bot.close()
+
+    bot = PooledBot(token=FAKE_TOKEN)
+    await bot.get_me()
+    await measure("shared pool, sequential", sequential(bot, args), results, args)
+    await measure("shared pool, concurrent", concurrent(bot, args), results, args)
+    pool_stats = http_session.metrics.stats()
+    await bot.close()
+    await server.stop()
+
+    print(f"{args.requests} getMe calls, concurrency {args.concurrency}")
+    for name, per_request in results:
+        print(f"  {name:<30} {per_request:7.3f} ms/request")
+    print(f"  shared pool metrics: {pool_stats}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: updates/sec through the polling, pipelined polling and webhook
+ingestion paths.
+
+Runs entirely against fake_telegram.FakeTelegramServer. The handler simulates
+a subscription check with a fixed await, which is what makes the ingestion
+strategy matter.
+
+Usage: python bench_ingestion.py [--updates 2000] [--handler-delay 0.1] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from aiogram import Bot, Dispatcher, types
+from aiogram.bot import api
+from aiohttp import web
+from fake_telegram import FAKE_TOKEN, FakeTelegramServer, make_comment_update
+from polling import PipelinedPoller
+from webhook import WebhookIngestion
+
+logging.basicConfig(level=logging.WARNING, handlers=[logging.StreamHandler(sys.stdout)])
+
+
+def build_dispatcher(handler_delay, total, done):
+    bot = Bot(token=FAKE_TOKEN)
+    dp = Dispatcher(bot)
+    processed = {"count": 0}
+
+    @dp.message_handler(content_types=types.ContentTypes.TEXT)
+    async def on_comment(message: types.Message):
+        # Stand-in for get_chat_member + DB write
+        await asyncio.sleep(handler_delay)
+        processed["count"] += 1
+        if processed["count"] >= total:
+            done.set()
+
+    return bot, dp
+
+
+async def bench_polling(server, args):
+    done = asyncio.Event()
+    bot, dp = build_dispatcher(args.handler_delay, args.updates, done)
+    Dispatcher.set_current(dp)
+    Bot.set_current(bot)
+
+    started = time.perf_counter()
+    polling = asyncio.create_task(dp.start_polling(timeout=1, relax=0, limit=100))
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    dp.stop_polling()
+    await polling
+    await bot.close()
+    return elapsed
+
+
+async def bench_pipelined(server, args):
+    done = asyncio.Event()
+    bot, dp = build_dispatcher(args.handler_delay, args.updates, done)
+    Dispatcher.set_current(dp)
+    Bot.set_current(bot)
+
+    poller = PipelinedPoller(dp, max_timeout=1)
+    started = time.perf_counter()
+    polling = asyncio.create_task(poller.run())
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    poller.stop()
+    await polling
+    await bot.close()
+    return elapsed
+
+
+async def bench_webhook(server, args):
+    done = asyncio.Event()
+    bot, dp = build_dispatcher(args.handler_delay, args.updates, done)
+    Dispatcher.set_current(dp)
+    Bot.set_current(bot)
+
+    ingestion = WebhookIngestion(dp, "/webhook")
+    runner = web.AppRunner(ingestion.build_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    started = time.perf_counter()
+    await server.push_to_webhook(f"http://127.0.0.1:{port}/webhook", args.concurrency)
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    await runner.cleanup()
+    await bot.close()
+    return elapsed
+
+
+async def run(args):
+    updates = [make_comment_update(i + 1, 100000 + i) for i in range(args.updates)]
+    server = FakeTelegramServer(updates, latency=args.latency)
+    await server.start()
+    api.API_URL = server.api_url
+
+    results = []
+    benches = (
+        ("polling", bench_polling),
+        ("pipelined", bench_pipelined),
+        ("webhook", bench_webhook),
+    )
+    for name, bench in benches:
+        elapsed = await bench(server, args)
+        results.append((name, elapsed))
+
+    await server.stop()
+
+    print(f"{args.updates} updates, handler delay {args.handler_delay}s, API latency {args.latency}s")
+    for name, elapsed in results:
+        print(f"  {name:<10} {elapsed:8.2f}s  {args.updates / elapsed:10.1f} updates/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--handler-delay", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=40)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
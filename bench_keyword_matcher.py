@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: participation keyword matches per second, per-message
+lookup + compile (the old handler) vs the cached matcher.
+
+The old path reads the keyword from a SQLite bot_settings table in a worker
+thread (as the async ORM driver does) and compiles the regex for every
+message.
+
+Usage: python bench_keyword_matcher.py [--messages 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import sqlite3
+import tempfile
+import time
+
+from keyword_matcher import KeywordMatcherCache
+
+MESSAGES = ["Участвую", "я участвую!", "Привет всем", "когда итоги?", "УЧАСТВУЮ 🔥", "+"]
+
+
+def make_settings_db(path):
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE bot_settings (id INTEGER PRIMARY KEY, participation_keyword TEXT NOT NULL)"
+    )
+    connection.execute("INSERT INTO bot_settings (participation_keyword) VALUES ('Участвую')")
+    connection.commit()
+    connection.close()
+
+
+def load_keyword_sync(path):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(
+            "SELECT participation_keyword FROM bot_settings ORDER BY id LIMIT 1"
+        ).fetchone()[0]
+    finally:
+        connection.close()
+
+
+async def per_message(path, messages):
+    matched = 0
+    for text in messages:
+        keyword = await asyncio.to_thread(load_keyword_sync, path)
+        if re.compile(re.escape(keyword), re.IGNORECASE).search(text):
+            matched += 1
+    return matched
+
+
+async def cached(path, messages):
+    async def load():
+        return await asyncio.to_thread(load_keyword_sync, path)
+
+    cache = KeywordMatcherCache(load_keyword=load, save_keyword=None)
+    matched = 0
+    for text in messages:
+        if (await cache.get_matcher()).matches(text):
+            matched += 1
+    return matched
+
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "settings.sqlite3")
+        make_settings_db(path)
+        messages = [MESSAGES[i % len(MESSAGES)] for i in range(args.messages)]
+
+        results = []
+        for name, scenario, count in (
+            ("lookup + compile per message", per_message, min(args.messages, 2000)),
+            ("cached matcher", cached, args.messages),
+        ):
+            started = time.perf_counter()
+            matched = await scenario(path, messages[:count])
+            elapsed = time.perf_counter() - started
+            results.append((name, count / elapsed, matched, count))
+
+    for name, rate, matched, count in results:
+        print(f"{name:<32} {rate:>12,.0f} matches/sec ({matched}/{count} matched)")
+    print(f"speed-up: {results[1][1] / results[0][1]:.0f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
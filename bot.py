@@ -1,38 +1,63 @@
-import logging
-import sys
-
-from aiogram import Bot, Dispatcher
-from aiogram.contrib.fsm_storage.memory import MemoryStorage
-from aiogram.utils.exceptions import ValidationError
-from config import bot_token
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("bot.log"), logging.StreamHandler(sys.stdout)],
-)
-
-logger = logging.getLogger(__name__)
-
-# Initialize bot and dispatcher
-try:
-    if not bot_token:
-        raise ValueError("BOT_TOKEN is not set. Please check your .env file")
-
-    bot = Bot(token=bot_token, parse_mode="HTML")
-    logger.info("Bot initialized successfully")
-except ValidationError:
-    logger.error("Invalid bot token provided. Please check your BOT_TOKEN in .env file")
-    bot = None
-except Exception as e:
-    logger.error(f"Failed to initialize bot: {e}")
-    bot = None
-
-# Create storage and dispatcher
-storage = MemoryStorage()
-if bot:
-    dp = Dispatcher(bot, storage=storage)
-else:
-    dp = None
-    logger.error("Dispatcher not created due to bot initialization failure")
+import logging
+
+import runtime_config
+from aiogram import Dispatcher
+from aiogram.contrib.fsm_storage.memory import MemoryStorage
+from aiogram.utils.exceptions import ValidationError
+from config import bot_token
+from fsm_storage import SQLiteStorage
+from lifecycle import DRAIN_HANDLERS, DRAIN_SENDS, DRAIN_WRITES, register_drain
+from log_setup import setup_logging
+from membership_index import MembershipUpdatesMiddleware
+from outbound import OutboundPriorityMiddleware, PacedBot
+from update_dispatcher import ChatShardedDispatcher
+
+# Configure logging (queued, rotating; see log_setup)
+setup_logging()
+
+logger = logging.getLogger(__name__)
+
+# Initialize bot and dispatcher
+try:
+    if not bot_token:
+        raise ValueError("BOT_TOKEN is not set. Please check your .env file")
+
+    # Sends are paced to Telegram's global and per-chat limits
+    bot = PacedBot(token=bot_token, parse_mode="HTML")
+    register_drain("outbound", bot.scheduler.drain, stage=DRAIN_SENDS)
+    logger.info("Bot initialized successfully")
+except ValidationError:
+    logger.error("Invalid bot token provided. Please check your BOT_TOKEN in .env file")
+    bot = None
+except Exception as e:
+    logger.error(f"Failed to initialize bot: {e}")
+    bot = None
+
+# Create storage and dispatcher
+if runtime_config.FSM_STORAGE == "memory":
+    storage = MemoryStorage()
+else:
+    storage = SQLiteStorage(
+        max_entries=runtime_config.FSM_CACHE_SIZE,
+        idle_ttl=runtime_config.FSM_IDLE_TTL,
+        state_ttl=runtime_config.FSM_STATE_TTL,
+        flush_interval=runtime_config.FSM_FLUSH_INTERVAL,
+    )
+    register_drain("fsm_storage", storage.drain, stage=DRAIN_WRITES)
+if bot:
+    dp = Dispatcher(bot, storage=storage)
+    dp.middleware.setup(OutboundPriorityMiddleware())
+    # Channel joins/leaves keep the subscription index current
+    dp.middleware.setup(MembershipUpdatesMiddleware())
+    # Updates are processed in order per chat, in parallel across chats
+    chat_dispatcher = ChatShardedDispatcher(
+        dp,
+        workers=runtime_config.UPDATE_WORKERS,
+        max_pending=runtime_config.UPDATE_QUEUE_LIMIT,
+        max_per_chat=runtime_config.UPDATE_CHAT_QUEUE_LIMIT,
+    )
+    register_drain("updates", chat_dispatcher.drain, stage=DRAIN_HANDLERS)
+else:
+    dp = None
+    chat_dispatcher = None
+    logger.error("Dispatcher not created due to bot initialization failure")
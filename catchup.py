@@ -0,0 +1,136 @@
+"""
+Backlog catch-up on startup.
+
+Instead of dropping everything Telegram queued while the bot was down
+(skip_updates=True), the pending updates are drained in full batches and
+pushed through the dispatcher at full speed before live traffic starts.
+Updates below the persisted offset were already processed and are skipped.
+(Updates fetched but not processed when the previous process died were
+confirmed to Telegram by that process's getUpdates and are not delivered
+again; see polling.py.) Repeated participation comments (those matching the giveaway's
+keyword) by the same user on the same post are collapsed, so a restart does
+not replay a user's spam: they are all checked now, so any one of them is as
+good as the last. Other comments are never dropped, so a question followed
+by the keyword still counts.
+"""
+
+import logging
+import time
+
+from aiogram import Dispatcher, types
+from giveaway_keywords import giveaway_keywords
+from giveaway_routing import routing_index
+from membership_index import allowed_updates
+from state_store import StateStore, state_store
+from update_dispatcher import ChatShardedDispatcher
+
+logger = logging.getLogger(__name__)
+
+OFFSET_KEY = "updates_offset"
+
+
+def get_comment_key(update: types.Update):
+    """(group, user, post) for comments on a channel post, otherwise None"""
+    message = update.message
+    if not message or not message.reply_to_message or not message.from_user:
+        return None
+    post_id = message.reply_to_message.forward_from_message_id
+    if post_id is None:
+        return None
+    return message.chat.id, message.from_user.id, post_id
+
+
+async def is_participation_comment(message: types.Message) -> bool:
+    """Whether a comment matches the keyword of the giveaway it replies to"""
+    callback_value = await routing_index.lookup(
+        message.chat.id, message.reply_to_message.forward_from_message_id
+    )
+    if callback_value is None:
+        return False
+    return await giveaway_keywords.matches(message.text, callback_value)
+
+
+class BacklogCatchUp:
+    """Drains pending updates in large batches before live polling"""
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        chat_dispatcher: ChatShardedDispatcher = None,
+        store: StateStore = None,
+        batch_limit: int = 100,
+        is_participation=is_participation_comment,
+    ):
+        self.dispatcher = dispatcher
+        self.bot = dispatcher.bot
+        self.chat_dispatcher = chat_dispatcher
+        self.store = store or state_store
+        self.batch_limit = batch_limit
+        self._is_participation = is_participation
+
+        self.offset = None
+        self.fetched = 0
+        self.processed = 0
+        self.duplicates = 0
+        self._seen_update_ids = set()
+        # (group, user, post) of participation comments already dispatched
+        self._seen_participations = set()
+
+    async def deduplicate(self, updates):
+        """Drop already-seen update ids and repeated participation comments"""
+        unique = []
+        for update in updates:
+            if update.update_id in self._seen_update_ids:
+                self.duplicates += 1
+                continue
+            self._seen_update_ids.add(update.update_id)
+
+            comment_key = get_comment_key(update)
+            if comment_key is not None and await self._is_participation(update.message):
+                if comment_key in self._seen_participations:
+                    self.duplicates += 1
+                    continue
+                self._seen_participations.add(comment_key)
+            unique.append(update)
+        return unique
+
+    async def _process(self, updates):
+        if self.chat_dispatcher:
+            for update in updates:
+                await self.chat_dispatcher.submit(update)
+        else:
+            await self.dispatcher.process_updates(updates)
+        self.processed += len(updates)
+
+    async def run(self):
+        """Drain the backlog and return the offset live polling should use"""
+        self.offset = await self.store.aget(OFFSET_KEY)
+        started = time.monotonic()
+        logger.info(f"Catching up on pending updates from offset {self.offset}")
+
+        while True:
+            updates = await self.bot.get_updates(
+                offset=self.offset,
+                limit=self.batch_limit,
+                timeout=0,
+                allowed_updates=allowed_updates(),
+            )
+            if not updates:
+                break
+
+            self.fetched += len(updates)
+            self.offset = updates[-1].update_id + 1
+            await self._process(await self.deduplicate(updates))
+
+        if self.chat_dispatcher:
+            await self.chat_dispatcher.join()
+        if self.offset is not None:
+            await self.store.aset(OFFSET_KEY, self.offset)
+
+        elapsed = time.monotonic() - started
+        rate = self.processed / elapsed if elapsed else 0
+        logger.info(
+            f"Catch-up finished: fetched={self.fetched}, processed={self.processed}, "
+            f"duplicates={self.duplicates}, {elapsed:.2f}s ({rate:.0f} updates/sec)"
+        )
+        return self.offset
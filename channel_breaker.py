@@ -0,0 +1,155 @@
+"""
+Per-channel circuit breaker for subscription lookups.
+
+A misconfigured sponsor channel (bot removed from the admins, channel
+deleted, "list index out of range" from aiogram) made every participant pay
+for a failing getChatMember call and leave a full error in the log. After
+failure_threshold consecutive failures caused by the channel itself
+(CHANNEL_ERROR_STATUS: chat not found, bot not an admin; timeouts and flood
+control say nothing about the channel and do not count), the breaker opens:
+subscription_cache answers CHANNEL_UNAVAILABLE_STATUS for that channel
+without calling Telegram, and lets a single probe through every
+probe_interval seconds. The first successful lookup closes it again.
+
+OWNERS get one message when a channel's breaker opens and one when it
+closes, however many participants ran into it in between.
+"""
+
+import asyncio
+import logging
+import time
+
+import runtime_config
+from aiogram import Bot
+from subscription_cache import subscription_cache
+from texts import CHANNEL_BREAKER_CLOSED, CHANNEL_BREAKER_OPENED
+
+logger = logging.getLogger(__name__)
+
+
+async def _notify_owners(text: str):
+    from config import OWNERS
+
+    bot = Bot.get_current()
+    for owner_id in OWNERS:
+        try:
+            await bot.send_message(owner_id, text)
+        except Exception as e:
+            logger.error(f"Failed to alert owner {owner_id}: {e}")
+
+
+class _Incident:
+    __slots__ = ("opened_at", "next_probe_at", "probing", "fast_fails")
+
+    def __init__(self, now: float, probe_interval: float):
+        self.opened_at = now
+        self.next_probe_at = now + probe_interval
+        self.probing = False
+        self.fast_fails = 0
+
+
+class ChannelBreaker:
+    """Consecutive lookup failures per channel; open channels fail fast"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        probe_interval: float = 60,
+        notify=_notify_owners,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = probe_interval
+        self._notify = notify
+
+        # channel_id -> consecutive failures while closed
+        self._failures = {}
+        # channel_id -> _Incident while open
+        self._open = {}
+        self._alerts = set()
+
+        self.incidents = 0
+        self.fast_fails = 0
+        self.probes = 0
+
+    def is_open(self, channel_id) -> bool:
+        return channel_id in self._open
+
+    def allow(self, channel_id) -> bool:
+        """Whether a lookup in this channel may call Telegram now"""
+        incident = self._open.get(channel_id)
+        if incident is None:
+            return True
+        if not incident.probing and time.monotonic() >= incident.next_probe_at:
+            incident.probing = True
+            self.probes += 1
+            return True
+        incident.fast_fails += 1
+        self.fast_fails += 1
+        return False
+
+    def abandon(self, channel_id):
+        """An allowed lookup was cancelled before it could tell anything"""
+        incident = self._open.get(channel_id)
+        if incident is not None:
+            incident.probing = False
+
+    def success(self, channel_id):
+        self._failures.pop(channel_id, None)
+        incident = self._open.pop(channel_id, None)
+        if incident is None:
+            return
+        duration = time.monotonic() - incident.opened_at
+        logger.info(
+            f"Channel {channel_id} is reachable again after {duration:.0f}s "
+            f"({incident.fast_fails} lookups failed fast)"
+        )
+        self._alert(
+            CHANNEL_BREAKER_CLOSED.format(
+                channel_id=channel_id, duration=round(duration), fast_fails=incident.fast_fails
+            )
+        )
+
+    def failure(self, channel_id):
+        now = time.monotonic()
+        incident = self._open.get(channel_id)
+        if incident is not None:
+            # A failed probe (or a lookup started before opening)
+            incident.probing = False
+            incident.next_probe_at = now + self.probe_interval
+            return
+        failures = self._failures[channel_id] = self._failures.get(channel_id, 0) + 1
+        if failures < self.failure_threshold:
+            return
+        del self._failures[channel_id]
+        self._open[channel_id] = _Incident(now, self.probe_interval)
+        self.incidents += 1
+        logger.error(
+            f"Channel {channel_id}: {failures} subscription lookups failed in a row, "
+            f"failing fast and probing every {self.probe_interval:g}s"
+        )
+        self._alert(
+            CHANNEL_BREAKER_OPENED.format(
+                channel_id=channel_id, failures=failures, probe_interval=round(self.probe_interval)
+            )
+        )
+
+    def _alert(self, text: str):
+        # Sent in the background: the participant's lookup does not wait for it
+        task = asyncio.ensure_future(self._notify(text))
+        self._alerts.add(task)
+        task.add_done_callback(self._alerts.discard)
+
+    def stats(self) -> dict:
+        return {
+            "open_channels": sorted(self._open),
+            "incidents": self.incidents,
+            "fast_fails": self.fast_fails,
+            "probes": self.probes,
+        }
+
+
+channel_breaker = ChannelBreaker(
+    failure_threshold=runtime_config.CHANNEL_BREAKER_THRESHOLD,
+    probe_interval=runtime_config.CHANNEL_BREAKER_PROBE_INTERVAL,
+)
+subscription_cache.breaker = channel_breaker
@@ -0,0 +1,317 @@
+"""
+"Verify later" mode for comment giveaways.
+
+Normally the comment handler checks the sponsor channel subscriptions before
+accepting a participant, and at peak that check dominates both latency and
+the Bot API budget. A giveaway with giveaway.verify_later set (column added
+by migrate_database.py) skips it: the handler records the participant as
+pending right away,
+
+    if deferred_giveaways.is_deferred(callback_value):
+        await participant_buffer.add(callback_value, user_id, username, status=PENDING)
+
+and DeferredVerifier checks pending participants in the background, at most
+batch_size every interval seconds, marking each eligible or ineligible. A
+participant whose check fails with an error, or hits a channel that
+channel_breaker has open, stays pending (its attempts are counted) and the
+next rounds move on past it, coming back once they reach the end. Only
+running giveaways are checked in the background. At most max_concurrency
+participants are checked at once, so neither the loop nor a draw bursts
+getChatMember calls past the interactive checks.
+
+The draw (early_finish_giveaway and the scheduled finish) goes through
+draw_winners(), which first checks every participant of that giveaway still
+pending, checks the undecided ones again with backoff, and then samples
+eligible participants only. Whoever still cannot be verified stays out of the
+draw and is logged; when that is more than max_undecided of the participants,
+draw_winners raises RuntimeError instead and the giveaway is left running to
+be finished again later.
+"""
+
+import asyncio
+import logging
+import time
+
+import runtime_config
+from giveaway_events import register_giveaway_listener
+from lifecycle import DRAIN_HANDLERS, register_drain, register_warmup
+from participant_buffer import participant_buffer
+from participant_store import ELIGIBLE, INELIGIBLE, PENDING, participant_store
+from subscription_cache import FAILED_STATUSES, SUBSCRIBED_STATUSES, subscription_cache
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_deferred():
+    """callback_values of running giveaways in "verify later" mode"""
+    from database import GiveAway
+
+    rows = await GiveAway._meta.db.execute_query_dict(
+        "SELECT callback_value FROM giveaway WHERE run_status = 1 AND verify_later = 1"
+    )
+    return [row["callback_value"] for row in rows]
+
+
+async def _load_verify_later(callback_value: str) -> bool:
+    from database import GiveAway
+
+    rows = await GiveAway._meta.db.execute_query_dict(
+        "SELECT verify_later FROM giveaway WHERE callback_value = ?", [callback_value]
+    )
+    return bool(rows and rows[0]["verify_later"])
+
+
+async def _save_verify_later(callback_value: str, enabled: bool):
+    from database import GiveAway
+
+    await GiveAway._meta.db.execute_query(
+        "UPDATE giveaway SET verify_later = ? WHERE callback_value = ?",
+        [int(enabled), callback_value],
+    )
+
+
+async def _load_channels(callback_value: str) -> list:
+    """Sponsor channel ids of a giveaway"""
+    from database import TelegramChannel
+
+    return list(
+        await TelegramChannel.filter(give_callback_value=callback_value).values_list(
+            "channel_id", flat=True
+        )
+    )
+
+
+class DeferredGiveaways:
+    """Which running giveaways accept participants before verifying them"""
+
+    def __init__(
+        self,
+        load_deferred=_load_deferred,
+        load_verify_later=_load_verify_later,
+        save_verify_later=_save_verify_later,
+    ):
+        self._load_deferred = load_deferred
+        self._load_verify_later = load_verify_later
+        self._save_verify_later = save_verify_later
+        self._deferred = set()
+
+    async def load(self):
+        self._deferred = set(await self._load_deferred())
+        logger.info(f"Giveaways in verify-later mode: {len(self._deferred)}")
+
+    def is_deferred(self, callback_value: str) -> bool:
+        return callback_value in self._deferred
+
+    async def set_verify_later(self, callback_value: str, enabled: bool):
+        await self._save_verify_later(callback_value, enabled)
+        if enabled:
+            self._deferred.add(callback_value)
+        else:
+            self._deferred.discard(callback_value)
+
+    async def giveaway_started(self, callback_value: str):
+        try:
+            enabled = await self._load_verify_later(callback_value)
+        except Exception as e:
+            logger.error(f"Failed to load verify-later flag of giveaway {callback_value}: {e}")
+            enabled = False
+        if enabled:
+            self._deferred.add(callback_value)
+
+    def giveaway_finished(self, callback_value: str):
+        self._deferred.discard(callback_value)
+
+    def running(self) -> list:
+        """Running giveaways in verify-later mode"""
+        return list(self._deferred)
+
+
+class DeferredVerifier:
+    """Background subscription checks of pending participants"""
+
+    def __init__(
+        self,
+        store=participant_store,
+        buffer=participant_buffer,
+        cache=subscription_cache,
+        load_channels=_load_channels,
+        giveaways: DeferredGiveaways = None,
+        batch_size: int = 50,
+        interval: float = 2.0,
+        max_concurrency: int = 4,
+        draw_retries: int = 3,
+        retry_delay: float = 1.0,
+        max_undecided: float = 0.2,
+    ):
+        self.store = store
+        self.buffer = buffer
+        self.cache = cache
+        self._load_channels = load_channels
+        self.giveaways = giveaways or deferred_giveaways
+        self.batch_size = batch_size
+        self.interval = interval
+        self.draw_retries = draw_retries
+        self.retry_delay = retry_delay
+        self.max_undecided = max_undecided
+
+        self._checks = asyncio.Semaphore(max_concurrency)
+        self._task = None
+        self._lock = asyncio.Lock()
+        # Last row id checked by the background loop; rounds page past rows
+        # that stay undecided and start over at the end of the table
+        self._cursor = 0
+
+        self.batches = 0
+        self.eligible = 0
+        self.ineligible = 0
+        self.retried = 0
+
+    async def _verdict(self, channel_ids, user_id):
+        """ELIGIBLE, INELIGIBLE, or None when Telegram could not tell"""
+        async with self._checks:
+            statuses = await asyncio.gather(
+                *(self.cache.get_status(channel_id, user_id) for channel_id in channel_ids)
+            )
+        # One channel known to be left decides, whatever the others answered
+        if any(status not in SUBSCRIBED_STATUSES | FAILED_STATUSES for status in statuses):
+            return INELIGIBLE
+        if FAILED_STATUSES.intersection(statuses):
+            return None
+        return ELIGIBLE
+
+    async def verify(self, rows) -> int:
+        """Check these pending rows and store the verdicts; returns how many were decided"""
+        channels = {}
+        for callback_value in {row["giveaway_callback_value"] for row in rows}:
+            channels[callback_value] = await self._load_channels(callback_value)
+        verdicts = await asyncio.gather(
+            *(
+                self._verdict(channels[row["giveaway_callback_value"]], row["user_id"])
+                for row in rows
+            )
+        )
+        decided = {ELIGIBLE: [], INELIGIBLE: []}
+        undecided = []
+        for row, verdict in zip(rows, verdicts):
+            if verdict is None:
+                undecided.append(row["id"])
+            else:
+                decided[verdict].append(row["id"])
+        self.retried += len(undecided)
+        await self.store.retry_later(undecided)
+        await self.store.set_status(decided[ELIGIBLE], ELIGIBLE)
+        await self.store.set_status(decided[INELIGIBLE], INELIGIBLE)
+        self.eligible += len(decided[ELIGIBLE])
+        self.ineligible += len(decided[INELIGIBLE])
+        self.batches += 1
+        return len(decided[ELIGIBLE]) + len(decided[INELIGIBLE])
+
+    async def run_once(self) -> int:
+        """Check the next batch of pending participants of running giveaways"""
+        async with self._lock:
+            # Pending rows of finished giveaways are left to their draw
+            rows = await self.store.pending(
+                self.batch_size, self.giveaways.running(), after_id=self._cursor
+            )
+            self._cursor = rows[-1]["id"] if len(rows) == self.batch_size else 0
+            if not rows:
+                return 0
+            return await self.verify(rows)
+
+    async def _verify_pass(self, callback_value: str) -> int:
+        """Check every pending participant of one giveaway once; returns how many stay pending"""
+        async with self._lock:
+            after_id = 0
+            while True:
+                rows = await self.store.pending(self.batch_size, [callback_value], after_id)
+                if not rows:
+                    break
+                await self.verify(rows)
+                after_id = rows[-1]["id"]
+        return await self.store.count(callback_value, PENDING)
+
+    async def verify_giveaway(self, callback_value: str) -> int:
+        """
+        Check every pending participant of one giveaway before its draw,
+        then up to draw_retries more times the ones Telegram could not
+        decide, waiting retry_delay seconds (doubled each time) in between.
+        Returns how many are still undecided.
+        """
+        await self.buffer.flush()
+        left = await self._verify_pass(callback_value)
+        for attempt in range(self.draw_retries):
+            if not left:
+                break
+            # The background loop may go on while we wait
+            await asyncio.sleep(self.retry_delay * 2**attempt)
+            left = await self._verify_pass(callback_value)
+        return left
+
+    async def draw(self, callback_value: str, winners_count: int) -> list:
+        """Random winners among the verified eligible participants of a giveaway"""
+        undecided = await self.verify_giveaway(callback_value)
+        if undecided:
+            total = await self.store.count(callback_value)
+            logger.warning(
+                f"{undecided} of {total} participants of {callback_value} could not be "
+                f"verified and are left out of the draw"
+            )
+            if undecided > total * self.max_undecided:
+                raise RuntimeError(
+                    f"Cannot draw {callback_value}: {undecided} of {total} participants "
+                    f"are still undecided"
+                )
+        return await self.store.sample(callback_value, winners_count)
+
+    async def _loop(self):
+        while True:
+            started = time.monotonic()
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Deferred verification round failed: {e}")
+            # At most batch_size checks per interval
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def drain(self, timeout: float) -> dict:
+        """Stop the background loop; pending participants stay for the next start"""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        return {"completed": 0, "abandoned": 0}
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "eligible": self.eligible,
+            "ineligible": self.ineligible,
+            "retried": self.retried,
+        }
+
+
+deferred_giveaways = DeferredGiveaways()
+deferred_verifier = DeferredVerifier(
+    batch_size=runtime_config.DEFERRED_VERIFY_BATCH,
+    interval=runtime_config.DEFERRED_VERIFY_INTERVAL,
+    max_concurrency=runtime_config.DEFERRED_VERIFY_CONCURRENCY,
+    draw_retries=runtime_config.DEFERRED_DRAW_RETRIES,
+    max_undecided=runtime_config.DEFERRED_DRAW_MAX_UNDECIDED,
+)
+register_warmup(deferred_giveaways.load)
+register_giveaway_listener(
+    started=deferred_giveaways.giveaway_started, finished=deferred_giveaways.giveaway_finished
+)
+register_drain("deferred verifier", deferred_verifier.drain, DRAIN_HANDLERS)
+
+
+async def draw_winners(callback_value: str, winners_count: int) -> list:
+    """
+    Random winners among the eligible participants of a giveaway; raises
+    RuntimeError when too many of them could not be verified
+    """
+    return await deferred_verifier.draw(callback_value, winners_count)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Local fake of the Telegram Bot API for ingestion benchmarks.
+
+Serves getUpdates from a pre-generated pool of comment updates, answers every
+other method with a minimal successful result and can push the same pool to
+a webhook endpoint. Sent messages are recorded, chats can be set to answer
+with flood control (429) and requests can be answered by dropping the
+connection. Nothing leaves 127.0.0.1.
+"""
+
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+
+FAKE_TOKEN = "123456789:AAFakeTokenForLocalBenchmarksOnly000000"
+GROUP_ID = -1001234567890
+CHANNEL_ID = -1009876543210
+POST_ID = 42
+
+
+def make_comment_update(update_id, user_id, text="Участвую", post_id=POST_ID):
+    """Build a raw update for a discussion group comment on a channel post"""
+    now = int(time.time())
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": 1000 + update_id,
+            "date": now,
+            "chat": {"id": GROUP_ID, "type": "supergroup", "title": "Discussion"},
+            "from": {
+                "id": user_id,
+                "is_bot": False,
+                "first_name": f"User{user_id}",
+                "username": f"user{user_id}",
+            },
+            "text": text,
+            "reply_to_message": {
+                "message_id": 500,
+                "date": now,
+                "chat": {"id": GROUP_ID, "type": "supergroup", "title": "Discussion"},
+                "forward_from_chat": {"id": CHANNEL_ID, "type": "channel", "title": "Channel"},
+                "forward_from_message_id": post_id,
+                "text": "Giveaway",
+            },
+        },
+    }
+
+
+class FakeTelegramServer:
+    """Minimal Bot API server with configurable per-request latency"""
+
+    def __init__(self, updates, latency=0.0, host="127.0.0.1", port=0):
+        self.updates = list(updates)
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.calls = {}
+        # (method, chat_id, monotonic time) of every non-get call
+        self.sent = []
+        # chat_id -> [429 responses left, retry_after]
+        self.flood = {}
+        # Number of upcoming requests to answer by dropping the connection
+        self.disconnects = 0
+        # Parameters of the last setWebhook call
+        self.webhook = None
+        self._runner = None
+        self._new_updates = asyncio.Event()
+
+    @property
+    def api_url(self):
+        return f"http://{self.host}:{self.port}/bot{{token}}/{{method}}"
+
+    def add_updates(self, updates):
+        self.updates.extend(updates)
+        self._new_updates.set()
+
+    async def _read_params(self, request):
+        params = dict(request.query)
+        if request.can_read_body:
+            if request.content_type == "application/json":
+                params.update(await request.json())
+            else:
+                params.update(await request.post())
+        return params
+
+    async def handle(self, request):
+        method = request.match_info["method"]
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if self.disconnects > 0:
+            self.disconnects -= 1
+            request.transport.close()
+            return web.Response()
+        params = await self._read_params(request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if method == "getUpdates":
+            result = await self._get_updates(params)
+        elif method in ("deleteWebhook", "setWebhook"):
+            if method == "setWebhook":
+                self.webhook = params
+            result = True
+        elif method == "getMe":
+            result = {"id": 123456789, "is_bot": True, "first_name": "Fake", "username": "fake_bot"}
+        elif method == "getChatMember":
+            result = {
+                "user": {"id": int(params.get("user_id", 0)), "is_bot": False, "first_name": "U"},
+                "status": "member",
+            }
+        else:
+            chat_id = int(params.get("chat_id", 0) or 0)
+            flood = self.flood.get(chat_id)
+            if flood and flood[0] > 0:
+                flood[0] -= 1
+                return web.json_response(
+                    {
+                        "ok": False,
+                        "error_code": 429,
+                        "description": f"Too Many Requests: retry after {flood[1]}",
+                        "parameters": {"retry_after": flood[1]},
+                    },
+                    status=429,
+                )
+            self.sent.append((method, chat_id, time.monotonic()))
+            result = {
+                "message_id": 1,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+            }
+        return web.json_response({"ok": True, "result": result})
+
+    async def _get_updates(self, params):
+        offset = int(params.get("offset") or 0)
+        limit = int(params.get("limit") or 100)
+        timeout = float(params.get("timeout") or 0)
+
+        pending = [u for u in self.updates if u["update_id"] >= offset]
+        if not pending and timeout:
+            self._new_updates.clear()
+            try:
+                await asyncio.wait_for(self._new_updates.wait(), min(timeout, 1.0))
+            except asyncio.TimeoutError:
+                pass
+            pending = [u for u in self.updates if u["update_id"] >= offset]
+        return pending[:limit]
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("*", "/bot{token}/{method}", self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def push_to_webhook(self, url, concurrency=40):
+        """Deliver the whole pool to a webhook URL like Telegram does"""
+        queue = asyncio.Queue()
+        for update in self.updates:
+            queue.put_nowait(update)
+
+        async def sender(session):
+            while not queue.empty():
+                update = queue.get_nowait()
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                async with session.post(url, json=update) as response:
+                    await response.read()
+
+        async with aiohttp.ClientSession() as session:
+            await asyncio.gather(*(sender(session) for _ in range(concurrency)))
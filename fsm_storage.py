@@ -0,0 +1,376 @@
+"""
+SQLite-backed FSM storage with an in-memory write-back cache.
+
+Admins halfway through the giveaway wizard (CreateGiveStates) or the keyword
+change (BotSettingsStates) keep their state across restarts. Hot records
+live in an LRU; changes are written to SQLite in batches by a background
+flush, and records idle longer than the TTL are dropped from memory (and
+from disk after state_ttl). A record whose data cannot be pickled is logged
+and left out of the flush; it stays in memory only.
+"""
+
+import asyncio
+import copy
+import logging
+import pickle
+import time
+import typing
+from collections import OrderedDict
+
+from aiogram.dispatcher.storage import BaseStorage
+from state_store import StateStore, state_store
+
+logger = logging.getLogger(__name__)
+
+
+def _empty_record():
+    return {"state": None, "data": {}, "bucket": {}}
+
+
+def _is_empty(record) -> bool:
+    return record["state"] is None and not record["data"] and not record["bucket"]
+
+
+def _serialize(record):
+    """(state, data, bucket) row values, or None if the row is to be deleted"""
+    if record is None or _is_empty(record):
+        return None
+    return record["state"], pickle.dumps(record["data"]), pickle.dumps(record["bucket"])
+
+
+class SQLiteStorage(BaseStorage):
+    """Persistent FSM storage: LRU in memory, batched write-back to SQLite"""
+
+    def __init__(
+        self,
+        store: StateStore = None,
+        max_entries: int = 10000,
+        idle_ttl: float = 600,
+        state_ttl: float = 7 * 24 * 3600,
+        flush_interval: float = 0.5,
+        flush_batch: int = 500,
+    ):
+        self.store = store or state_store
+        self.max_entries = max_entries
+        self.idle_ttl = idle_ttl
+        self.state_ttl = state_ttl
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+
+        # (chat, user) -> record; most recently used at the end
+        self._cache = OrderedDict()
+        self._last_access = {}
+        self._dirty = set()
+        self._flushing = set()
+        self._flush_task = None
+        self._flush_now = None
+        self._table_ready = False
+        self._last_purge = 0.0
+        # Keys that have a row on disk; everyone else is known to be empty
+        # without a query, which keeps ordinary group chatter off SQLite
+        self._persisted_keys = None
+
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.rows_written = 0
+        self.unpicklable = 0
+
+    # --- persistence -----------------------------------------------------
+
+    def _ensure_table(self):
+        if self._table_ready:
+            return
+        self.store.execute(
+            "CREATE TABLE IF NOT EXISTS fsm_state ("
+            "chat TEXT NOT NULL, user TEXT NOT NULL, state TEXT, "
+            "data BLOB NOT NULL, bucket BLOB NOT NULL, updated_at REAL NOT NULL, "
+            "PRIMARY KEY (chat, user))"
+        )
+        self._table_ready = True
+
+    def _load_persisted_keys(self):
+        self._ensure_table()
+        rows = self.store.execute("SELECT chat, user FROM fsm_state")
+        return {(chat, user) for chat, user in rows}
+
+    def _load(self, key):
+        self._ensure_table()
+        rows = self.store.execute(
+            "SELECT state, data, bucket, updated_at FROM fsm_state WHERE chat = ? AND user = ?",
+            key,
+        )
+        if not rows or rows[0][3] < time.time() - self.state_ttl:
+            return _empty_record()
+        state, data, bucket, _ = rows[0]
+        return {"state": state, "data": pickle.loads(data), "bucket": pickle.loads(bucket)}
+
+    def _write(self, items):
+        self._ensure_table()
+        now = time.time()
+
+        def write(connection):
+            for key, row in items:
+                if row is None:
+                    connection.execute(
+                        "DELETE FROM fsm_state WHERE chat = ? AND user = ?", key
+                    )
+                else:
+                    connection.execute(
+                        "INSERT INTO fsm_state (chat, user, state, data, bucket, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(chat, user) DO UPDATE SET "
+                        "state = excluded.state, data = excluded.data, "
+                        "bucket = excluded.bucket, updated_at = excluded.updated_at",
+                        (*key, *row, now),
+                    )
+
+        self.store.transaction(write)
+
+    def _purge_expired(self):
+        self._ensure_table()
+        self.store.execute(
+            "DELETE FROM fsm_state WHERE updated_at < ?", (time.time() - self.state_ttl,)
+        )
+
+    async def flush(self):
+        """Write every dirty record to SQLite in one transaction"""
+        if not self._dirty:
+            return
+        keys = list(self._dirty)
+        self._dirty.clear()
+        # Pickled now, one record at a time: records may change while the
+        # write runs in a thread, and one bad record must not fail the batch
+        # (it would fail every retry the same way)
+        items = []
+        for key in keys:
+            try:
+                items.append((key, _serialize(self._cache.get(key))))
+            except Exception as e:
+                self.unpicklable += 1
+                logger.error(f"FSM state of {key} cannot be pickled, not saved: {e}")
+        if not items:
+            return
+        keys = [key for key, _ in items]
+        started = time.monotonic()
+        self._flushing.update(keys)
+        try:
+            await asyncio.to_thread(self._write, items)
+        except Exception as e:
+            logger.error(f"FSM storage flush failed, will retry: {e}")
+            self._dirty.update(keys)
+            return
+        finally:
+            self._flushing.difference_update(keys)
+        for key, row in items:
+            if row is None:
+                self._persisted_keys.discard(key)
+            else:
+                self._persisted_keys.add(key)
+        self.flushes += 1
+        self.rows_written += len(items)
+        logger.debug(
+            f"FSM storage flushed {len(items)} records in "
+            f"{(time.monotonic() - started) * 1000:.1f}ms"
+        )
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            await self.flush()
+            self._evict()
+            if time.monotonic() - self._last_purge > 3600:
+                self._last_purge = time.monotonic()
+                await asyncio.to_thread(self._purge_expired)
+
+    def _mark_dirty(self, key):
+        self._dirty.add(key)
+        if self._flush_task is None:
+            self._flush_now = asyncio.Event()
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+        if len(self._dirty) >= self.flush_batch:
+            self._flush_now.set()
+
+    # --- cache -----------------------------------------------------------
+
+    def _evict(self, idle: bool = True):
+        """Drop clean records beyond the LRU capacity (and idle ones if idle)"""
+        deadline = time.monotonic() - self.idle_ttl if idle else float("-inf")
+        skipped = 0
+        while len(self._cache) > skipped:
+            key = next(iter(self._cache))
+            if len(self._cache) <= self.max_entries and self._last_access[key] >= deadline:
+                # Entries are in LRU order: the rest are fresher
+                break
+            if key in self._dirty or key in self._flushing:
+                # Unsaved changes stay in memory until the next flush
+                self._cache.move_to_end(key)
+                skipped += 1
+                continue
+            self._cache.popitem(last=False)
+            del self._last_access[key]
+
+    async def _record(self, chat, user):
+        key = tuple(map(str, self.check_address(chat=chat, user=user)))
+        record = self._cache.get(key)
+        if record is None:
+            self.misses += 1
+            if self._persisted_keys is None:
+                self._persisted_keys = await asyncio.to_thread(self._load_persisted_keys)
+            if key in self._persisted_keys:
+                record = await asyncio.to_thread(self._load, key)
+            else:
+                record = _empty_record()
+            # Another coroutine may have loaded it while we waited
+            record = self._cache.setdefault(key, record)
+        else:
+            self.hits += 1
+        self._cache.move_to_end(key)
+        self._last_access[key] = time.monotonic()
+        if len(self._cache) > self.max_entries:
+            # The current key is the most recent one, so it is never evicted here
+            self._evict(idle=False)
+        return key, record
+
+    def stats(self) -> dict:
+        return {
+            "cached": len(self._cache),
+            "dirty": len(self._dirty),
+            "hits": self.hits,
+            "misses": self.misses,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "unpicklable": self.unpicklable,
+        }
+
+    # --- BaseStorage -----------------------------------------------------
+
+    async def drain(self, timeout: float) -> dict:
+        """Flush pending state changes for the shutdown drain"""
+        dirty = len(self._dirty)
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return {"completed": dirty - len(self._dirty), "abandoned": len(self._dirty)}
+
+    async def close(self):
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+        logger.info(f"FSM storage closed: {self.stats()}")
+
+    async def wait_closed(self):
+        pass
+
+    async def get_state(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        default: typing.Optional[str] = None,
+    ) -> typing.Optional[str]:
+        _, record = await self._record(chat, user)
+        return record["state"] if record["state"] is not None else default
+
+    async def get_data(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        default: typing.Optional[dict] = None,
+    ) -> typing.Dict:
+        _, record = await self._record(chat, user)
+        if not record["data"] and default is not None:
+            return copy.deepcopy(default)
+        return copy.deepcopy(record["data"])
+
+    async def set_state(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        state: typing.Optional[typing.AnyStr] = None,
+    ):
+        key, record = await self._record(chat, user)
+        record["state"] = state
+        self._mark_dirty(key)
+
+    async def set_data(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        data: typing.Dict = None,
+    ):
+        key, record = await self._record(chat, user)
+        record["data"] = copy.deepcopy(data) if data else {}
+        self._mark_dirty(key)
+
+    async def update_data(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        data: typing.Dict = None,
+        **kwargs,
+    ):
+        key, record = await self._record(chat, user)
+        record["data"].update(copy.deepcopy(data or {}), **kwargs)
+        self._mark_dirty(key)
+
+    async def reset_state(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        with_data: typing.Optional[bool] = True,
+    ):
+        key, record = await self._record(chat, user)
+        record["state"] = None
+        if with_data:
+            record["data"] = {}
+        self._mark_dirty(key)
+
+    def has_bucket(self):
+        return True
+
+    async def get_bucket(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        default: typing.Optional[dict] = None,
+    ) -> typing.Dict:
+        _, record = await self._record(chat, user)
+        if not record["bucket"] and default is not None:
+            return copy.deepcopy(default)
+        return copy.deepcopy(record["bucket"])
+
+    async def set_bucket(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        bucket: typing.Dict = None,
+    ):
+        key, record = await self._record(chat, user)
+        record["bucket"] = copy.deepcopy(bucket) if bucket else {}
+        self._mark_dirty(key)
+
+    async def update_bucket(
+        self,
+        *,
+        chat: typing.Union[str, int, None] = None,
+        user: typing.Union[str, int, None] = None,
+        bucket: typing.Dict = None,
+        **kwargs,
+    ):
+        key, record = await self._record(chat, user)
+        record["bucket"].update(copy.deepcopy(bucket or {}), **kwargs)
+        self._mark_dirty(key)
@@ -0,0 +1,50 @@
+"""
+Giveaway lifecycle notifications for in-memory indexes.
+
+The indexes that mirror running giveaways (post routing, per-giveaway
+keywords, ...) register here once; the flows that start, finish or delete a
+giveaway make a single call:
+
+    await giveaway_events.giveaway_started(callback_value)
+    await giveaway_events.giveaway_finished(callback_value)
+
+A failing listener is logged and does not stop the others.
+"""
+
+import inspect
+import logging
+
+logger = logging.getLogger(__name__)
+
+_started = []
+_finished = []
+
+
+def register_giveaway_listener(started=None, finished=None):
+    """started/finished(callback_value), sync or async"""
+    if started:
+        _started.append(started)
+    if finished:
+        _finished.append(finished)
+
+
+async def _notify(listeners, callback_value, event):
+    for listener in listeners:
+        try:
+            result = listener(callback_value)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Giveaway {event} listener failed for {callback_value}: {e}")
+
+
+async def giveaway_started(callback_value: str):
+    await _notify(_started, callback_value, "started")
+
+
+async def giveaway_finished(callback_value: str):
+    """Also used when a giveaway is deleted"""
+    await _notify(_finished, callback_value, "finished")
+
+
+giveaway_deleted = giveaway_finished
@@ -0,0 +1,260 @@
+"""
+Per-giveaway participation keywords matched with one Aho-Corasick automaton.
+
+A giveaway may set its own phrase (giveaway.participation_keyword, added by
+migrate_database.py); giveaways without one keep using the global keyword
+from keyword_matcher. The phrases of all running giveaways live in a single
+automaton over casefolded text, so a comment is scanned once no matter how
+many giveaways are running. Starting or stopping a giveaway adds or removes
+only its phrase; failure links are recomputed once, on the next search after
+a change.
+"""
+
+import logging
+import time
+from collections import deque
+
+from giveaway_events import register_giveaway_listener
+from keyword_matcher import keyword_cache
+from lifecycle import register_warmup
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_keyword(keyword):
+    keyword = (keyword or "").strip().casefold()
+    return keyword or None
+
+
+class AhoCorasick:
+    """Multi-pattern substring search with incremental add/remove"""
+
+    def __init__(self):
+        self._reset()
+        self._patterns = set()
+
+    def _reset(self):
+        # Node 0 is the root
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]
+        # Nearest node on the failure chain that ends a pattern
+        self._dict_link = [0]
+        self._dead_nodes = 0
+        self._dirty = True
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __contains__(self, pattern):
+        return pattern in self._patterns
+
+    def _insert(self, pattern):
+        node = 0
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._dict_link.append(0)
+            node = child
+        self._output[node] = pattern
+
+    def add(self, pattern: str):
+        if not pattern or pattern in self._patterns:
+            return
+        self._patterns.add(pattern)
+        self._insert(pattern)
+        self._dirty = True
+
+    def remove(self, pattern: str):
+        if pattern not in self._patterns:
+            return
+        self._patterns.discard(pattern)
+        node = 0
+        for char in pattern:
+            node = self._goto[node][char]
+        self._output[node] = None
+        self._dead_nodes += len(pattern)
+        self._dirty = True
+        if self._dead_nodes > len(self._goto) // 2:
+            # Mostly stale branches: start over from the live patterns
+            self._reset()
+            for live in self._patterns:
+                self._insert(live)
+
+    def _build(self):
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._dict_link[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._output[fail] else self._dict_link[fail]
+                queue.append(child)
+        self._dirty = False
+
+    def search(self, text: str) -> set:
+        """Patterns occurring in text (already casefolded)"""
+        if not self._patterns:
+            return set()
+        if self._dirty:
+            self._build()
+        goto, fail, output, dict_link = self._goto, self._fail, self._output, self._dict_link
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            match = node if output[node] else dict_link[node]
+            while match:
+                found.add(output[match])
+                match = dict_link[match]
+        return found
+
+
+async def _load_keywords():
+    """{callback_value: keyword} of running giveaways with their own keyword"""
+    from database import GiveAway
+
+    rows = await GiveAway._meta.db.execute_query_dict(
+        "SELECT callback_value, participation_keyword FROM giveaway "
+        "WHERE run_status = 1 AND participation_keyword IS NOT NULL"
+    )
+    return {row["callback_value"]: row["participation_keyword"] for row in rows}
+
+
+async def _load_keyword(callback_value: str):
+    from database import GiveAway
+
+    rows = await GiveAway._meta.db.execute_query_dict(
+        "SELECT participation_keyword FROM giveaway WHERE callback_value = ?", [callback_value]
+    )
+    return rows[0]["participation_keyword"] if rows else None
+
+
+async def _save_keyword(callback_value: str, keyword):
+    from database import GiveAway
+
+    await GiveAway._meta.db.execute_query(
+        "UPDATE giveaway SET participation_keyword = ? WHERE callback_value = ?",
+        [keyword, callback_value],
+    )
+
+
+class GiveawayKeywordIndex:
+    """Keywords of running giveaways and the automaton that finds them"""
+
+    def __init__(
+        self,
+        load_keywords=_load_keywords,
+        load_keyword=_load_keyword,
+        save_keyword=_save_keyword,
+        default_matcher=keyword_cache,
+    ):
+        self._load_keywords = load_keywords
+        self._load_keyword = load_keyword
+        self._save_keyword = save_keyword
+        self.default_matcher = default_matcher
+
+        self.automaton = AhoCorasick()
+        # callback_value -> casefolded keyword
+        self._keywords = {}
+        # casefolded keyword -> callback_values using it
+        self._giveaways = {}
+        self.searches = 0
+
+    def _set(self, callback_value, keyword):
+        self._unset(callback_value)
+        keyword = normalize_keyword(keyword)
+        if keyword is None:
+            return
+        self._keywords[callback_value] = keyword
+        self._giveaways.setdefault(keyword, set()).add(callback_value)
+        self.automaton.add(keyword)
+
+    def _unset(self, callback_value):
+        keyword = self._keywords.pop(callback_value, None)
+        if keyword is None:
+            return
+        owners = self._giveaways[keyword]
+        owners.discard(callback_value)
+        if not owners:
+            del self._giveaways[keyword]
+            self.automaton.remove(keyword)
+
+    async def load(self):
+        started = time.monotonic()
+        keywords = await self._load_keywords()
+        for callback_value in list(self._keywords):
+            self._unset(callback_value)
+        for callback_value, keyword in keywords.items():
+            self._set(callback_value, keyword)
+        logger.info(
+            f"Giveaway keywords loaded: {len(self._keywords)} giveaways, "
+            f"{len(self.automaton)} phrases in {(time.monotonic() - started) * 1000:.1f}ms"
+        )
+
+    async def giveaway_started(self, callback_value: str):
+        try:
+            keyword = await self._load_keyword(callback_value)
+        except Exception as e:
+            # Without its own keyword the giveaway falls back to the global one
+            logger.error(f"Failed to load keyword of giveaway {callback_value}: {e}")
+            keyword = None
+        self._set(callback_value, keyword)
+
+    def giveaway_finished(self, callback_value: str):
+        self._unset(callback_value)
+
+    giveaway_deleted = giveaway_finished
+
+    async def set_keyword(self, callback_value: str, keyword):
+        """Store a giveaway's own keyword (None: use the global one)"""
+        keyword = (keyword or "").strip() or None
+        await self._save_keyword(callback_value, keyword)
+        self._set(callback_value, keyword)
+
+    def has_own_keyword(self, callback_value: str) -> bool:
+        return callback_value in self._keywords
+
+    def find(self, text: str) -> set:
+        """callback_values of the giveaways whose own keyword is in text"""
+        if not text or not self._keywords:
+            return set()
+        self.searches += 1
+        found = set()
+        for keyword in self.automaton.search(text.casefold()):
+            found |= self._giveaways[keyword]
+        return found
+
+    async def matches(self, text: str, callback_value: str) -> bool:
+        """Whether text is a participation comment for this giveaway"""
+        if callback_value in self._keywords:
+            return callback_value in self.find(text)
+        return (await self.default_matcher.get_matcher()).matches(text)
+
+    def stats(self) -> dict:
+        return {
+            "giveaways": len(self._keywords),
+            "phrases": len(self.automaton),
+            "searches": self.searches,
+        }
+
+
+giveaway_keywords = GiveawayKeywordIndex()
+register_warmup(giveaway_keywords.load)
+register_giveaway_listener(
+    started=giveaway_keywords.giveaway_started, finished=giveaway_keywords.giveaway_finished
+)
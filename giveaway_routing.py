@@ -0,0 +1,207 @@
+"""
+In-memory routing of discussion group comments to giveaways.
+
+A comment belongs to a giveaway when it replies to the forwarded channel post
+the giveaway was published under: (group_id, forward_from_message_id) maps
+to the giveaway's callback_value. The index holds those routes for every
+running giveaway. It is loaded at startup and updated in place when a
+giveaway starts, finishes or is deleted (see giveaway_events).
+
+Ordinary group chatter costs a dict lookup. A post that is not in the index
+is looked up in the database once (in case a giveaway was started by
+another process) and then remembered as unknown for negative_ttl seconds.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+
+import runtime_config
+from giveaway_events import register_giveaway_listener
+from lifecycle import register_warmup
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_routes():
+    """[(group_id, post_id, callback_value)] of every running giveaway"""
+    from database import GiveAway, TelegramChannel
+
+    running = await GiveAway.filter(run_status=True).values_list("callback_value", flat=True)
+    rows = await TelegramChannel.filter(
+        give_callback_value__in=list(running), group_id__isnull=False, post_id__isnull=False
+    ).values_list("group_id", "post_id", "give_callback_value")
+    return list(rows)
+
+
+async def _load_giveaway_routes(callback_value: str):
+    """[(group_id, post_id, callback_value)] of one giveaway"""
+    from database import TelegramChannel
+
+    rows = await TelegramChannel.filter(
+        give_callback_value=callback_value, group_id__isnull=False, post_id__isnull=False
+    ).values_list("group_id", "post_id", "give_callback_value")
+    return list(rows)
+
+
+async def _resolve_post(group_id: int, post_id: int):
+    """callback_value of a running giveaway published as this post, or None"""
+    from database import GiveAway, TelegramChannel
+
+    callback_values = await TelegramChannel.filter(
+        group_id=group_id, post_id=post_id
+    ).values_list("give_callback_value", flat=True)
+    if not callback_values:
+        return None
+    return await GiveAway.filter(
+        callback_value__in=list(callback_values), run_status=True
+    ).first().values_list("callback_value", flat=True)
+
+
+class GiveawayRoutingIndex:
+    """(group_id, post_id) -> callback_value with a negative cache"""
+
+    def __init__(
+        self,
+        load_routes=_load_routes,
+        load_giveaway_routes=_load_giveaway_routes,
+        resolve_post=_resolve_post,
+        negative_ttl: float = None,
+        max_negative: int = 10000,
+    ):
+        self._load_routes = load_routes
+        self._load_giveaway_routes = load_giveaway_routes
+        self._resolve_post = resolve_post
+        self.negative_ttl = (
+            runtime_config.ROUTING_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        )
+        self.max_negative = max_negative
+
+        self._routes = {}
+        # callback_value -> set of its (group_id, post_id) keys
+        self._by_giveaway = {}
+        # group_id -> number of routes in the group
+        self._groups = {}
+        # (group_id, post_id) -> expiry; oldest first
+        self._negative = OrderedDict()
+        self.loaded = False
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.db_lookups = 0
+
+    def _add(self, group_id, post_id, callback_value):
+        key = (int(group_id), int(post_id))
+        old = self._routes.get(key)
+        if old == callback_value:
+            return
+        if old is not None:
+            self._discard(key)
+        self._routes[key] = callback_value
+        self._by_giveaway.setdefault(callback_value, set()).add(key)
+        self._groups[key[0]] = self._groups.get(key[0], 0) + 1
+        self._negative.pop(key, None)
+
+    def _discard(self, key):
+        callback_value = self._routes.pop(key, None)
+        if callback_value is None:
+            return
+        keys = self._by_giveaway.get(callback_value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_giveaway[callback_value]
+        remaining = self._groups[key[0]] - 1
+        if remaining:
+            self._groups[key[0]] = remaining
+        else:
+            del self._groups[key[0]]
+
+    async def load(self):
+        """Replace the index with the routes of all running giveaways"""
+        started = time.monotonic()
+        routes = await self._load_routes()
+        self._routes.clear()
+        self._by_giveaway.clear()
+        self._groups.clear()
+        self._negative.clear()
+        for group_id, post_id, callback_value in routes:
+            self._add(group_id, post_id, callback_value)
+        self.loaded = True
+        logger.info(
+            f"Giveaway routing index loaded: {len(self._routes)} posts of "
+            f"{len(self._by_giveaway)} giveaways in {(time.monotonic() - started) * 1000:.1f}ms"
+        )
+
+    async def giveaway_started(self, callback_value: str):
+        """Add the posts of a giveaway that just started"""
+        for group_id, post_id, value in await self._load_giveaway_routes(callback_value):
+            self._add(group_id, post_id, value)
+
+    def giveaway_finished(self, callback_value: str):
+        """Drop the posts of a finished or deleted giveaway"""
+        for key in list(self._by_giveaway.get(callback_value, ())):
+            self._discard(key)
+
+    giveaway_deleted = giveaway_finished
+
+    def has_group(self, group_id: int) -> bool:
+        """Whether any running giveaway is published in this discussion group"""
+        return group_id in self._groups
+
+    def get(self, group_id: int, post_id: int):
+        """callback_value for the post if it is known, without any I/O"""
+        return self._routes.get((group_id, post_id))
+
+    def _is_known_unknown(self, key) -> bool:
+        expires = self._negative.get(key)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del self._negative[key]
+            return False
+        return True
+
+    def _remember_unknown(self, key):
+        self._negative[key] = time.monotonic() + self.negative_ttl
+        self._negative.move_to_end(key)
+        while len(self._negative) > self.max_negative:
+            self._negative.popitem(last=False)
+
+    async def lookup(self, group_id: int, post_id: int):
+        """callback_value of the giveaway the post belongs to, or None"""
+        key = (group_id, post_id)
+        callback_value = self._routes.get(key)
+        if callback_value is not None:
+            self.hits += 1
+            return callback_value
+        if self._is_known_unknown(key):
+            self.negative_hits += 1
+            return None
+
+        self.db_lookups += 1
+        callback_value = await self._resolve_post(group_id, post_id)
+        if callback_value is None:
+            self._remember_unknown(key)
+        else:
+            # Started elsewhere (another instance, a script): take it in
+            await self.giveaway_started(callback_value)
+        return callback_value
+
+    def stats(self) -> dict:
+        return {
+            "posts": len(self._routes),
+            "giveaways": len(self._by_giveaway),
+            "groups": len(self._groups),
+            "negative": len(self._negative),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "db_lookups": self.db_lookups,
+        }
+
+
+routing_index = GiveawayRoutingIndex()
+register_warmup(routing_index.load)
+register_giveaway_listener(
+    started=routing_index.giveaway_started, finished=routing_index.giveaway_finished
+)
@@ -0,0 +1,89 @@
+"""
+Fast-reject filter for discussion group messages.
+
+Registered as a custom filter of the comment handler:
+
+    dp.register_message_handler(handle_new_users_in_groups, comment_prefilter)
+
+Most group traffic is chatter that does not reply to a giveaway post, plus
+stickers, service messages and posts made on behalf of the group or channel.
+Those are rejected in memory, in the order of their cost (message fields,
+then the routing index, then the keyword automaton), before the handler is
+entered. Candidates reach the handler with giveaway_callback_value set.
+Rejects are counted per reason.
+"""
+
+import logging
+
+from aiogram import types
+from aiogram.dispatcher.filters import Filter
+from giveaway_keywords import giveaway_keywords
+from giveaway_routing import routing_index
+
+logger = logging.getLogger(__name__)
+
+# "GroupAnonymousBot": messages of anonymous group admins
+ANONYMOUS_ADMIN_ID = 1087968824
+# "Telegram": automatic forwards of channel posts into the discussion group
+TELEGRAM_SERVICE_ID = 777000
+
+GROUP_CHAT_TYPES = {types.ChatType.GROUP, types.ChatType.SUPER_GROUP}
+SERVICE_CONTENT_TYPES = {
+    types.ContentType.NEW_CHAT_MEMBERS,
+    types.ContentType.LEFT_CHAT_MEMBER,
+    types.ContentType.NEW_CHAT_TITLE,
+    types.ContentType.NEW_CHAT_PHOTO,
+    types.ContentType.DELETE_CHAT_PHOTO,
+    types.ContentType.GROUP_CHAT_CREATED,
+    types.ContentType.PINNED_MESSAGE,
+    types.ContentType.MIGRATE_FROM_CHAT_ID,
+    types.ContentType.MIGRATE_TO_CHAT_ID,
+}
+
+
+class GroupCommentPrefilter(Filter):
+    """aiogram filter: True-ish only for comments that may join a giveaway"""
+
+    def __init__(self, routing=routing_index, keywords=giveaway_keywords):
+        self.routing = routing
+        self.keywords = keywords
+        self.passed = 0
+        self.rejected = {}
+
+    def _reject(self, reason: str) -> bool:
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        return False
+
+    async def check(self, message: types.Message):
+        if message.chat.type not in GROUP_CHAT_TYPES:
+            return self._reject("not_group")
+        content_type = message.content_type
+        if content_type != types.ContentType.TEXT:
+            return self._reject("service" if content_type in SERVICE_CONTENT_TYPES else "not_text")
+        user = message.from_user
+        # sender_chat is newer than our aiogram, so it is only in the raw values
+        if user is None or user.id == ANONYMOUS_ADMIN_ID or message.values.get("sender_chat"):
+            return self._reject("anonymous")
+        if user.id == TELEGRAM_SERVICE_ID or user.is_bot:
+            return self._reject("service")
+        reply = message.reply_to_message
+        if reply is None:
+            return self._reject("no_reply")
+        post_id = reply.forward_from_message_id
+        if post_id is None:
+            return self._reject("not_post_reply")
+
+        callback_value = await self.routing.lookup(message.chat.id, post_id)
+        if callback_value is None:
+            return self._reject("no_giveaway")
+        if not await self.keywords.matches(message.text, callback_value):
+            return self._reject("no_keyword")
+
+        self.passed += 1
+        return {"giveaway_callback_value": callback_value}
+
+    def stats(self) -> dict:
+        return {"passed": self.passed, "rejected": sum(self.rejected.values()), **self.rejected}
+
+
+comment_prefilter = GroupCommentPrefilter()
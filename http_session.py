@@ -0,0 +1,168 @@
+"""
+Shared, tuned HTTP connection pool for Bot API clients.
+
+Every PooledBot in the process (the bot itself and the diagnostic scripts)
+opens its aiohttp session on one TCPConnector with keep-alive, connection
+limits and a DNS cache. Idle connections are recycled before Telegram drops
+them, which is what produced the ServerDisconnectedError/ClientOSError
+storms, and idempotent calls (get*, webhook setup) are retried once or twice
+on network errors. Request latency and connection reuse are counted through
+an aiohttp TraceConfig.
+"""
+
+import asyncio
+import logging
+import ssl
+import time
+
+import aiohttp
+import certifi
+import runtime_config
+from aiogram import Bot
+from aiogram.utils import json
+from aiogram.utils.exceptions import NetworkError
+
+logger = logging.getLogger(__name__)
+
+# Safe to send twice: reads and calls that set absolute state
+IDEMPOTENT_METHODS = {"setWebhook", "deleteWebhook", "setMyCommands", "getUpdates"}
+
+
+def is_idempotent(method: str) -> bool:
+    return method.startswith("get") or method in IDEMPOTENT_METHODS
+
+
+class HttpMetrics:
+    """Latency and connection counters collected by an aiohttp TraceConfig"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_request_end.append(self._on_request_end)
+        trace.on_request_exception.append(self._on_request_exception)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace
+
+    async def _on_request_start(self, session, context, params):
+        context.started = time.perf_counter()
+
+    async def _on_request_end(self, session, context, params):
+        latency = time.perf_counter() - context.started
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    async def _on_request_exception(self, session, context, params):
+        self.errors += 1
+
+    async def _on_connection_create_end(self, session, context, params):
+        self.new_connections += 1
+
+    async def _on_connection_reuseconn(self, session, context, params):
+        self.reused_connections += 1
+
+    async def _on_dns_cache_hit(self, session, context, params):
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, session, context, params):
+        self.dns_cache_misses += 1
+
+    def stats(self) -> dict:
+        requests = self.requests or 1
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_latency_ms": round(self.total_latency / requests * 1000, 2),
+            "max_latency_ms": round(self.max_latency * 1000, 2),
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "dns_cache_hits": self.dns_cache_hits,
+            "dns_cache_misses": self.dns_cache_misses,
+        }
+
+
+metrics = HttpMetrics()
+
+_connector = None
+_users = set()
+
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """The process-wide connector, created on first use"""
+    global _connector
+    if _connector is None or _connector.closed:
+        _connector = aiohttp.TCPConnector(
+            limit=runtime_config.HTTP_POOL_LIMIT,
+            limit_per_host=runtime_config.HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=runtime_config.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=runtime_config.HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            enable_cleanup_closed=True,
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+        )
+    return _connector
+
+
+async def close_shared_connector():
+    global _connector
+    if _connector is not None and not _connector.closed:
+        await _connector.close()
+        logger.info(f"HTTP pool closed: {metrics.stats()}")
+    _connector = None
+
+
+class PooledBot(Bot):
+    """Bot on the shared connection pool, retrying idempotent calls"""
+
+    def __init__(self, *args, retries: int = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retries = runtime_config.HTTP_RETRIES if retries is None else retries
+
+    def get_new_session(self) -> aiohttp.ClientSession:
+        if self.proxy:
+            # Proxied bots need their own connector (SOCKS, auth)
+            return super().get_new_session()
+        _users.add(id(self))
+        return aiohttp.ClientSession(
+            connector=get_shared_connector(),
+            connector_owner=False,
+            timeout=aiohttp.ClientTimeout(
+                total=runtime_config.HTTP_REQUEST_TIMEOUT,
+                connect=runtime_config.HTTP_CONNECT_TIMEOUT,
+            ),
+            json_serialize=json.dumps,
+            trace_configs=[metrics.trace_config()],
+        )
+
+    async def request(self, method, data=None, files=None, **kwargs):
+        retries = self.retries if is_idempotent(method) and not files else 0
+        for attempt in range(retries + 1):
+            try:
+                return await super().request(method, data, files, **kwargs)
+            except NetworkError as e:
+                if attempt >= retries:
+                    raise
+                metrics.retries += 1
+                logger.warning(f"{method} failed ({e}), retrying")
+                await asyncio.sleep(0.2 * 2 ** attempt)
+
+    async def close(self):
+        await super().close()
+        _users.discard(id(self))
+        if not _users:
+            await close_shared_connector()
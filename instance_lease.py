@@ -0,0 +1,147 @@
+"""
+Single-instance lease with hot-standby failover.
+
+Only the holder of the lease talks to getUpdates, which ends the
+TerminatedByOtherGetUpdates fights between duplicate instances. The lease is
+a row in the state database renewed by a heartbeat. A second instance waits
+as a warm standby (database initialised, caches preloaded) and takes over as
+soon as the lease is released or expires.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+
+import runtime_config
+from state_store import StateStore, state_store
+
+logger = logging.getLogger(__name__)
+
+
+class InstanceLease:
+    """Lease row with heartbeat renewal"""
+
+    def __init__(
+        self,
+        store: StateStore = None,
+        name: str = "bot",
+        ttl: float = None,
+        heartbeat: float = None,
+        poll_interval: float = 1.0,
+    ):
+        self.store = store or state_store
+        self.name = name
+        self.ttl = ttl if ttl is not None else runtime_config.LEASE_TTL
+        self.heartbeat = heartbeat if heartbeat is not None else runtime_config.LEASE_HEARTBEAT
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.held = False
+        self._table_ready = False
+        self._last_renewed = 0.0
+
+    def _ensure_table(self):
+        if self._table_ready:
+            return
+        self.store.execute(
+            "CREATE TABLE IF NOT EXISTS instance_lease ("
+            "name TEXT PRIMARY KEY, owner TEXT NOT NULL, "
+            "acquired_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._table_ready = True
+
+    def holder(self):
+        """Return (owner, expires_at) of the current lease or None"""
+        self._ensure_table()
+        rows = self.store.execute(
+            "SELECT owner, expires_at FROM instance_lease WHERE name = ?", (self.name,)
+        )
+        return rows[0] if rows else None
+
+    def try_acquire(self) -> bool:
+        self._ensure_table()
+        now = time.time()
+
+        def acquire(connection):
+            row = connection.execute(
+                "SELECT owner, expires_at FROM instance_lease WHERE name = ?", (self.name,)
+            ).fetchone()
+            if row and row[0] != self.owner and row[1] > now:
+                return False
+            connection.execute(
+                "INSERT INTO instance_lease (name, owner, acquired_at, expires_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(name) DO UPDATE SET "
+                "owner = excluded.owner, acquired_at = excluded.acquired_at, "
+                "expires_at = excluded.expires_at",
+                (self.name, self.owner, now, now + self.ttl),
+            )
+            return True
+
+        self.held = self.store.transaction(acquire)
+        if self.held:
+            self._last_renewed = time.monotonic()
+        return self.held
+
+    def renew(self) -> bool:
+        self._ensure_table()
+
+        def renew(connection):
+            cursor = connection.execute(
+                "UPDATE instance_lease SET expires_at = ? WHERE name = ? AND owner = ?",
+                (time.time() + self.ttl, self.name, self.owner),
+            )
+            return cursor.rowcount == 1
+
+        self.held = self.store.transaction(renew)
+        if self.held:
+            self._last_renewed = time.monotonic()
+        return self.held
+
+    def release(self):
+        if not self.held:
+            return
+        self.store.execute(
+            "DELETE FROM instance_lease WHERE name = ? AND owner = ?", (self.name, self.owner)
+        )
+        self.held = False
+        logger.info("Instance lease released")
+
+    async def acquire(self, on_standby=None):
+        """Wait until the lease is ours; on_standby runs once while waiting"""
+        standby_started = None
+        while not await asyncio.to_thread(self.try_acquire):
+            if standby_started is None:
+                standby_started = time.monotonic()
+                holder = await asyncio.to_thread(self.holder)
+                logger.warning(
+                    f"Another instance holds the lease ({holder[0] if holder else '?'}), "
+                    "waiting as hot standby"
+                )
+                if on_standby:
+                    await on_standby()
+            await asyncio.sleep(self.poll_interval)
+
+        if standby_started is not None:
+            waited = time.monotonic() - standby_started
+            logger.info(f"Took over instance lease after {waited:.1f}s in standby")
+        else:
+            logger.info(f"Instance lease acquired by {self.owner}")
+
+    async def keep_alive(self, on_lost):
+        """Renew the lease every heartbeat; call on_lost if it is taken away"""
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            try:
+                renewed = await asyncio.to_thread(self.renew)
+            except Exception as e:
+                # Keep trying until the lease would have expired anyway
+                logger.error(f"Failed to renew instance lease: {e}")
+                if time.monotonic() - self._last_renewed < self.ttl:
+                    continue
+                renewed = False
+            if not renewed:
+                logger.error("Instance lease lost to another instance")
+                on_lost()
+                return
@@ -0,0 +1,96 @@
+"""
+Cached participation keyword matcher.
+
+The comment handler used to read BotSettings.participation_keyword and
+compile a regex for every message. The compiled matcher now lives in process
+memory, stamped with a settings version. Changing the keyword through
+set_participation_keyword() below (the admin bot settings flow) bumps the
+version, so the next message sees the new keyword without a restart and
+every other message costs one regex search.
+"""
+
+import logging
+import re
+
+from lifecycle import register_warmup
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_keyword() -> str:
+    from database import BotSettings
+
+    return await BotSettings.get_participation_keyword()
+
+
+async def _save_keyword(keyword: str) -> bool:
+    from database import BotSettings
+
+    return await BotSettings.set_participation_keyword(keyword)
+
+
+class KeywordMatcher:
+    """Compiled, case-insensitive keyword search (same rules as before)"""
+
+    def __init__(self, keyword: str, version: int):
+        self.keyword = keyword
+        self.version = version
+        self.pattern = re.compile(re.escape(keyword), re.IGNORECASE) if keyword else None
+
+    def matches(self, text: str) -> bool:
+        return bool(self.pattern and text and self.pattern.search(text))
+
+
+class KeywordMatcherCache:
+    """Holds the matcher for the current settings version"""
+
+    def __init__(self, load_keyword=_load_keyword, save_keyword=_save_keyword):
+        self._load_keyword = load_keyword
+        self._save_keyword = save_keyword
+        self.version = 0
+        self._matcher = None
+        self.loads = 0
+
+    def bump_version(self):
+        """Invalidate the cached matcher (the keyword changed)"""
+        self.version += 1
+
+    async def get_matcher(self) -> KeywordMatcher:
+        matcher = self._matcher
+        if matcher is not None and matcher.version == self.version:
+            return matcher
+        version = self.version
+        keyword = await self._load_keyword()
+        self.loads += 1
+        matcher = KeywordMatcher(keyword, version)
+        # Do not cache a keyword that was changed while we were loading it
+        if version == self.version:
+            self._matcher = matcher
+            logger.info(f"Participation keyword loaded: '{keyword}' (version {version})")
+        return matcher
+
+    async def get_keyword(self) -> str:
+        return (await self.get_matcher()).keyword
+
+    async def matches(self, text: str) -> bool:
+        return (await self.get_matcher()).matches(text)
+
+    async def set_keyword(self, keyword: str) -> bool:
+        """Store a new keyword and make it effective right away"""
+        saved = await self._save_keyword(keyword)
+        self.bump_version()
+        if saved:
+            self._matcher = KeywordMatcher(keyword, self.version)
+        return saved
+
+    async def warm_up(self):
+        await self.get_matcher()
+
+
+keyword_cache = KeywordMatcherCache()
+register_warmup(keyword_cache.warm_up)
+
+get_participation_matcher = keyword_cache.get_matcher
+get_participation_keyword = keyword_cache.get_keyword
+set_participation_keyword = keyword_cache.set_keyword
+bump_keyword_version = keyword_cache.bump_version
@@ -0,0 +1,175 @@
+"""
+Process lifecycle helpers shared by the ingestion modes.
+"""
+
+import asyncio
+import logging
+import signal
+import time
+
+logger = logging.getLogger(__name__)
+
+# Shutdown drain stages, run in this order: handlers produce sends and
+# writes, sends may produce writes
+DRAIN_HANDLERS = 0
+DRAIN_SENDS = 1
+DRAIN_WRITES = 2
+
+_stop_event = None
+_warmups = []
+_drains = []
+_tracked_tasks = set()
+_drained = False
+
+
+def get_stop_event() -> asyncio.Event:
+    """Process-wide event that ends the running ingestion mode"""
+    global _stop_event
+    if _stop_event is None:
+        _stop_event = asyncio.Event()
+    return _stop_event
+
+
+def request_stop(reason: str):
+    """Ask the running ingestion mode to shut down"""
+    logger.warning(f"Stop requested: {reason}")
+    get_stop_event().set()
+
+
+def register_warmup(func, requires_lease: bool = False):
+    """
+    Register a coroutine function that preloads a cache at startup.
+
+    requires_lease marks warm-ups that write (journal replay, cleanups of
+    shared files and tables): a hot standby must not run them while the
+    active instance is still using the same files.
+    """
+    _warmups.append((func, requires_lease))
+    return func
+
+
+async def run_warmups(requires_lease: bool = None):
+    """
+    Run registered warm-ups concurrently; failures are only logged.
+
+    requires_lease=None runs all of them, False only those a standby may
+    run, True only those that wait for the instance lease.
+    """
+    funcs = [
+        func
+        for func, needs_lease in _warmups
+        if requires_lease is None or needs_lease == requires_lease
+    ]
+    results = await asyncio.gather(*(func() for func in funcs), return_exceptions=True)
+    for func, result in zip(funcs, results):
+        if isinstance(result, Exception):
+            logger.error(f"Warm-up {func.__name__} failed: {result}")
+
+
+def spawn(coro, name: str = None) -> asyncio.Task:
+    """create_task() whose completion is awaited by the shutdown drain"""
+    task = asyncio.get_running_loop().create_task(coro, name=name)
+    _tracked_tasks.add(task)
+    task.add_done_callback(_tracked_tasks.discard)
+    return task
+
+
+def register_drain(name: str, func, stage: int = DRAIN_HANDLERS):
+    """Register func(timeout) -> {"completed": n, "abandoned": m} for shutdown"""
+    _drains.append((stage, name, func))
+
+
+async def _drain_tracked_tasks(timeout: float) -> dict:
+    tasks = set(_tracked_tasks)
+    if not tasks:
+        return {"completed": 0, "abandoned": 0}
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    return {"completed": len(done), "abandoned": len(pending)}
+
+
+async def drain_shutdown(timeout: float) -> dict:
+    """
+    Finish in-flight work within timeout seconds, stage by stage.
+
+    Intake must already be stopped. Returns {name: {"completed", "abandoned"}}
+    and logs the same report. Runs only once per process.
+    """
+    global _drained
+    if _drained:
+        return {}
+    _drained = True
+
+    started_all = time.monotonic()
+    deadline = started_all + timeout
+    drains = [(DRAIN_HANDLERS, "background tasks", _drain_tracked_tasks)] + _drains
+    report = {}
+
+    async def run(name, func, budget):
+        started = time.monotonic()
+        try:
+            result = await func(budget)
+        except Exception as e:
+            logger.error(f"Shutdown drain of {name} failed: {e}")
+            result = {"completed": 0, "abandoned": None, "error": str(e)}
+        result["seconds"] = round(time.monotonic() - started, 3)
+        report[name] = result
+
+    for stage in sorted({stage for stage, _, _ in drains}):
+        budget = max(0.0, deadline - time.monotonic())
+        if stage == DRAIN_WRITES:
+            # Buffered writes always get a chance to reach the database
+            budget = max(budget, 1.0)
+        # Everything within a stage drains concurrently under the same budget
+        await asyncio.gather(
+            *(run(name, func, budget) for drain_stage, name, func in drains if drain_stage == stage)
+        )
+
+    summary = ", ".join(
+        f"{name}: completed={result['completed']} abandoned={result['abandoned']}"
+        for name, result in report.items()
+    )
+    elapsed = time.monotonic() - started_all
+    logger.info(f"Shutdown drain finished in {elapsed:.2f}s: {summary}")
+    return report
+
+
+def install_stop_signals(stop_event: asyncio.Event):
+    """Set stop_event on SIGINT/SIGTERM"""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on Windows event loops: Ctrl+C arrives there as
+            # a KeyboardInterrupt out of the loop, see run_until_stopped()
+            pass
+
+
+def run_until_stopped(loop: asyncio.AbstractEventLoop, coro):
+    """
+    Run an ingestion mode's coroutine to the end of its shutdown.
+
+    Where install_stop_signals() cannot hook SIGINT (Windows), Ctrl+C raises
+    KeyboardInterrupt out of run_until_complete() and would leave the
+    coroutine suspended, its shutdown never run. The coroutine runs as a
+    task instead: the first interrupt sets the stop event and the loop goes
+    on until the task has drained; a second one cancels the task.
+    """
+    task = loop.create_task(coro)
+    interrupts = 0
+    while True:
+        try:
+            return loop.run_until_complete(task)
+        except KeyboardInterrupt:
+            if task.done():
+                raise
+            interrupts += 1
+            if interrupts == 1:
+                logger.warning("Interrupted, shutting down (press Ctrl+C again to abort the drain)")
+                get_stop_event().set()
+            else:
+                logger.warning("Interrupted again, abandoning the shutdown drain")
+                task.cancel()
@@ -0,0 +1,270 @@
+"""
+Non-blocking logging for the bot process.
+
+Handlers only put records on a bounded queue; a QueueListener thread does the
+formatting and disk writes, so a comment on the participation path no longer
+waits on bot.log. The file rotates by size and age, can be written as JSON
+lines, and chatty loggers can be sampled (WARNING and above always pass).
+When the queue is full records are dropped and counted instead of blocking.
+
+With the instance lease a hot standby runs next to the active bot, and two
+processes rotating one file rename it under each other (on Windows the rename
+fails outright). So by default each process writes its own file with its PID
+in the name (bot.4242.log); files of instances gone for longer than the
+rotation would have kept them are removed at startup.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import time
+
+import runtime_config
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Attributes every LogRecord has; anything else came in through extra=
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener = None
+_queue_handler = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with extra= fields merged in"""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotates when the file reaches max_bytes or is older than max_age seconds"""
+
+    def __init__(self, filename, max_bytes=0, max_age=0, backup_count=5):
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        self.max_age = max_age
+        self.opened_at = time.time()
+
+    def shouldRollover(self, record):
+        if self.max_age and time.time() - self.opened_at >= self.max_age:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.opened_at = time.time()
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of INFO/DEBUG records from the configured loggers"""
+
+    def __init__(self, rates: dict):
+        super().__init__()
+        # Longest prefix first so "a.b" wins over "a"
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._counters = {}
+        self.sampled_out = 0
+
+    def _rate(self, name):
+        for prefix, rate in self.rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return prefix, rate
+        return None, 1.0
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        prefix, rate = self._rate(record.name)
+        if rate >= 1.0:
+            return True
+        if rate <= 0:
+            self.sampled_out += 1
+            return False
+        # Deterministic 1-in-N keeps the output evenly spread
+        every = max(1, round(1 / rate))
+        count = self._counters.get(prefix, 0)
+        self._counters[prefix] = count + 1
+        if count % every == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks the caller: a full queue drops the record"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Merge args now (they may change later) but leave formatting and the
+        # traceback layout to the writer thread's formatters
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def instance_log_path(path: str, pid: int = None) -> str:
+    """bot.log -> bot.<pid>.log"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{os.getpid() if pid is None else pid}{ext}"
+
+
+def prune_instance_logs(path: str, max_age: float, pid: int = None) -> int:
+    """
+    Remove per-instance files of path (and their backups) of other processes
+    not written for max_age seconds; returns how many were removed
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    root, ext = os.path.splitext(name)
+    pattern = re.compile(rf"{re.escape(root)}\.(\d+){re.escape(ext)}(\.\d+)?$")
+    own = os.getpid() if pid is None else pid
+    cutoff = time.time() - max_age
+    removed = 0
+    for entry in os.scandir(directory):
+        match = pattern.match(entry.name)
+        if not match or int(match.group(1)) == own:
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def parse_sampling(value: str) -> dict:
+    """Parse "logger=0.1,other.logger=0.5" into {name: share kept}"""
+    rates = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        if not name.strip() or not rate.strip():
+            continue
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+def stats() -> dict:
+    if not _queue_handler:
+        return {}
+    sampler = next(
+        (f for f in _queue_handler.filters if isinstance(f, SamplingFilter)), None
+    )
+    return {
+        "queued": _queue_handler.queue.qsize(),
+        "dropped": _queue_handler.dropped,
+        "sampled_out": sampler.sampled_out if sampler else 0,
+    }
+
+
+def stop_logging():
+    """Flush the queue and stop the writer thread"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    dropped = _queue_handler.dropped
+    _listener.stop()
+    _listener = None
+    logging.getLogger().removeHandler(_queue_handler)
+    _queue_handler = None
+    if dropped:
+        print(f"Logging dropped {dropped} records (queue full)", file=sys.stderr)
+
+
+def setup_logging(
+    level=None,
+    path=None,
+    max_bytes=None,
+    max_age=None,
+    backup_count=None,
+    json_lines=None,
+    sampling=None,
+    queue_size=None,
+    console=True,
+    per_instance=None,
+):
+    """Route the root logger through a queue to the console and a rotating file"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    level = level or runtime_config.LOG_LEVEL
+    path = runtime_config.LOG_FILE if path is None else path
+    max_bytes = runtime_config.LOG_MAX_BYTES if max_bytes is None else max_bytes
+    max_age = runtime_config.LOG_MAX_AGE if max_age is None else max_age
+    backup_count = runtime_config.LOG_BACKUP_COUNT if backup_count is None else backup_count
+    json_lines = runtime_config.LOG_JSON if json_lines is None else json_lines
+    if sampling is None:
+        sampling = parse_sampling(runtime_config.LOG_SAMPLING)
+    queue_size = runtime_config.LOG_QUEUE_SIZE if queue_size is None else queue_size
+    if per_instance is None:
+        per_instance = runtime_config.LOG_PER_INSTANCE
+
+    handlers = []
+    if path and per_instance:
+        if max_age:
+            # What this instance's own rotation would have kept
+            prune_instance_logs(path, max_age * (backup_count + 1))
+        path = instance_log_path(path)
+    if path:
+        file_handler = SizeAndTimeRotatingFileHandler(
+            path, max_bytes=max_bytes, max_age=max_age, backup_count=backup_count
+        )
+        file_handler.setFormatter(JsonFormatter() if json_lines else logging.Formatter(TEXT_FORMAT))
+        handlers.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handlers.append(console_handler)
+
+    _queue_handler = DroppingQueueHandler(queue.Queue(queue_size))
+    if sampling:
+        _queue_handler.addFilter(SamplingFilter(sampling))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(
+        _queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
@@ -0,0 +1,456 @@
+"""
+Member snapshots of big sponsor channels, fetched over MTProto.
+
+For a channel with hundreds of thousands of subscribers, most participants
+are long-time members, yet each of them costs a getChatMember call. When an
+MTProto user session is configured (MEMBER_SNAPSHOT_SESSION, an admin of the
+channels; MTPROTO_API_ID/MTPROTO_API_HASH), a background job pages through
+the members of every sponsor channel of a running giveaway with Pyrogram and
+keeps them as a sorted array('q') of user ids per channel:
+
+    member_snapshots/<channel_id>.<generation>.members   raw int64 ids, sorted
+    member_snapshots/<channel_id>.json      {"members", "fetched_at", "synced_at",
+                                             "last_event_id", "generation"}
+
+The .members file is memory-mapped read-only, so a lookup is a binary search
+over the page cache and a restart reuses the snapshots already on disk. A
+refresh writes the next generation to a new file and deletes the old one
+only once its mapping is closed: Windows does not let a mapped file be
+replaced or removed.
+
+One member listing stops at 10000 users, so bigger channels are also swept
+with name searches. After the first full fetch, refreshes read only the
+joins and leaves from the channel's admin log since last_event_id; when the
+log no longer reaches that far back (it keeps 48 hours), or the snapshot is
+older than FULL_REFRESH_AGE, the channel is fetched in full again.
+
+A snapshot only vouches for users in it: someone missing may have joined
+since, so subscription_cache falls back to getChatMember for them. Fresher
+answers (chat_member updates, recently cached statuses) are consulted first.
+A snapshot that has not been synced (full or incremental) for
+STALE_AFTER_REFRESHES refresh intervals, e.g. because the session stopped
+working or the bot was down, vouches for nobody until it is synced again.
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import mmap
+import os
+import time
+from array import array
+
+import runtime_config
+from lifecycle import DRAIN_HANDLERS, register_drain, register_warmup
+from subscription_cache import subscription_cache
+
+logger = logging.getLogger(__name__)
+
+# One listing (members or a name search) of a channel stops here
+LISTING_LIMIT = 10000
+SEARCH_QUERIES = tuple("abcdefghijklmnopqrstuvwxyz0123456789абвгдеёжзийклмнопрстуфхцчшщэюя")
+# Refetch everything once a day even if the admin log would cover the gap
+FULL_REFRESH_AGE = 24 * 3600
+# Snapshots not synced for this many refresh intervals are not trusted
+STALE_AFTER_REFRESHES = 3
+
+MEMBERS_SUFFIX = ".members"
+
+
+async def _load_channels() -> list:
+    """Sponsor channel ids of every running giveaway"""
+    from database import GiveAway, TelegramChannel
+
+    running = await GiveAway.filter(run_status=True).values_list("callback_value", flat=True)
+    rows = await TelegramChannel.filter(give_callback_value__in=list(running)).values_list(
+        "channel_id", flat=True
+    )
+    return sorted(set(rows))
+
+
+def _make_client():
+    from pyrogram import Client
+
+    return Client(
+        "member_snapshots",
+        api_id=runtime_config.MTPROTO_API_ID,
+        api_hash=runtime_config.MTPROTO_API_HASH,
+        session_string=runtime_config.MEMBER_SNAPSHOT_SESSION,
+        in_memory=True,
+        no_updates=True,
+    )
+
+
+def _member_events_filter():
+    from pyrogram.types import ChatEventFilter
+
+    return ChatEventFilter(new_members=True, leaving_members=True, new_restrictions=True)
+
+
+async def fetch_member_ids(client, channel_id) -> array:
+    """Every member of a channel as a sorted array('q')"""
+    ids = set()
+    async for member in client.get_chat_members(channel_id):
+        ids.add(member.user.id)
+    if len(ids) >= LISTING_LIMIT:
+        # The listing was cut off: name searches reach the rest
+        for query in SEARCH_QUERIES:
+            async for member in client.get_chat_members(channel_id, query=query):
+                ids.add(member.user.id)
+    return array("q", sorted(ids))
+
+
+async def fetch_last_event_id(client, channel_id) -> int:
+    async for event in client.get_chat_event_log(channel_id, filters=_member_events_filter()):
+        return event.id
+    return 0
+
+
+def _event_change(event):
+    """(user_id, joined) for a membership event, None for other events"""
+    from pyrogram.enums import ChatEventAction, ChatMemberStatus
+
+    if event.action == ChatEventAction.MEMBER_JOINED:
+        return event.user.id, True
+    if event.action == ChatEventAction.MEMBER_INVITED:
+        return event.invited_member.user.id, True
+    if event.action == ChatEventAction.MEMBER_LEFT:
+        return event.user.id, False
+    if event.action == ChatEventAction.MEMBER_PERMISSIONS_CHANGED:
+        member = event.new_member_permissions
+        if member is not None and member.status == ChatMemberStatus.BANNED:
+            return member.user.id, False
+    return None
+
+
+async def fetch_member_changes(client, channel_id, since_event_id: int):
+    """
+    Joins and leaves after since_event_id: (joined, left, last_event_id), or
+    None if the admin log no longer goes back that far.
+    """
+    joined, left = set(), set()
+    last_event_id = since_event_id
+    reached = False
+    # Newest first: the first event seen for a user is their current state
+    async for event in client.get_chat_event_log(channel_id, filters=_member_events_filter()):
+        if event.id <= since_event_id:
+            reached = True
+            break
+        last_event_id = max(last_event_id, event.id)
+        change = _event_change(event)
+        if change is None:
+            continue
+        user_id, is_member = change
+        if user_id in joined or user_id in left:
+            continue
+        (joined if is_member else left).add(user_id)
+    if since_event_id and not reached:
+        return None
+    return joined, left, last_event_id
+
+
+class Snapshot:
+    """Sorted member ids of one channel, memory-mapped read-only"""
+
+    def __init__(self, path: str, synced_at: float = 0.0):
+        self.path = path
+        # When the ids were last known to match the channel
+        self.synced_at = synced_at
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.ids = memoryview(self._map).cast("q")
+        else:
+            # mmap cannot map an empty file
+            self._map = None
+            self.ids = memoryview(array("q"))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, user_id) -> bool:
+        i = bisect.bisect_left(self.ids, user_id)
+        return i < len(self.ids) and self.ids[i] == user_id
+
+    def close(self):
+        self.ids.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+class MemberSnapshots:
+    """Per-channel member snapshots and the job that keeps them fresh"""
+
+    def __init__(
+        self,
+        directory: str,
+        make_client=_make_client,
+        load_channels=_load_channels,
+        refresh_interval: float = 600,
+        min_members: int = 1000,
+        enabled: bool = True,
+        max_age: float = None,
+    ):
+        self.directory = directory
+        self.enabled = enabled
+        self._make_client = make_client
+        self._load_channels = load_channels
+        self.refresh_interval = refresh_interval
+        self.min_members = min_members
+        self.max_age = refresh_interval * STALE_AFTER_REFRESHES if max_age is None else max_age
+
+        self._snapshots = {}
+        # channel_id -> generation of the mapped .members file
+        self._generations = {}
+        self._client = None
+        self._task = None
+
+        self.full_refreshes = 0
+        self.incremental_refreshes = 0
+        self.failed_refreshes = 0
+        self.lookups = 0
+        self.hits = 0
+        self.stale_lookups = 0
+
+    # --- files -----------------------------------------------------------
+
+    def _path(self, channel_id, suffix: str) -> str:
+        return os.path.join(self.directory, f"{channel_id}{suffix}")
+
+    def _members_path(self, channel_id, generation: int) -> str:
+        return self._path(channel_id, f".{generation}{MEMBERS_SUFFIX}")
+
+    def _channel_files(self, channel_id) -> list:
+        prefix = f"{channel_id}."
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.startswith(prefix)]
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Cannot remove old member snapshot {path}: {e}")
+
+    def _read_meta(self, channel_id):
+        try:
+            with open(self._path(channel_id, ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_file(self, path: str, write):
+        with open(path + ".tmp", "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+
+    def _write_meta(self, channel_id, meta: dict):
+        data = json.dumps(meta).encode()
+        self._write_file(self._path(channel_id, ".json"), lambda f: f.write(data))
+
+    def _write(self, channel_id, ids: array, meta: dict):
+        """Write the next generation to its own file, then point the meta at it"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._members_path(channel_id, meta["generation"])
+        self._write_file(path, lambda f: ids.tofile(f))
+        self._write_meta(channel_id, meta)
+
+    async def _replace(self, channel_id, ids: array, meta: dict):
+        meta = dict(meta, generation=self._generations.get(channel_id, 0) + 1)
+        await asyncio.to_thread(self._write, channel_id, ids, meta)
+        # Swapped on the event loop, between lookups; the old file is
+        # removed once nothing maps it any more
+        old = self._snapshots.get(channel_id)
+        path = self._members_path(channel_id, meta["generation"])
+        self._snapshots[channel_id] = Snapshot(path, meta["synced_at"])
+        self._generations[channel_id] = meta["generation"]
+        if old is not None:
+            old.close()
+            self._remove(old.path)
+
+    def _open_existing(self):
+        os.makedirs(self.directory, exist_ok=True)
+        channels = set()
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    channels.add(int(name[: -len(".json")]))
+                except ValueError:
+                    continue
+        for channel_id in channels - set(self._snapshots):
+            meta = self._read_meta(channel_id) or {}
+            generation = meta.get("generation")
+            path = None if generation is None else self._members_path(channel_id, generation)
+            for stray in self._channel_files(channel_id):
+                # Generations a crash left behind, snapshots from before generations
+                if stray.endswith(MEMBERS_SUFFIX) and stray != path:
+                    self._remove(stray)
+            if path is None or not os.path.exists(path):
+                continue
+            synced_at = meta.get("synced_at", meta.get("fetched_at", 0.0))
+            self._snapshots[channel_id] = Snapshot(path, synced_at)
+            self._generations[channel_id] = generation
+
+    async def load(self):
+        """Map the snapshots left by the previous run"""
+        await asyncio.to_thread(self._open_existing)
+        logger.info(
+            f"Member snapshots loaded: {len(self._snapshots)} channels, "
+            f"{sum(map(len, self._snapshots.values()))} members"
+        )
+
+    def drop(self, channel_id):
+        snapshot = self._snapshots.pop(channel_id, None)
+        if snapshot is not None:
+            snapshot.close()
+        self._generations.pop(channel_id, None)
+        for path in self._channel_files(channel_id):
+            self._remove(path)
+
+    # --- lookups ---------------------------------------------------------
+
+    def contains(self, channel_id, user_id) -> bool:
+        """Whether the user was a member when the snapshot was taken"""
+        snapshot = self._snapshots.get(channel_id)
+        if snapshot is None:
+            return False
+        self.lookups += 1
+        if time.time() - snapshot.synced_at > self.max_age:
+            self.stale_lookups += 1
+            return False
+        if user_id in snapshot:
+            self.hits += 1
+            return True
+        return False
+
+    # --- refresh ---------------------------------------------------------
+
+    async def _get_client(self):
+        if self._client is None:
+            client = self._make_client()
+            await client.start()
+            self._client = client
+        return self._client
+
+    async def refresh(self, channel_id):
+        """Bring one channel's snapshot up to date, incrementally if possible"""
+        client = await self._get_client()
+        if await client.get_chat_members_count(channel_id) < self.min_members:
+            # getChatMember is cheap enough for small channels
+            self.drop(channel_id)
+            return
+
+        meta = self._read_meta(channel_id)
+        snapshot = self._snapshots.get(channel_id)
+        if (
+            meta is not None
+            and snapshot is not None
+            and time.time() - meta["fetched_at"] < FULL_REFRESH_AGE
+        ):
+            changes = await fetch_member_changes(client, channel_id, meta["last_event_id"])
+            if changes is not None:
+                joined, left, last_event_id = changes
+                meta = dict(meta, synced_at=time.time())
+                if last_event_id != meta["last_event_id"]:
+                    ids = set(snapshot.ids)
+                    ids.difference_update(left)
+                    ids.update(joined)
+                    meta = dict(meta, members=len(ids), last_event_id=last_event_id)
+                    await self._replace(channel_id, array("q", sorted(ids)), meta)
+                else:
+                    await asyncio.to_thread(self._write_meta, channel_id, meta)
+                    snapshot.synced_at = meta["synced_at"]
+                self.incremental_refreshes += 1
+                return
+
+        started = time.monotonic()
+        # Taken before the listing: changes during it are applied next time
+        last_event_id = await fetch_last_event_id(client, channel_id)
+        ids = await fetch_member_ids(client, channel_id)
+        now = time.time()
+        meta = {
+            "members": len(ids),
+            "fetched_at": now,
+            "synced_at": now,
+            "last_event_id": last_event_id,
+        }
+        await self._replace(channel_id, ids, meta)
+        self.full_refreshes += 1
+        logger.info(
+            f"Member snapshot of {channel_id}: {len(ids)} members "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+
+    async def refresh_all(self):
+        channels = await self._load_channels()
+        for channel_id in channels:
+            try:
+                await self.refresh(channel_id)
+            except Exception as e:
+                self.failed_refreshes += 1
+                logger.error(f"Member snapshot refresh of {channel_id} failed: {e}")
+        for channel_id in set(self._snapshots) - set(channels):
+            # No running giveaway needs it any more
+            self.drop(channel_id)
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.refresh_all()
+            except Exception as e:
+                logger.error(f"Member snapshot refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self):
+        if self.enabled and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def drain(self, timeout: float) -> dict:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._client is not None:
+            try:
+                await asyncio.wait_for(self._client.stop(), timeout)
+            except Exception as e:
+                logger.warning(f"MTProto client did not stop cleanly: {e}")
+            self._client = None
+        for snapshot in self._snapshots.values():
+            snapshot.close()
+        self._snapshots.clear()
+        self._generations.clear()
+        return {"completed": 0, "abandoned": 0}
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._snapshots),
+            "members": sum(map(len, self._snapshots.values())),
+            "full_refreshes": self.full_refreshes,
+            "incremental_refreshes": self.incremental_refreshes,
+            "failed_refreshes": self.failed_refreshes,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "stale_lookups": self.stale_lookups,
+        }
+
+
+member_snapshots = MemberSnapshots(
+    runtime_config.MEMBER_SNAPSHOT_DIR,
+    refresh_interval=runtime_config.MEMBER_SNAPSHOT_REFRESH,
+    min_members=runtime_config.MEMBER_SNAPSHOT_MIN_MEMBERS,
+    enabled=bool(runtime_config.MEMBER_SNAPSHOT_SESSION),
+)
+if member_snapshots.enabled:
+    subscription_cache.snapshots = member_snapshots
+    # Removes snapshot files the active instance may still map
+    register_warmup(member_snapshots.load, requires_lease=True)
+    register_drain("member snapshots", member_snapshots.drain, DRAIN_HANDLERS)
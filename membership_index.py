@@ -0,0 +1,298 @@
+"""
+Channel membership index fed by chat_member updates.
+
+In channels where the bot is an administrator, Telegram reports every join,
+leave and ban as a chat_member update, provided the update type is requested
+explicitly (ALLOWED_UPDATES, passed by polling, catch-up and the webhook
+setup). The latest status of every user seen that way is kept here and
+persisted in the state database, so a subscription check for them needs no
+getChatMember call; users who have not changed since the bot became admin
+are unknown and still go through the API (subscription_cache consults this
+index first). If the bot loses its admin rights in a channel, the channel's
+entries are dropped, since further changes would go unseen.
+
+The index is only as good as the stream of updates behind it, so an entry is
+trusted for MEMBERSHIP_TTL seconds after it was learned, and the whole index
+is cleared at startup when changes may have been missed: pending updates
+skipped (CATCH_UP_ON_START off), chat_member updates not requested
+(MEMBERSHIP_UPDATES off), or the bot down for longer than Telegram keeps
+pending updates (judged by a heartbeat the flush loop writes to the state
+store).
+
+aiogram 2.9 predates these update types: they are read from the raw
+update.values by MembershipUpdatesMiddleware.
+"""
+
+import asyncio
+import logging
+import time
+
+import runtime_config
+from aiogram import types
+from aiogram.dispatcher.middlewares import BaseMiddleware
+from lifecycle import DRAIN_WRITES, register_drain, register_warmup
+from state_store import StateStore, state_store
+from subscription_cache import subscription_cache
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_UPDATES = [
+    "message",
+    "edited_message",
+    "channel_post",
+    "edited_channel_post",
+    "inline_query",
+    "chosen_inline_result",
+    "callback_query",
+    "shipping_query",
+    "pre_checkout_query",
+    "poll",
+    "poll_answer",
+    "my_chat_member",
+    "chat_member",
+]
+BOT_ADMIN_STATUSES = {"administrator", "creator"}
+# Telegram drops pending updates older than this
+PENDING_UPDATES_KEPT = 24 * 3600
+HEARTBEAT_KEY = "membership_index_heartbeat"
+HEARTBEAT_INTERVAL = 60.0
+
+
+def allowed_updates():
+    """allowed_updates for getUpdates/setWebhook (None: Telegram's default)"""
+    return ALLOWED_UPDATES if runtime_config.MEMBERSHIP_UPDATES else None
+
+
+class MembershipIndex:
+    """channel_id -> {user_id: (status, date, learned_at)} from chat_member updates"""
+
+    def __init__(self, store: StateStore = None, flush_interval: float = 1.0, ttl: float = None):
+        self.store = store or state_store
+        self.flush_interval = flush_interval
+        self.ttl = runtime_config.MEMBERSHIP_TTL if ttl is None else ttl
+
+        self._channels = {}
+        # Changes not yet written: (channel_id, user_id) -> (status, date, learned_at)
+        self._dirty = {}
+        self._dropped_channels = set()
+        # Channels dropped while load() reads the disk (None when not loading)
+        self._dropped_while_loading = None
+        self._flush_task = None
+        self._table_ready = False
+        self._heartbeat_at = 0.0
+
+        self.events = 0
+        self.stale_events = 0
+        self.lookups = 0
+        self.hits = 0
+        self.expired = 0
+        self.resets = 0
+
+    # --- persistence -----------------------------------------------------
+
+    def _ensure_table(self):
+        if self._table_ready:
+            return
+        self.store.execute(
+            "CREATE TABLE IF NOT EXISTS channel_member ("
+            "channel_id INTEGER NOT NULL, user_id INTEGER NOT NULL, status TEXT NOT NULL, "
+            "date INTEGER NOT NULL, learned_at INTEGER NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (channel_id, user_id))"
+        )
+        columns = {row[1] for row in self.store.execute("PRAGMA table_info(channel_member)")}
+        if "learned_at" not in columns:
+            # Rows from before learned_at existed count as expired
+            self.store.execute(
+                "ALTER TABLE channel_member ADD COLUMN learned_at INTEGER NOT NULL DEFAULT 0"
+            )
+        self._table_ready = True
+
+    def _gap(self):
+        """Why updates may have been missed since the last run, or None"""
+        if not runtime_config.MEMBERSHIP_UPDATES:
+            return "chat_member updates are not requested"
+        if not runtime_config.CATCH_UP_ON_START:
+            return "pending updates are skipped on start"
+        heartbeat = self.store.get(HEARTBEAT_KEY)
+        if heartbeat is not None and time.time() - heartbeat > PENDING_UPDATES_KEPT:
+            return f"the bot was down for {(time.time() - heartbeat) / 3600:.0f}h"
+        return None
+
+    def _load_rows(self):
+        self._ensure_table()
+        gap = self._gap()
+        if gap is not None:
+            self.store.execute("DELETE FROM channel_member")
+            return gap, []
+        self.store.execute(
+            "DELETE FROM channel_member WHERE learned_at < ?", (int(time.time() - self.ttl),)
+        )
+        rows = self.store.execute(
+            "SELECT channel_id, user_id, status, date, learned_at FROM channel_member"
+        )
+        return None, rows
+
+    async def load(self):
+        started = time.monotonic()
+        self._dropped_while_loading = set()
+        try:
+            gap, rows = await asyncio.to_thread(self._load_rows)
+            dropped = self._dropped_while_loading
+        finally:
+            self._dropped_while_loading = None
+        if gap is not None:
+            self.resets += 1
+            logger.warning(f"Membership index cleared: {gap}")
+        for channel_id, user_id, status, date, learned_at in rows:
+            if channel_id in dropped:
+                continue
+            members = self._channels.setdefault(channel_id, {})
+            # Events applied while loading are newer than the disk
+            members.setdefault(user_id, (status, date, learned_at))
+        logger.info(
+            f"Membership index loaded: {len(rows)} members of {len(self._channels)} channels "
+            f"in {(time.monotonic() - started) * 1000:.1f}ms"
+        )
+        if runtime_config.MEMBERSHIP_UPDATES:
+            # Heartbeats from here on tell the next start how long it was down
+            self._mark_dirty()
+
+    def _write(self, dropped_channels, items, heartbeat):
+        self._ensure_table()
+
+        def write(connection):
+            for channel_id in dropped_channels:
+                connection.execute("DELETE FROM channel_member WHERE channel_id = ?", (channel_id,))
+            connection.executemany(
+                "INSERT INTO channel_member (channel_id, user_id, status, date, learned_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(channel_id, user_id) DO UPDATE SET "
+                "status = excluded.status, date = excluded.date, learned_at = excluded.learned_at",
+                [(channel_id, user_id) + entry for (channel_id, user_id), entry in items],
+            )
+
+        if dropped_channels or items:
+            self.store.transaction(write)
+        if heartbeat:
+            self.store.set(HEARTBEAT_KEY, time.time())
+
+    async def flush(self):
+        heartbeat = time.monotonic() - self._heartbeat_at >= HEARTBEAT_INTERVAL
+        if not self._dirty and not self._dropped_channels and not heartbeat:
+            return
+        dropped, self._dropped_channels = self._dropped_channels, set()
+        items, self._dirty = list(self._dirty.items()), {}
+        try:
+            await asyncio.to_thread(self._write, dropped, items, heartbeat)
+            if heartbeat:
+                self._heartbeat_at = time.monotonic()
+        except Exception as e:
+            logger.error(f"Membership index flush failed, will retry: {e}")
+            self._dropped_channels |= dropped
+            for key, value in items:
+                self._dirty.setdefault(key, value)
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _mark_dirty(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def drain(self, timeout: float) -> dict:
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        # The last heartbeat marks when the bot stopped receiving updates
+        self._heartbeat_at = 0.0
+        pending = len(self._dirty)
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return {"completed": pending - len(self._dirty), "abandoned": len(self._dirty)}
+
+    # --- updates ---------------------------------------------------------
+
+    def apply(self, event: dict):
+        """Record a chat_member update (raw dict)"""
+        channel_id = event["chat"]["id"]
+        user_id = event["new_chat_member"]["user"]["id"]
+        status = event["new_chat_member"]["status"]
+        date = event.get("date", 0)
+        members = self._channels.setdefault(channel_id, {})
+        known = members.get(user_id)
+        if known is not None and known[1] > date:
+            # Delivered out of order: a newer change is already recorded
+            self.stale_events += 1
+            return
+        self.events += 1
+        members[user_id] = self._dirty[(channel_id, user_id)] = (status, date, int(time.time()))
+        # A status cached from an earlier getChatMember is outdated now
+        subscription_cache.invalidate(channel_id, user_id)
+        self._mark_dirty()
+
+    def apply_bot_status(self, event: dict):
+        """my_chat_member: forget a channel where the bot is no longer admin"""
+        if event["new_chat_member"]["status"] in BOT_ADMIN_STATUSES:
+            return
+        channel_id = event["chat"]["id"]
+        if self._channels.pop(channel_id, None) is not None:
+            logger.warning(f"Bot is no longer admin in {channel_id}, membership index dropped")
+        self._dirty = {key: value for key, value in self._dirty.items() if key[0] != channel_id}
+        self._dropped_channels.add(channel_id)
+        if self._dropped_while_loading is not None:
+            self._dropped_while_loading.add(channel_id)
+        self._mark_dirty()
+
+    def lookup(self, channel_id, user_id):
+        """Last known status, or None if the index cannot tell"""
+        self.lookups += 1
+        known = self._channels.get(channel_id, {}).get(user_id)
+        if known is None:
+            return None
+        if time.time() - known[2] > self.ttl:
+            self.expired += 1
+            return None
+        self.hits += 1
+        return known[0]
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "members": sum(map(len, self._channels.values())),
+            "events": self.events,
+            "stale_events": self.stale_events,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "expired": self.expired,
+            "resets": self.resets,
+        }
+
+
+class MembershipUpdatesMiddleware(BaseMiddleware):
+    """Feeds chat_member / my_chat_member updates into the index"""
+
+    def __init__(self, index: MembershipIndex = None):
+        super().__init__()
+        self.index = index or membership_index
+
+    async def on_pre_process_update(self, update: types.Update, data: dict):
+        values = update.values
+        try:
+            if "chat_member" in values:
+                self.index.apply(values["chat_member"])
+            elif "my_chat_member" in values:
+                self.index.apply_bot_status(values["my_chat_member"])
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Malformed membership update {update.update_id}: {e}")
+
+
+membership_index = MembershipIndex()
+if runtime_config.MEMBERSHIP_UPDATES:
+    subscription_cache.index = membership_index
+# Deletes expired rows, may clear the table and starts the heartbeat
+register_warmup(membership_index.load, requires_lease=True)
+register_drain("membership index", membership_index.drain, DRAIN_WRITES)
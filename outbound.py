@@ -0,0 +1,414 @@
+"""
+Paced outbound Bot API calls.
+
+Every message the bot sends (comment replies, winner DMs, results posts,
+reports to OWNERS) goes through one scheduler that keeps within Telegram's
+limits: a global token bucket (~30 messages/s) and one bucket per chat
+(1/s for private chats, 20/min for groups and channels). A RetryAfter
+pauses the bucket that was hit, halves its rate until requests succeed
+again and retries the call. Waiting requests get the global tokens by
+priority, so an admin clicking through the panel is not stuck behind the
+results mailing of a finished giveaway.
+
+A handler replying into the group its update came from would otherwise wait
+out that group's 20/min inside its dispatcher lane, and a comment storm would
+fill the lane queue and hold up every other chat. A handler that does not
+need the sent message can opt in with outbound_detached(): when its reply
+cannot go out within group_max_wait, it is handed to the scheduler in the
+background and the handler gets an empty result back at once; past
+group_max_queue background replies in one group, further ones are dropped.
+Only fire-and-forget replies qualify, such as the comment handler's "you are
+in" / "subscribe first" answers under a giveaway post:
+
+    with outbound_detached():
+        await message.reply(text)
+
+Anything that uses the returned Message (its message_id for a later edit or
+delete, a pinned results post) must not opt in; without it the send waits
+for its turn and returns the real result.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import logging
+import time
+
+import runtime_config
+from aiogram import types
+from aiogram.dispatcher.middlewares import BaseMiddleware
+from aiogram.utils.exceptions import RetryAfter
+from http_session import PooledBot
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+NORMAL = 1
+BULK = 2
+PRIORITY_NAMES = {INTERACTIVE: "interactive", NORMAL: "normal", BULK: "bulk"}
+
+# Methods that count against Telegram's message limits
+PACED_METHOD_PREFIXES = ("send", "forward", "copy", "edit")
+UNPACED_METHODS = {"sendChatAction"}
+
+_priority = contextvars.ContextVar("outbound_priority", default=NORMAL)
+# Chat of the update being handled (set by OutboundPriorityMiddleware)
+_update_chat = contextvars.ContextVar("outbound_update_chat", default=None)
+# Whether the caller ignores the result of its replies (outbound_detached)
+_detached_ok = contextvars.ContextVar("outbound_detached_ok", default=False)
+
+
+@contextlib.contextmanager
+def outbound_priority(priority: int):
+    """Send with the given priority inside the block (and tasks created there)"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@contextlib.contextmanager
+def outbound_detached():
+    """
+    Let replies into the update's group inside the block go out in the
+    background when the group is backed up; they then return {} instead of
+    the sent message, so only use it where the result is ignored
+    """
+    token = _detached_ok.set(True)
+    try:
+        yield
+    finally:
+        _detached_ok.reset(token)
+
+
+def is_private_chat(chat_id) -> bool:
+    return isinstance(chat_id, int) and chat_id > 0 or (
+        isinstance(chat_id, str) and chat_id.isdigit()
+    )
+
+
+class OutboundPriorityMiddleware(BaseMiddleware):
+    """Replies to private chats (the admin panel) are interactive"""
+
+    async def on_pre_process_update(self, update: types.Update, data: dict):
+        chat = None
+        if update.message:
+            chat = update.message.chat
+        elif update.callback_query and update.callback_query.message:
+            chat = update.callback_query.message.chat
+        # Set for every update: workers reuse the same context
+        _priority.set(INTERACTIVE if chat and chat.type == "private" else NORMAL)
+        _update_chat.set(chat.id if chat else None)
+
+
+class TokenBucket:
+    """Token bucket with reservations, pauses and an adaptive rate"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Seconds until a token can be taken"""
+        now = time.monotonic()
+        self._refill(now)
+        wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def take(self):
+        self._refill(time.monotonic())
+        self.tokens -= 1
+
+    def reserve(self) -> float:
+        """Take a token now, possibly on credit; returns how long to wait for it"""
+        wait = self.delay()
+        self.tokens -= 1
+        return wait
+
+    def refund(self):
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def pause(self, seconds: float):
+        now = time.monotonic()
+        self._refill(now)
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.rate = max(self.base_rate / 8, self.rate / 2)
+
+    def recover(self):
+        if self.rate < self.base_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+    def idle(self) -> bool:
+        return self.delay() <= 0 and self.tokens >= self.capacity - 1
+
+
+class OutboundScheduler:
+    """Global and per-chat pacing with priorities for outbound calls"""
+
+    def __init__(
+        self,
+        global_rate: float = None,
+        private_rate: float = None,
+        group_per_minute: float = None,
+        group_burst: float = None,
+        max_retries: int = None,
+        max_retry_wait: float = None,
+        max_chat_buckets: int = 10000,
+        group_max_wait: float = None,
+        group_max_queue: int = None,
+    ):
+        global_rate = global_rate or runtime_config.OUTBOUND_GLOBAL_RATE
+        self.private_rate = private_rate or runtime_config.OUTBOUND_PRIVATE_RATE
+        group_per_minute = group_per_minute or runtime_config.OUTBOUND_GROUP_PER_MINUTE
+        self.group_rate = group_per_minute / 60
+        self.group_burst = group_burst or runtime_config.OUTBOUND_GROUP_BURST
+        self.max_retries = (
+            runtime_config.OUTBOUND_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.max_retry_wait = max_retry_wait or runtime_config.OUTBOUND_MAX_RETRY_WAIT
+        self.max_chat_buckets = max_chat_buckets
+        self.group_max_wait = (
+            runtime_config.OUTBOUND_GROUP_MAX_WAIT if group_max_wait is None else group_max_wait
+        )
+        self.group_max_queue = (
+            runtime_config.OUTBOUND_GROUP_MAX_QUEUE if group_max_queue is None else group_max_queue
+        )
+
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self._chats = {}
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._pump_task = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+        # chat_id -> sends running in the background
+        self._detached = {}
+
+        self.queued = {priority: 0 for priority in PRIORITY_NAMES}
+        self.in_flight = 0
+        self.sent = 0
+        self.failed = 0
+        self.retry_after = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.detached = 0
+        self.dropped = 0
+
+    def _chat_bucket(self, chat_id) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self.max_chat_buckets:
+                # Buckets that refilled completely carry no state worth keeping
+                for key in [key for key, old in self._chats.items() if old.idle()]:
+                    del self._chats[key]
+            if is_private_chat(chat_id):
+                bucket = TokenBucket(self.private_rate, 1)
+            else:
+                bucket = TokenBucket(self.group_rate, self.group_burst)
+            self._chats[chat_id] = bucket
+        return bucket
+
+    async def _acquire_chat(self, chat_id):
+        bucket = self._chat_bucket(chat_id)
+        delay = bucket.reserve()
+        try:
+            while delay > 0:
+                await asyncio.sleep(delay)
+                # A RetryAfter may have paused the chat while we slept
+                delay = bucket.paused_until - time.monotonic()
+        except asyncio.CancelledError:
+            bucket.refund()
+            raise
+
+    async def _acquire_global(self, priority: int):
+        if not self._waiters and self.global_bucket.delay() <= 0:
+            self.global_bucket.take()
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump())
+        await future
+
+    async def _pump(self):
+        """Hand out global tokens to waiters, highest priority first"""
+        while self._waiters:
+            delay = self.global_bucket.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # The caller was cancelled while waiting
+                continue
+            self.global_bucket.take()
+            future.set_result(None)
+
+    def _on_retry_after(self, chat_id, seconds: float):
+        self.retry_after += 1
+        if chat_id is not None:
+            self._chat_bucket(chat_id).pause(seconds)
+        # Private chats allow 1/s, far above what we send to one user, so a
+        # flood wait there (or on a chatless call) means the global rate
+        if chat_id is None or is_private_chat(chat_id):
+            self.global_bucket.pause(seconds)
+
+    async def run(self, chat_id, call, retry: bool = True):
+        """Run call() once the buckets allow it; retries after RetryAfter"""
+        priority = _priority.get()
+        queued_at = time.monotonic()
+        granted = False
+        self.queued[priority] += 1
+        self._idle.clear()
+        try:
+            for attempt in itertools.count():
+                if chat_id is not None:
+                    await self._acquire_chat(chat_id)
+                await self._acquire_global(priority)
+
+                if not granted:
+                    granted = True
+                    waited = time.monotonic() - queued_at
+                    self.total_wait_seconds += waited
+                    self.max_wait_seconds = max(self.max_wait_seconds, waited)
+                    self.queued[priority] -= 1
+                    self.in_flight += 1
+
+                try:
+                    result = await call()
+                except RetryAfter as e:
+                    self._on_retry_after(chat_id, e.timeout)
+                    if not retry or attempt >= self.max_retries or e.timeout > self.max_retry_wait:
+                        raise
+                    logger.warning(
+                        f"Flood control for chat {chat_id}: retrying in {e.timeout}s "
+                        f"(attempt {attempt + 1}/{self.max_retries})"
+                    )
+                    continue
+
+                self.sent += 1
+                self.global_bucket.recover()
+                if chat_id is not None:
+                    self._chat_bucket(chat_id).recover()
+                return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            if granted:
+                self.in_flight -= 1
+            else:
+                self.queued[priority] -= 1
+            if not self.in_flight and not any(self.queued.values()):
+                self._idle.set()
+
+    def chat_delay(self, chat_id) -> float:
+        """Seconds a send to this chat would wait for its turn"""
+        return self._chat_bucket(chat_id).delay()
+
+    def detach(self, chat_id, call, retry: bool = True) -> bool:
+        """Run call() in the background; False if the chat's backlog is full"""
+        tasks = self._detached.setdefault(chat_id, set())
+        if len(tasks) >= self.group_max_queue:
+            self.dropped += 1
+            logger.warning(f"Outbound backlog of chat {chat_id} is full, reply dropped")
+            return False
+        self.detached += 1
+        task = asyncio.ensure_future(self._run_detached(chat_id, call, retry))
+        tasks.add(task)
+        task.add_done_callback(lambda done: self._forget_detached(chat_id, done))
+        return True
+
+    async def _run_detached(self, chat_id, call, retry: bool):
+        try:
+            await self.run(chat_id, call, retry)
+        except Exception as e:
+            logger.error(f"Background send to chat {chat_id} failed: {e}")
+
+    def _forget_detached(self, chat_id, task):
+        tasks = self._detached.get(chat_id)
+        if tasks is not None:
+            tasks.discard(task)
+            if not tasks:
+                del self._detached[chat_id]
+
+    async def _wait_idle(self):
+        while self._detached:
+            tasks = set().union(*self._detached.values())
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await self._idle.wait()
+
+    async def drain(self, timeout: float) -> dict:
+        """Let queued and in-flight sends finish for the shutdown drain"""
+        sent_before = self.sent + self.failed
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return {
+            "completed": self.sent + self.failed - sent_before,
+            "abandoned": self.in_flight + sum(self.queued.values()),
+        }
+
+    def stats(self) -> dict:
+        """Queue depth, wait times and flood control counters"""
+        granted = self.sent + self.failed + self.in_flight or 1
+        return {
+            "queued": sum(self.queued.values()),
+            **{f"queued_{PRIORITY_NAMES[p]}": count for p, count in self.queued.items()},
+            "in_flight": self.in_flight,
+            "sent": self.sent,
+            "failed": self.failed,
+            "retry_after": self.retry_after,
+            "avg_wait_ms": round(self.total_wait_seconds / granted * 1000, 2),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            "detached": self.detached,
+            "dropped": self.dropped,
+            "global_rate": round(self.global_bucket.rate, 2),
+            "chat_buckets": len(self._chats),
+        }
+
+
+class PacedBot(PooledBot):
+    """Bot whose message-sending calls go through an OutboundScheduler"""
+
+    def __init__(self, *args, scheduler: OutboundScheduler = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scheduler = scheduler or OutboundScheduler()
+
+    async def request(self, method, data=None, files=None, **kwargs):
+        send = super().request
+        if not method.startswith(PACED_METHOD_PREFIXES) or method in UNPACED_METHODS:
+            return await send(method, data, files, **kwargs)
+        chat_id = (data or {}).get("chat_id")
+
+        def call():
+            return send(method, data, files, **kwargs)
+
+        if (
+            _detached_ok.get()
+            and not files
+            and chat_id is not None
+            and chat_id == _update_chat.get()
+            and not is_private_chat(chat_id)
+            and self.scheduler.chat_delay(chat_id) > self.scheduler.group_max_wait
+        ):
+            # Do not hold the update's lane for the group's pacing; the
+            # reply goes out (or is dropped) without the handler, which
+            # said it does not need the result
+            self.scheduler.detach(chat_id, call)
+            return {}
+        # Uploaded files are streams that cannot be sent twice
+        return await self.scheduler.run(chat_id, call, retry=not files)
@@ -0,0 +1,241 @@
+"""
+Write-behind buffer for new participants.
+
+A participation committed in its own transaction caps SQLite at a few
+hundred joins per second. The participation path now calls
+participant_buffer.add(): the user is recorded in the participant sets and
+a journal line, and can be answered right away; the rows accumulated every
+flush_interval seconds (or flush_rows rows, whichever comes first) are
+written by participant_store.append_many() in one transaction.
+
+The journal holds exactly the rows not yet in the database. It is replayed
+by a startup warm-up, so a crash loses no acknowledged participant; the
+shutdown drain flushes what is left.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+import runtime_config
+from lifecycle import DRAIN_WRITES, register_drain, register_warmup
+from participant_sets import participant_sets
+from participant_store import ELIGIBLE, participant_store
+
+logger = logging.getLogger(__name__)
+
+
+class ParticipantBuffer:
+    """Acknowledge joins immediately, write them to the database in batches"""
+
+    def __init__(
+        self,
+        store=participant_store,
+        sets=participant_sets,
+        journal_path: str = None,
+        flush_interval: float = 0.05,
+        flush_rows: int = 200,
+    ):
+        self.store = store
+        self.sets = sets
+        self.journal_path = journal_path
+        self.flush_interval = flush_interval
+        self.flush_rows = flush_rows
+
+        self._pending = []
+        self._journal = None
+        self._flush_task = None
+        self._flush_now = None
+        self._flush_lock = asyncio.Lock()
+        # Set by drain(): the loop exits after the flush it is in
+        self._stopping = False
+        # Rows taken by the flush in progress
+        self._writing = 0
+
+        self.accepted = 0
+        self.duplicates = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.rows_written = 0
+        self.replayed = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._flush_ms_total = 0.0
+
+    # --- journal ---------------------------------------------------------
+
+    def _journal_write(self, row):
+        if not self.journal_path:
+            return
+        if self._journal is None:
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal.write(json.dumps(row, ensure_ascii=False) + "\n")
+        # Reaches the OS right away: survives a crash of the process
+        self._journal.flush()
+
+    def _journal_rewrite(self):
+        """Make the journal hold only the rows that are still pending"""
+        if not self.journal_path:
+            return
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if not self._pending:
+            open(self.journal_path, "w").close()
+            return
+        temp_path = self.journal_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as journal:
+            for row in self._pending:
+                journal.write(json.dumps(row, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.journal_path)
+
+    def _journal_read(self) -> list:
+        try:
+            with open(self.journal_path, encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return []
+        rows = []
+        for line in lines:
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                # The process died in the middle of this line
+                logger.warning(f"Skipping a torn participant journal line: {line!r}")
+        return rows
+
+    async def replay(self):
+        """Write the rows a crashed process acknowledged but did not flush"""
+        # Also makes sure the table exists on a database that was never migrated
+        await self.store.create_table()
+        if not self.journal_path:
+            return
+        # Lines written before participant statuses existed have no status
+        rows = [row if len(row) == 5 else [*row, ELIGIBLE] for row in self._journal_read()]
+        if rows:
+            # INSERT OR IGNORE: rows flushed just before the crash are skipped
+            await self.store.append_many(rows)
+            for callback_value, user_id, *_ in rows:
+                self.sets.add(callback_value, user_id)
+            self.replayed += len(rows)
+            logger.warning(f"Replayed {len(rows)} participants from {self.journal_path}")
+        self._journal_rewrite()
+
+    # --- buffer ----------------------------------------------------------
+
+    async def add(
+        self, callback_value: str, user_id: int, username=None, status: str = ELIGIBLE
+    ) -> bool:
+        """Accept a participant; False if they already take part"""
+        # Loads the giveaway's set if needed; the add below is atomic
+        await self.sets.is_participant(callback_value, user_id)
+        if not self.sets.add(callback_value, user_id):
+            self.duplicates += 1
+            return False
+        row = [callback_value, user_id, username, datetime.now().isoformat(sep=" "), status]
+        self._pending.append(row)
+        self._journal_write(row)
+        self.accepted += 1
+
+        if self._flush_task is None:
+            self._flush_now = asyncio.Event()
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+        if len(self._pending) >= self.flush_rows:
+            self._flush_now.set()
+        return True
+
+    async def flush(self):
+        """Write every pending row in one transaction"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            rows = self._pending
+            self._pending = []
+            self._writing = len(rows)
+            started = time.monotonic()
+            try:
+                await self.store.append_many(rows)
+            except asyncio.CancelledError:
+                # Drain timeout: the journal still has them, a replay is idempotent
+                self._pending = rows + self._pending
+                raise
+            except Exception as e:
+                # The rows stay pending (and journaled) for the next flush
+                logger.error(f"Participant flush of {len(rows)} rows failed, will retry: {e}")
+                self._pending = rows + self._pending
+                self.failed_flushes += 1
+                return
+            finally:
+                self._writing = 0
+            elapsed_ms = (time.monotonic() - started) * 1000
+            self._journal_rewrite()
+            self.flushes += 1
+            self.rows_written += len(rows)
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self._flush_ms_total += elapsed_ms
+            logger.debug(f"Flushed {len(rows)} participants in {elapsed_ms:.1f}ms")
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping:
+                break
+            self._flush_now.clear()
+            await self.flush()
+
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        return {
+            "depth": len(self._pending),
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "rows_written": self.rows_written,
+            "replayed": self.replayed,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+            "avg_flush_ms": round(self._flush_ms_total / self.flushes, 1) if self.flushes else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 1),
+        }
+
+    async def drain(self, timeout: float) -> dict:
+        """Flush pending participants for the shutdown drain"""
+        pending = len(self._pending) + self._writing
+        # Cancelling the loop could cut append_many off inside its
+        # transaction: stop it between flushes instead
+        self._stopping = True
+        finishing = asyncio.ensure_future(self._finish())
+        try:
+            await asyncio.wait_for(asyncio.shield(finishing), timeout)
+        except asyncio.TimeoutError:
+            # The flush in progress is left to commit or roll back on its own
+            pass
+        left = len(self._pending) + self._writing
+        # Anything left is still in the journal and replayed on the next start
+        return {"completed": pending - left, "abandoned": left}
+
+    async def _finish(self):
+        if self._flush_task:
+            self._flush_now.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+
+participant_buffer = ParticipantBuffer(
+    journal_path=runtime_config.PARTICIPANT_JOURNAL or None,
+    flush_interval=runtime_config.PARTICIPANT_FLUSH_INTERVAL,
+    flush_rows=runtime_config.PARTICIPANT_FLUSH_ROWS,
+)
+# Replays and truncates the journal the active instance is appending to
+register_warmup(participant_buffer.replay, requires_lease=True)
+register_drain("participant buffer", participant_buffer.drain, DRAIN_WRITES)
@@ -0,0 +1,152 @@
+"""
+In-memory participant sets for instant duplicate detection.
+
+Answering ALREADY_PARTICIPATING used to load the giveaway's participants
+and scan them. Each running giveaway now has a set of participant user ids,
+filled at startup from the participant table (participant_store) and kept in
+sync by participant_store.append(). A giveaway that is not loaded yet
+(started by another process) is loaded on its first check; concurrent
+checks share that load.
+
+A set is only ever created complete (by a load, or empty when the giveaway
+starts). add() for a giveaway that is not loaded does not create one: the
+participant is in the database already and the load will find them, and
+participants added while a load is reading are merged in when it is done.
+"""
+
+import asyncio
+import logging
+import time
+
+from giveaway_events import register_giveaway_listener
+from lifecycle import register_warmup
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_all_members():
+    """{callback_value: [user_id, ...]} of running giveaways"""
+    from database import GiveAway
+
+    rows = await GiveAway._meta.db.execute_query_dict(
+        "SELECT p.giveaway_callback_value AS giveaway, p.user_id FROM participant p "
+        "JOIN giveaway g ON g.callback_value = p.giveaway_callback_value WHERE g.run_status = 1"
+    )
+    members = {}
+    for row in rows:
+        members.setdefault(row["giveaway"], []).append(row["user_id"])
+    return members
+
+
+async def _load_members(callback_value: str):
+    from database import GiveAway
+
+    rows = await GiveAway._meta.db.execute_query_dict(
+        "SELECT user_id FROM participant WHERE giveaway_callback_value = ?", [callback_value]
+    )
+    return [row["user_id"] for row in rows]
+
+
+class ParticipantSets:
+    """callback_value -> set of participant user ids"""
+
+    def __init__(self, load_all_members=_load_all_members, load_members=_load_members):
+        self._load_all_members = load_all_members
+        self._load_members = load_members
+        self._sets = {}
+        self._loading = {}
+        self._bulk_loading = False
+        # Participants added while a load of their giveaway was reading
+        self._added_while_loading = {}
+        self.checks = 0
+        self.loads = 0
+
+    async def load(self):
+        started = time.monotonic()
+        self._bulk_loading = True
+        try:
+            members = await self._load_all_members()
+        finally:
+            self._bulk_loading = False
+        # Merge: joins may have added ids to loaded sets during the load
+        for callback_value, ids in members.items():
+            self._sets.setdefault(callback_value, set()).update(ids)
+        for callback_value in list(self._added_while_loading):
+            if callback_value in self._sets:
+                self._sets[callback_value].update(self._added_while_loading.pop(callback_value))
+            elif callback_value not in self._loading:
+                # Still not loaded: its first check reads them from the database
+                del self._added_while_loading[callback_value]
+        logger.info(
+            f"Participant sets loaded: {sum(map(len, self._sets.values()))} participants "
+            f"of {len(self._sets)} giveaways in {(time.monotonic() - started) * 1000:.1f}ms"
+        )
+
+    async def _members(self, callback_value: str) -> set:
+        members = self._sets.get(callback_value)
+        if members is not None:
+            return members
+        loading = self._loading.get(callback_value)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load_members(callback_value))
+            self._loading[callback_value] = loading
+            try:
+                ids = await loading
+            finally:
+                del self._loading[callback_value]
+                added = self._added_while_loading.pop(callback_value, ())
+            self.loads += 1
+            # add() may have run while the load was in flight
+            members = self._sets.setdefault(callback_value, set())
+            members.update(ids)
+            members.update(added)
+            return members
+        await asyncio.shield(loading)
+        return self._sets[callback_value]
+
+    async def is_participant(self, callback_value: str, user_id: int) -> bool:
+        self.checks += 1
+        return user_id in await self._members(callback_value)
+
+    async def count(self, callback_value: str) -> int:
+        return len(await self._members(callback_value))
+
+    def add(self, callback_value: str, user_id: int) -> bool:
+        """Record a participant; False if they were already known"""
+        members = self._sets.get(callback_value)
+        if members is None:
+            # A set started here would pass for the whole giveaway
+            if self._bulk_loading or callback_value in self._loading:
+                self._added_while_loading.setdefault(callback_value, set()).add(user_id)
+            return True
+        if user_id in members:
+            return False
+        members.add(user_id)
+        return True
+
+    def discard(self, callback_value: str, user_id: int):
+        members = self._sets.get(callback_value)
+        if members is not None:
+            members.discard(user_id)
+
+    def giveaway_started(self, callback_value: str):
+        self._sets.setdefault(callback_value, set())
+
+    def giveaway_finished(self, callback_value: str):
+        self._sets.pop(callback_value, None)
+        self._added_while_loading.pop(callback_value, None)
+
+    def stats(self) -> dict:
+        return {
+            "giveaways": len(self._sets),
+            "participants": sum(map(len, self._sets.values())),
+            "checks": self.checks,
+            "loads": self.loads,
+        }
+
+
+participant_sets = ParticipantSets()
+register_warmup(participant_sets.load)
+register_giveaway_listener(
+    started=participant_sets.giveaway_started, finished=participant_sets.giveaway_finished
+)
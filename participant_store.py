@@ -0,0 +1,208 @@
+"""
+Giveaway participants in their own table.
+
+giveawaystatistic.members kept every participant of a giveaway in one JSON
+array, so each join read, appended to and rewrote the whole array (O(n) per
+join) and two concurrent joins could overwrite each other. Participants are
+now rows of the participant table with a unique (giveaway, user_id) index:
+a join is one INSERT OR IGNORE, the database rejects duplicates, and counts,
+pages and winner samples are answered by SQL. migrate_database.py creates
+the table and copies the existing JSON members over in chunks.
+
+The GiveAwayStatistic model delegates its participant methods here:
+
+    await participant_store.append(callback_value, user_id, username)
+    await participant_store.count(callback_value)
+"""
+
+import logging
+from datetime import datetime
+
+from participant_sets import participant_sets
+
+logger = logging.getLogger(__name__)
+
+PARTICIPANT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS participant (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    giveaway_callback_value TEXT NOT NULL,
+    user_id BIGINT NOT NULL,
+    username TEXT,
+    joined_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    status TEXT NOT NULL DEFAULT 'eligible',
+    attempts INTEGER NOT NULL DEFAULT 0
+)
+"""
+PARTICIPANT_INDEX_SQL = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS participant_giveaway_user "
+    "ON participant (giveaway_callback_value, user_id)"
+)
+PARTICIPANT_STATUS_COLUMN_SQL = (
+    "ALTER TABLE participant ADD COLUMN status TEXT NOT NULL DEFAULT 'eligible'"
+)
+PARTICIPANT_ATTEMPTS_COLUMN_SQL = (
+    "ALTER TABLE participant ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0"
+)
+INSERT_PARTICIPANT_SQL = (
+    "INSERT OR IGNORE INTO participant "
+    "(giveaway_callback_value, user_id, username, joined_at, status) "
+    "VALUES (?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?)"
+)
+
+PARTICIPANT_FIELDS = "id, user_id, username, joined_at, status"
+
+# Participant statuses: pending ones joined a "verify later" giveaway and
+# wait for the deferred subscription check; only eligible ones are drawn
+ELIGIBLE = "eligible"
+PENDING = "pending"
+INELIGIBLE = "ineligible"
+
+
+def _default_db():
+    from database import GiveAwayStatistic
+
+    return GiveAwayStatistic._meta.db
+
+
+class ParticipantStore:
+    """append / count / page / sample over the participant table"""
+
+    def __init__(self, get_db=_default_db, sets=participant_sets):
+        self._get_db = get_db
+        self.sets = sets
+
+    async def create_table(self):
+        db = self._get_db()
+        await db.execute_script(f"{PARTICIPANT_TABLE_SQL};\n{PARTICIPANT_INDEX_SQL};")
+        columns = await db.execute_query_dict("PRAGMA table_info(participant)")
+        names = {column["name"] for column in columns}
+        if "status" not in names:
+            # Created before participant statuses existed
+            await db.execute_script(PARTICIPANT_STATUS_COLUMN_SQL)
+        if "attempts" not in names:
+            await db.execute_script(PARTICIPANT_ATTEMPTS_COLUMN_SQL)
+
+    async def append(
+        self, callback_value: str, user_id: int, username=None, joined_at=None, status=ELIGIBLE
+    ) -> bool:
+        """Add a participant; False if they already take part"""
+        if isinstance(joined_at, datetime):
+            joined_at = joined_at.isoformat(sep=" ")
+        inserted, _ = await self._get_db().execute_query(
+            INSERT_PARTICIPANT_SQL, [callback_value, user_id, username, joined_at, status]
+        )
+        if self.sets is not None:
+            self.sets.add(callback_value, user_id)
+        return bool(inserted)
+
+    async def append_many(self, rows):
+        """Insert (callback_value, user_id, username, joined_at, status) rows in one transaction"""
+        await self._get_db().execute_many(INSERT_PARTICIPANT_SQL, [list(row) for row in rows])
+
+    async def pending(self, limit: int = 100, callback_values=None, after_id: int = 0) -> list:
+        """
+        Participants still waiting for the deferred check, by row id after
+        after_id (a cursor, so rows that stay undecided do not come back first)
+        """
+        sql = (
+            "SELECT id, giveaway_callback_value, user_id, attempts FROM participant "
+            "WHERE status = ? AND id > ?"
+        )
+        params = [PENDING, after_id]
+        if callback_values is not None:
+            callback_values = list(callback_values)
+            if not callback_values:
+                return []
+            sql += f" AND giveaway_callback_value IN ({', '.join('?' * len(callback_values))})"
+            params += callback_values
+        return await self._get_db().execute_query_dict(
+            f"{sql} ORDER BY id LIMIT ?", [*params, limit]
+        )
+
+    async def retry_later(self, ids):
+        """Count a check that could not decide these rows; they stay pending"""
+        ids = list(ids)
+        if not ids:
+            return
+        placeholders = ", ".join("?" * len(ids))
+        await self._get_db().execute_query(
+            f"UPDATE participant SET attempts = attempts + 1 WHERE id IN ({placeholders})", ids
+        )
+
+    async def set_status(self, ids, status: str):
+        """Set the status of the participants with these row ids"""
+        ids = list(ids)
+        if not ids:
+            return
+        placeholders = ", ".join("?" * len(ids))
+        await self._get_db().execute_query(
+            f"UPDATE participant SET status = ? WHERE id IN ({placeholders})", [status, *ids]
+        )
+
+    async def remove(self, callback_value: str, user_id: int) -> bool:
+        removed, _ = await self._get_db().execute_query(
+            "DELETE FROM participant WHERE giveaway_callback_value = ? AND user_id = ?",
+            [callback_value, user_id],
+        )
+        if self.sets is not None:
+            self.sets.discard(callback_value, user_id)
+        return bool(removed)
+
+    async def count(self, callback_value: str, status: str = None) -> int:
+        if status is None:
+            rows = await self._get_db().execute_query_dict(
+                "SELECT COUNT(*) AS total FROM participant WHERE giveaway_callback_value = ?",
+                [callback_value],
+            )
+        else:
+            rows = await self._get_db().execute_query_dict(
+                "SELECT COUNT(*) AS total FROM participant "
+                "WHERE giveaway_callback_value = ? AND status = ?",
+                [callback_value, status],
+            )
+        return rows[0]["total"]
+
+    async def page(self, callback_value: str, after_id: int = 0, limit: int = 100) -> list:
+        """Participants in join order; pass the last id of a page to get the next one"""
+        return await self._get_db().execute_query_dict(
+            f"SELECT {PARTICIPANT_FIELDS} FROM participant "
+            "WHERE giveaway_callback_value = ? AND id > ? ORDER BY id LIMIT ?",
+            [callback_value, after_id, limit],
+        )
+
+    async def sample(self, callback_value: str, k: int) -> list:
+        """k distinct random eligible participants (fewer if there are not enough)"""
+        return await self._get_db().execute_query_dict(
+            f"SELECT {PARTICIPANT_FIELDS} FROM participant "
+            "WHERE giveaway_callback_value = ? AND status = ? ORDER BY RANDOM() LIMIT ?",
+            [callback_value, ELIGIBLE, k],
+        )
+
+    async def user_ids(self, callback_value: str) -> list:
+        rows = await self._get_db().execute_query_dict(
+            "SELECT user_id FROM participant WHERE giveaway_callback_value = ?",
+            [callback_value],
+        )
+        return [row["user_id"] for row in rows]
+
+    async def members(self, callback_value: str) -> list:
+        """All participants in the old members JSON shape (for results and exports)"""
+        members = []
+        after_id = 0
+        while True:
+            rows = await self.page(callback_value, after_id, 1000)
+            if not rows:
+                return members
+            after_id = rows[-1]["id"]
+            members.extend(
+                {
+                    "username": row["username"],
+                    "user_id": row["user_id"],
+                    "join_date": row["joined_at"],
+                    "status": row["status"],
+                }
+                for row in rows
+            )
+
+
+participant_store = ParticipantStore()
@@ -0,0 +1,256 @@
+"""
+Pipelined long-polling engine.
+
+The next getUpdates request is issued while the previous batch is still being
+handled, so a slow subscription check no longer delays fetching. The batch
+limit and long-poll timeout follow the observed backlog: full batches mean
+Telegram has more queued, empty ones mean we are caught up.
+
+Overlapping has a price: getUpdates(offset=last + 1) confirms every update
+fetched so far to Telegram, including those of batches still being handled,
+and Telegram never delivers a confirmed update again. If the process dies,
+the updates in flight (at most max_in_flight batches) are lost; only a clean
+shutdown, which drains them, loses nothing. The offset persisted for the next
+start is the processed watermark, so the restart never resumes past an
+update that was not handled, but it cannot bring back the ones Telegram
+already dropped.
+"""
+
+import asyncio
+import logging
+import time
+
+import aiohttp
+import runtime_config
+from aiogram import Bot, Dispatcher
+from catchup import OFFSET_KEY, BacklogCatchUp
+from lifecycle import get_stop_event, install_stop_signals
+from membership_index import allowed_updates
+from state_store import StateStore, state_store
+from update_dispatcher import ChatShardedDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+class PipelinedPoller:
+    """getUpdates loop that overlaps fetching with processing"""
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        min_limit: int = 10,
+        max_limit: int = 100,
+        max_timeout: int = 20,
+        max_in_flight: int = 4,
+        error_sleep: float = 5,
+        chat_dispatcher: ChatShardedDispatcher = None,
+        offset: int = None,
+        store: StateStore = None,
+        offset_save_interval: float = 1.0,
+    ):
+        self.dispatcher = dispatcher
+        self.chat_dispatcher = chat_dispatcher
+        self.store = store
+        self.offset_save_interval = offset_save_interval
+        self.bot = dispatcher.bot
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_timeout = max_timeout
+        self.max_in_flight = max_in_flight
+        self.error_sleep = error_sleep
+
+        self.offset = offset
+        self.limit = max_limit
+        self.timeout = max_timeout
+        self.fetched = 0
+        self.batches = 0
+        self._backlog_ewma = 0.0
+        self._running = False
+        # batch task -> first update_id in the batch
+        self._in_flight = {}
+        self._saved_offset = offset
+        self._last_save = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def adapt(self, batch_size: int):
+        """Tune limit/timeout for the next request from the last batch size"""
+        self._backlog_ewma = 0.7 * self._backlog_ewma + 0.3 * batch_size
+
+        if batch_size >= self.limit:
+            # Telegram is holding more: grab as much as possible, no waiting
+            self.limit = self.max_limit
+            self.timeout = 0
+        elif batch_size == 0:
+            # Caught up: long poll with a small limit for low latency
+            self.limit = self.min_limit
+            self.timeout = self.max_timeout
+        else:
+            target = int(self._backlog_ewma * 2) or self.min_limit
+            self.limit = max(self.min_limit, min(self.max_limit, target))
+            self.timeout = 1
+
+    async def process(self, updates):
+        if self.chat_dispatcher:
+            for update in updates:
+                await self.chat_dispatcher.submit(update)
+        else:
+            await self.dispatcher.process_updates(updates)
+
+    async def _process_batch(self, updates):
+        try:
+            await self.process(updates)
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(updates)} updates: {e}")
+
+    def _schedule(self, updates):
+        task = asyncio.get_running_loop().create_task(self._process_batch(updates))
+        self._in_flight[task] = updates[0].update_id
+        task.add_done_callback(lambda t: self._in_flight.pop(t, None))
+
+    def processed_offset(self):
+        """Offset below which every fetched update has been fully processed"""
+        candidates = list(self._in_flight.values())
+        if self.chat_dispatcher:
+            oldest = self.chat_dispatcher.oldest_pending_update_id
+            if oldest is not None:
+                candidates.append(oldest)
+        return min(candidates) if candidates else self.offset
+
+    async def save_offset(self, force: bool = False):
+        """
+        Persist the processed watermark for the next start's catch-up.
+
+        Telegram has been told the fetched offset already: the watermark
+        keeps a restart from skipping unhandled updates Telegram still
+        holds, not from losing the in-flight ones it has dropped.
+        """
+        if not self.store:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_save < self.offset_save_interval:
+            return
+        offset = self.processed_offset()
+        if offset is None or offset == self._saved_offset:
+            return
+        self._last_save = now
+        try:
+            await self.store.aset(OFFSET_KEY, offset)
+            self._saved_offset = offset
+        except Exception as e:
+            logger.error(f"Failed to save updates offset: {e}")
+
+    async def fetch(self):
+        request_timeout = aiohttp.ClientTimeout(total=self.timeout + 10)
+        with self.bot.request_timeout(request_timeout):
+            return await self.bot.get_updates(
+                offset=self.offset,
+                limit=self.limit,
+                timeout=self.timeout,
+                allowed_updates=allowed_updates(),
+            )
+
+    async def run(self):
+        self._running = True
+        logger.info("Pipelined polling started")
+        while self._running:
+            if len(self._in_flight) >= self.max_in_flight:
+                # Back-pressure: let the oldest batches finish first
+                await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                updates = await self.fetch()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error while getting updates: {e}")
+                await asyncio.sleep(self.error_sleep)
+                continue
+
+            self.adapt(len(updates))
+            if updates:
+                self.offset = updates[-1].update_id + 1
+                self.fetched += len(updates)
+                self.batches += 1
+                self._schedule(updates)
+            await self.save_offset()
+
+        logger.info(
+            f"Pipelined polling stopped: fetched={self.fetched}, batches={self.batches}"
+        )
+
+    def stop(self):
+        self._running = False
+
+    async def wait_submitted(self):
+        """Wait for fetched batches to be handed to the dispatcher"""
+        if self._in_flight:
+            await asyncio.wait(set(self._in_flight))
+
+    async def wait_processed(self):
+        await self.wait_submitted()
+        if self.chat_dispatcher:
+            await self.chat_dispatcher.join()
+        await self.save_offset(force=True)
+
+
+async def serve_polling(
+    dispatcher: Dispatcher,
+    on_startup=None,
+    on_shutdown=None,
+    skip_updates=True,
+    chat_dispatcher: ChatShardedDispatcher = None,
+    catch_up=False,
+):
+    """Run pipelined polling until SIGINT/SIGTERM"""
+    Dispatcher.set_current(dispatcher)
+    Bot.set_current(dispatcher.bot)
+
+    stop_event = get_stop_event()
+    install_stop_signals(stop_event)
+
+    if on_startup:
+        await on_startup(dispatcher)
+    if chat_dispatcher:
+        chat_dispatcher.start()
+
+    poller = None
+    polling = None
+    try:
+        await dispatcher.reset_webhook(check=True)
+        offset = None
+        if catch_up:
+            offset = await BacklogCatchUp(dispatcher, chat_dispatcher).run()
+        elif skip_updates:
+            await dispatcher.skip_updates()
+
+        poller = PipelinedPoller(
+            dispatcher,
+            min_limit=runtime_config.POLLING_MIN_LIMIT,
+            max_limit=runtime_config.POLLING_MAX_LIMIT,
+            max_timeout=runtime_config.POLLING_TIMEOUT,
+            max_in_flight=runtime_config.POLLING_MAX_IN_FLIGHT,
+            chat_dispatcher=chat_dispatcher,
+            offset=offset,
+            store=state_store,
+        )
+        polling = asyncio.create_task(poller.run())
+        await stop_event.wait()
+    finally:
+        # Stop intake; on_shutdown drains what is already in flight
+        if poller:
+            poller.stop()
+            polling.cancel()
+            await asyncio.gather(polling, return_exceptions=True)
+            await poller.wait_submitted()
+        if on_shutdown:
+            await on_shutdown(dispatcher)
+        if chat_dispatcher:
+            await chat_dispatcher.close()
+        if poller:
+            # Abandoned updates stay above the saved offset, but Telegram
+            # was already told about them: the drain counts them, nothing redelivers them
+            await poller.save_offset(force=True)
@@ -0,0 +1,202 @@
+"""
+Reply strategy for participation comments in discussion groups.
+
+handle_new_users_in_groups used to answer every comment with its own
+message.reply(), one outbound call per comment, which runs into the group
+flood limit (20 messages/min) as soon as a giveaway gets busy. It now calls:
+
+    await reply_coalescer.success(message)
+    await reply_coalescer.already_participating(message)
+    await reply_coalescer.not_subscribed(message)
+
+While a group gets fewer than REPLY_STORM_THRESHOLD participation comments
+per REPLY_STORM_WINDOW seconds, every success gets its own reply as before.
+Above that, REPLY_STORM_MODE decides: "summary" collects the new
+participants and posts one message mentioning them every
+REPLY_SUMMARY_INTERVAL seconds, "silent" accepts them without a reply, and
+"reply" keeps replying to each. ALREADY_PARTICIPATING and NOT_SUBSCRIBED are
+sent to the same user at most once per REPLY_COOLDOWN seconds.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+
+import runtime_config
+from aiogram import types
+from lifecycle import DRAIN_HANDLERS, register_drain
+from texts import (
+    ALREADY_PARTICIPATING,
+    NOT_SUBSCRIBED,
+    PARTICIPATION_SUCCESS,
+    PARTICIPATION_SUMMARY,
+    PARTICIPATION_SUMMARY_MORE,
+)
+
+logger = logging.getLogger(__name__)
+
+STORM_MODES = ("summary", "silent", "reply")
+# Mentions per summary message; the rest are counted
+SUMMARY_MAX_MENTIONS = 30
+
+
+class ReplyCoalescer:
+    """Per-user replies when calm, summaries or silence during a storm"""
+
+    def __init__(
+        self,
+        storm_mode: str = "summary",
+        storm_threshold: int = 20,
+        storm_window: float = 60,
+        summary_interval: float = 30,
+        cooldown: float = 300,
+    ):
+        if storm_mode not in STORM_MODES:
+            logger.warning(f"Unknown reply storm mode '{storm_mode}', using 'summary'")
+            storm_mode = "summary"
+        self.storm_mode = storm_mode
+        self.storm_threshold = max(1, storm_threshold)
+        self.storm_window = storm_window
+        self.summary_interval = summary_interval
+        self.cooldown = cooldown
+
+        # chat_id -> times of the last storm_threshold participation comments
+        # (successes and failures alike)
+        self._recent = {}
+        # chat_id -> (bot, [mention, ...]) waiting for the next summary
+        self._summaries = {}
+        self._summary_tasks = {}
+        # (user_id, reply) -> cooldown end; insertion order is expiry order
+        self._cooldowns = OrderedDict()
+
+        self.replies = 0
+        self.summaries = 0
+        self.summarized = 0
+        self.silenced = 0
+        self.cooled_down = 0
+
+    def in_storm(self, chat_id, now: float = None) -> bool:
+        recent = self._recent.get(chat_id)
+        if recent is None or len(recent) < self.storm_threshold:
+            return False
+        now = time.monotonic() if now is None else now
+        return now - recent[0] < self.storm_window
+
+    def _record(self, chat_id) -> bool:
+        """Count a participation comment; True if the group is in a storm"""
+        now = time.monotonic()
+        recent = self._recent.get(chat_id)
+        if recent is None:
+            recent = self._recent[chat_id] = deque(maxlen=self.storm_threshold)
+        recent.append(now)
+        return self.in_storm(chat_id, now)
+
+    async def _reply(self, message: types.Message, text: str):
+        self.replies += 1
+        await message.reply(text)
+
+    # --- successes -------------------------------------------------------
+
+    async def success(self, message: types.Message):
+        chat_id = message.chat.id
+        if not self._record(chat_id) or self.storm_mode == "reply":
+            await self._reply(message, PARTICIPATION_SUCCESS)
+        elif self.storm_mode == "silent":
+            self.silenced += 1
+        else:
+            bot, mentions = self._summaries.setdefault(chat_id, (message.bot, []))
+            mentions.append(message.from_user.get_mention(as_html=True))
+            if chat_id not in self._summary_tasks:
+                self._summary_tasks[chat_id] = asyncio.get_running_loop().create_task(
+                    self._send_summary_later(chat_id)
+                )
+
+    async def _send_summary_later(self, chat_id):
+        try:
+            await asyncio.sleep(self.summary_interval)
+        finally:
+            self._summary_tasks.pop(chat_id, None)
+        await self.send_summary(chat_id)
+
+    async def send_summary(self, chat_id):
+        pending = self._summaries.pop(chat_id, None)
+        if not pending:
+            return
+        bot, mentions = pending
+        shown = ", ".join(mentions[:SUMMARY_MAX_MENTIONS])
+        if len(mentions) > SUMMARY_MAX_MENTIONS:
+            more = PARTICIPATION_SUMMARY_MORE.format(count=len(mentions) - SUMMARY_MAX_MENTIONS)
+            shown = f"{shown} {more}"
+        self.summaries += 1
+        self.summarized += len(mentions)
+        try:
+            await bot.send_message(
+                chat_id,
+                PARTICIPATION_SUMMARY.format(count=len(mentions), mentions=shown),
+                disable_web_page_preview=True,
+            )
+        except Exception as e:
+            logger.error(f"Failed to send participation summary to {chat_id}: {e}")
+
+    # --- failures --------------------------------------------------------
+
+    def _cooling_down(self, user_id, reply: str) -> bool:
+        now = time.monotonic()
+        while self._cooldowns:
+            key, until = next(iter(self._cooldowns.items()))
+            if until > now:
+                break
+            del self._cooldowns[key]
+        key = (user_id, reply)
+        if key in self._cooldowns:
+            self.cooled_down += 1
+            return True
+        self._cooldowns[key] = now + self.cooldown
+        return False
+
+    async def already_participating(self, message: types.Message):
+        self._record(message.chat.id)
+        if not self._cooling_down(message.from_user.id, "already_participating"):
+            await self._reply(message, ALREADY_PARTICIPATING)
+
+    async def not_subscribed(self, message: types.Message):
+        self._record(message.chat.id)
+        if not self._cooling_down(message.from_user.id, "not_subscribed"):
+            await self._reply(message, NOT_SUBSCRIBED)
+
+    # --- lifecycle -------------------------------------------------------
+
+    def stats(self) -> dict:
+        return {
+            "replies": self.replies,
+            "summaries": self.summaries,
+            "summarized": self.summarized,
+            "silenced": self.silenced,
+            "cooled_down": self.cooled_down,
+            "groups_in_storm": sum(1 for chat_id in self._recent if self.in_storm(chat_id)),
+        }
+
+    async def drain(self, timeout: float) -> dict:
+        """Post pending summaries now instead of after the interval"""
+        for task in list(self._summary_tasks.values()):
+            task.cancel()
+        self._summary_tasks.clear()
+        chats = list(self._summaries)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self.send_summary(chat_id) for chat_id in chats)), timeout
+            )
+        except asyncio.TimeoutError:
+            pass
+        return {"completed": len(chats) - len(self._summaries), "abandoned": len(self._summaries)}
+
+
+reply_coalescer = ReplyCoalescer(
+    storm_mode=runtime_config.REPLY_STORM_MODE,
+    storm_threshold=runtime_config.REPLY_STORM_THRESHOLD,
+    storm_window=runtime_config.REPLY_STORM_WINDOW,
+    summary_interval=runtime_config.REPLY_SUMMARY_INTERVAL,
+    cooldown=runtime_config.REPLY_COOLDOWN,
+)
+register_drain("reply summaries", reply_coalescer.drain, DRAIN_HANDLERS)
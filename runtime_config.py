@@ -0,0 +1,191 @@
+"""
+Runtime tuning options for update ingestion and the hot participation path.
+
+All values are read from the environment (.env is loaded if present) so the
+deployment can be tuned without touching the code.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_str(name, default=""):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip()
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_float(name, default):
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _env_bool(name, default):
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Update ingestion: "polling" (pipelined, default), "webhook" or "executor"
+# (aiogram's stock polling loop)
+BOT_MODE = _env_str("BOT_MODE", "polling").lower()
+
+# Webhook configuration
+WEBHOOK_URL = _env_str("WEBHOOK_URL")
+WEBHOOK_PATH = _env_str("WEBHOOK_PATH", "/webhook") or "/webhook"
+WEBAPP_HOST = _env_str("WEBAPP_HOST", "0.0.0.0")
+WEBAPP_PORT = _env_int("WEBAPP_PORT", 8080)
+WEBHOOK_MAX_CONNECTIONS = _env_int("WEBHOOK_MAX_CONNECTIONS", 40)
+# secret_token Telegram sends with every webhook request (empty: random per
+# start; required when the webhook is registered externally)
+WEBHOOK_SECRET = _env_str("WEBHOOK_SECRET")
+
+# Pipelined polling
+POLLING_MIN_LIMIT = _env_int("POLLING_MIN_LIMIT", 10)
+POLLING_MAX_LIMIT = _env_int("POLLING_MAX_LIMIT", 100)
+POLLING_TIMEOUT = _env_int("POLLING_TIMEOUT", 20)
+POLLING_MAX_IN_FLIGHT = _env_int("POLLING_MAX_IN_FLIGHT", 4)
+
+# Per-chat ordered update dispatcher
+UPDATE_WORKERS = _env_int("UPDATE_WORKERS", 32)
+UPDATE_QUEUE_LIMIT = _env_int("UPDATE_QUEUE_LIMIT", 10000)
+UPDATE_CHAT_QUEUE_LIMIT = _env_int("UPDATE_CHAT_QUEUE_LIMIT", 1000)
+
+# Drain updates queued while the bot was down instead of skipping them
+CATCH_UP_ON_START = _env_bool("CATCH_UP_ON_START", True)
+
+# SQLite file for process state that must survive restarts (update offset, ...)
+STATE_DB_PATH = _env_str("STATE_DB_PATH", "db.sqlite3") or "db.sqlite3"
+
+# Single-instance lease: a second instance waits as hot standby
+LEASE_ENABLED = _env_bool("LEASE_ENABLED", True)
+LEASE_TTL = _env_float("LEASE_TTL", 15.0)
+LEASE_HEARTBEAT = _env_float("LEASE_HEARTBEAT", 5.0)
+
+# FSM storage: "sqlite" (persistent, LRU write-back cache) or "memory"
+FSM_STORAGE = _env_str("FSM_STORAGE", "sqlite").lower()
+FSM_CACHE_SIZE = _env_int("FSM_CACHE_SIZE", 10000)
+FSM_IDLE_TTL = _env_float("FSM_IDLE_TTL", 600.0)
+FSM_STATE_TTL = _env_float("FSM_STATE_TTL", 7 * 24 * 3600.0)
+FSM_FLUSH_INTERVAL = _env_float("FSM_FLUSH_INTERVAL", 0.5)
+
+# Seconds to finish in-flight updates, sends and writes on shutdown
+SHUTDOWN_TIMEOUT = _env_float("SHUTDOWN_TIMEOUT", 10.0)
+
+# Logging: queued writes, rotation by size (bytes) and age (seconds), JSON lines
+LOG_LEVEL = _env_str("LOG_LEVEL", "INFO").upper() or "INFO"
+LOG_FILE = _env_str("LOG_FILE", "bot.log")
+LOG_MAX_BYTES = _env_int("LOG_MAX_BYTES", 10 * 1024 * 1024)
+LOG_MAX_AGE = _env_float("LOG_MAX_AGE", 24 * 3600.0)
+LOG_BACKUP_COUNT = _env_int("LOG_BACKUP_COUNT", 7)
+LOG_JSON = _env_bool("LOG_JSON", False)
+LOG_QUEUE_SIZE = _env_int("LOG_QUEUE_SIZE", 10000)
+# Share of INFO/DEBUG records kept per logger: "logger=0.1,other.logger=0.5"
+# One log file per process (LOG_FILE with the PID in its name), so the hot
+# standby does not rotate the file the active instance writes
+LOG_PER_INSTANCE = _env_bool("LOG_PER_INSTANCE", LEASE_ENABLED)
+LOG_SAMPLING = _env_str(
+    "LOG_SAMPLING",
+    "handlers.admin.functions_for_active_gives.handle_group_users=0.1,"
+    "handlers.admin.functions_for_active_gives.check_channels_subscriptions=0.1",
+)
+
+# Outbound pacing (Telegram limits): messages/s overall, per private chat and
+# per minute in a group or channel; flood-control retries
+OUTBOUND_GLOBAL_RATE = _env_float("OUTBOUND_GLOBAL_RATE", 30.0)
+OUTBOUND_PRIVATE_RATE = _env_float("OUTBOUND_PRIVATE_RATE", 1.0)
+OUTBOUND_GROUP_PER_MINUTE = _env_float("OUTBOUND_GROUP_PER_MINUTE", 20.0)
+OUTBOUND_GROUP_BURST = _env_float("OUTBOUND_GROUP_BURST", 3.0)
+OUTBOUND_MAX_RETRIES = _env_int("OUTBOUND_MAX_RETRIES", 3)
+OUTBOUND_MAX_RETRY_WAIT = _env_float("OUTBOUND_MAX_RETRY_WAIT", 60.0)
+# Seconds a reply into the update's own group may wait before it is sent in
+# the background (only replies sent under outbound_detached()), background
+# replies kept per group before dropping more
+OUTBOUND_GROUP_MAX_WAIT = _env_float("OUTBOUND_GROUP_MAX_WAIT", 1.0)
+OUTBOUND_GROUP_MAX_QUEUE = _env_int("OUTBOUND_GROUP_MAX_QUEUE", 20)
+
+# Shared HTTP connection pool for the Bot API (seconds for timeouts and TTLs)
+HTTP_POOL_LIMIT = _env_int("HTTP_POOL_LIMIT", 100)
+HTTP_POOL_LIMIT_PER_HOST = _env_int("HTTP_POOL_LIMIT_PER_HOST", 64)
+HTTP_KEEPALIVE_TIMEOUT = _env_float("HTTP_KEEPALIVE_TIMEOUT", 30.0)
+HTTP_DNS_CACHE_TTL = _env_int("HTTP_DNS_CACHE_TTL", 300)
+HTTP_CONNECT_TIMEOUT = _env_float("HTTP_CONNECT_TIMEOUT", 10.0)
+HTTP_REQUEST_TIMEOUT = _env_float("HTTP_REQUEST_TIMEOUT", 60.0)
+# Retries of idempotent calls (get*, webhook setup) on network errors
+HTTP_RETRIES = _env_int("HTTP_RETRIES", 2)
+
+# Seconds a comment post that belongs to no giveaway is remembered as such
+ROUTING_NEGATIVE_TTL = _env_float("ROUTING_NEGATIVE_TTL", 60.0)
+
+# Write-behind participant buffer: flush every N seconds or M rows, journal
+# file replayed after a crash (empty: no journal)
+PARTICIPANT_FLUSH_INTERVAL = _env_float("PARTICIPANT_FLUSH_INTERVAL", 0.05)
+PARTICIPANT_FLUSH_ROWS = _env_int("PARTICIPANT_FLUSH_ROWS", 200)
+PARTICIPANT_JOURNAL = _env_str("PARTICIPANT_JOURNAL", "participants.journal")
+
+# Participation replies: above THRESHOLD comments per WINDOW seconds in a
+# group, "summary" (one message every SUMMARY_INTERVAL s), "silent" or "reply";
+# seconds between repeated ALREADY_PARTICIPATING/NOT_SUBSCRIBED to one user
+REPLY_STORM_MODE = _env_str("REPLY_STORM_MODE", "summary").lower()
+REPLY_STORM_THRESHOLD = _env_int("REPLY_STORM_THRESHOLD", 20)
+REPLY_STORM_WINDOW = _env_float("REPLY_STORM_WINDOW", 60.0)
+REPLY_SUMMARY_INTERVAL = _env_float("REPLY_SUMMARY_INTERVAL", 30.0)
+REPLY_COOLDOWN = _env_float("REPLY_COOLDOWN", 300.0)
+
+# Channel subscription cache: entries, seconds a subscribed / not subscribed
+# status is trusted
+SUBSCRIPTION_CACHE_SIZE = _env_int("SUBSCRIPTION_CACHE_SIZE", 50000)
+SUBSCRIPTION_POSITIVE_TTL = _env_float("SUBSCRIPTION_POSITIVE_TTL", 300.0)
+SUBSCRIPTION_NEGATIVE_TTL = _env_float("SUBSCRIPTION_NEGATIVE_TTL", 30.0)
+# getChatMember requests in flight at once (channels are checked concurrently)
+SUBSCRIPTION_CHECK_CONCURRENCY = _env_int("SUBSCRIPTION_CHECK_CONCURRENCY", 16)
+
+# Request chat_member updates and answer subscription checks from them,
+# seconds a status learned that way is trusted
+MEMBERSHIP_UPDATES = _env_bool("MEMBERSHIP_UPDATES", True)
+MEMBERSHIP_TTL = _env_float("MEMBERSHIP_TTL", 604800.0)
+
+# "Verify later" giveaways: pending participants checked per round, seconds
+# between rounds, participants checked at once, extra passes over undecided
+# participants before a draw, share of participants still undecided above
+# which the draw is refused
+DEFERRED_VERIFY_BATCH = _env_int("DEFERRED_VERIFY_BATCH", 50)
+DEFERRED_VERIFY_INTERVAL = _env_float("DEFERRED_VERIFY_INTERVAL", 2.0)
+DEFERRED_VERIFY_CONCURRENCY = _env_int("DEFERRED_VERIFY_CONCURRENCY", 4)
+DEFERRED_DRAW_RETRIES = _env_int("DEFERRED_DRAW_RETRIES", 3)
+DEFERRED_DRAW_MAX_UNDECIDED = _env_float("DEFERRED_DRAW_MAX_UNDECIDED", 0.2)
+
+# Optional MTProto member snapshots of big sponsor channels: Pyrogram session
+# string of a user who is admin in them (empty: off) with its api_id/api_hash,
+# snapshot directory, seconds between refreshes, smallest channel worth one
+MTPROTO_API_ID = _env_int("MTPROTO_API_ID", 0)
+MTPROTO_API_HASH = _env_str("MTPROTO_API_HASH", "")
+MEMBER_SNAPSHOT_SESSION = _env_str("MEMBER_SNAPSHOT_SESSION", "")
+MEMBER_SNAPSHOT_DIR = _env_str("MEMBER_SNAPSHOT_DIR", "member_snapshots")
+MEMBER_SNAPSHOT_REFRESH = _env_float("MEMBER_SNAPSHOT_REFRESH", 600.0)
+MEMBER_SNAPSHOT_MIN_MEMBERS = _env_int("MEMBER_SNAPSHOT_MIN_MEMBERS", 1000)
+
+# Subscription lookups failing in a row before a channel fails fast, seconds
+# between probes of such a channel
+CHANNEL_BREAKER_THRESHOLD = _env_int("CHANNEL_BREAKER_THRESHOLD", 5)
+CHANNEL_BREAKER_PROBE_INTERVAL = _env_float("CHANNEL_BREAKER_PROBE_INTERVAL", 60.0)
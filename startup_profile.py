@@ -0,0 +1,73 @@
+"""
+Cold-start profiling for app.py (--profile-startup).
+
+Records how long each startup phase took, when it started relative to the
+process and how many modules it imported, and prints a report once the bot
+is ready to receive updates. Import it before anything heavy: its import
+time is the reference point of the report.
+"""
+
+import contextlib
+import logging
+import sys
+import time
+
+STARTED_AT = time.perf_counter()
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """Collects startup phases; a no-op unless enabled"""
+
+    def __init__(self, enabled: bool = False, started_at: float = STARTED_AT):
+        self.enabled = enabled
+        self.started_at = started_at
+        self.phases = []
+        self.ready_at = None
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Time a block (sync, or around awaits inside a coroutine)"""
+        modules_before = len(sys.modules)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                {
+                    "name": name,
+                    "start": started - self.started_at,
+                    "duration": time.perf_counter() - started,
+                    "modules": len(sys.modules) - modules_before,
+                }
+            )
+
+    async def timed(self, name: str, awaitable):
+        """Await something as a phase; lets concurrent phases be timed separately"""
+        with self.phase(name):
+            return await awaitable
+
+    def mark_ready(self):
+        if self.ready_at is None:
+            self.ready_at = time.perf_counter()
+            if self.enabled:
+                self.print_report()
+
+    def report(self) -> str:
+        total = (self.ready_at or time.perf_counter()) - self.started_at
+        lines = [
+            "Startup profile (seconds since app start)",
+            f"{'phase':<28}{'start':>9}{'duration':>10}{'modules':>9}",
+        ]
+        for phase in self.phases:
+            lines.append(
+                f"{phase['name']:<28}{phase['start']:>9.3f}{phase['duration']:>10.3f}"
+                f"{phase['modules']:>9}"
+            )
+        lines.append(f"{'ready':<28}{total:>9.3f}")
+        lines.append(f"{len(sys.modules)} modules loaded in total")
+        return "\n".join(lines)
+
+    def print_report(self):
+        logger.info("\n" + self.report())
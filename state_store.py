@@ -0,0 +1,88 @@
+"""
+Small key/value store for process state that has to survive restarts
+(update offsets and similar bookkeeping).
+
+Backed by a SQLite table in STATE_DB_PATH. Calls are cheap single-row
+statements; the async helpers run them in a worker thread so the event loop
+never waits on disk.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+import runtime_config
+
+logger = logging.getLogger(__name__)
+
+
+class StateStore:
+    """Thread-safe SQLite key/value table"""
+
+    def __init__(self, path: str = None):
+        self.path = path or runtime_config.STATE_DB_PATH
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, timeout=10, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS bot_state ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+        return self._connection
+
+    def execute(self, sql: str, params=()):
+        """Run a statement under the store lock and return all rows"""
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def transaction(self, func):
+        """Run func(connection) inside BEGIN IMMEDIATE ... COMMIT"""
+        with self._lock:
+            connection = self.connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = func(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+    def get(self, key: str, default=None):
+        rows = self.execute("SELECT value FROM bot_state WHERE key = ?", (key,))
+        if not rows:
+            return default
+        return json.loads(rows[0][0])
+
+    def set(self, key: str, value):
+        self.execute(
+            "INSERT INTO bot_state (key, value, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+            "updated_at = excluded.updated_at",
+            (key, json.dumps(value), time.time()),
+        )
+
+    async def aget(self, key: str, default=None):
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value):
+        await asyncio.to_thread(self.set, key, value)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+state_store = StateStore()
@@ -0,0 +1,314 @@
+"""
+Cache of channel subscription statuses.
+
+check_single_channel_subscription and get_user_channel_status asked
+bot.get_chat_member every time (80-130ms each), although the same user
+comments several times and several giveaways require the same sponsor
+channels. Statuses now live in a bounded LRU keyed by (channel_id, user_id):
+subscribed statuses for positive_ttl, "not subscribed" for the much shorter
+negative_ttl, so a user who subscribes after the NOT_SUBSCRIBED reply gets
+in on the next try. Errors are never cached. Concurrent lookups of the same
+key share one request. Users known to membership_index (chat_member
+updates) are answered from there first.
+
+The functions in check_channels_subscriptions delegate here:
+
+    status = await subscription_cache.get_status(channel_id, user_id)
+    subscribed = await subscription_cache.is_subscribed(channel_id, user_id)
+    # All of a giveaway's sponsor channels at once
+    eligible = await subscription_cache.is_subscribed_to_all(channel_ids, user_id)
+    # ...or why not, to pick the reply
+    status = await subscription_cache.check_all(channel_ids, user_id)
+    if status == CHANNEL_UNAVAILABLE_STATUS:
+        await message.reply(CHANNEL_UNAVAILABLE)
+
+At most max_concurrency getChatMember requests run at a time. Lookups that
+fail because of the channel itself (chat not found, bot not an admin) answer
+CHANNEL_ERROR_STATUS; channels where those keep coming are answered with
+CHANNEL_UNAVAILABLE_STATUS without a request while channel_breaker has them
+open. Transient failures (timeouts, flood control) answer ERROR_STATUS and
+do not count against the channel.
+
+OWNERS can empty the cache with /flush_subscriptions.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+import runtime_config
+from aiogram import Bot, types
+from aiogram.utils import exceptions
+from texts import SUBSCRIPTION_CACHE_FLUSHED
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBED_STATUSES = {"member", "administrator", "creator"}
+NOT_SUBSCRIBED_STATUSES = {"left", "kicked", "restricted"}
+# get_user_channel_status's answer when Telegram could not tell
+ERROR_STATUS = "error"
+# Telegram could not tell because of the channel (deleted, bot not admin)
+CHANNEL_ERROR_STATUS = "channel_error"
+# The channel's lookups keep failing (channel_breaker): not even asked
+CHANNEL_UNAVAILABLE_STATUS = "channel_unavailable"
+FAILED_STATUSES = {ERROR_STATUS, CHANNEL_ERROR_STATUS, CHANNEL_UNAVAILABLE_STATUS}
+
+# getChatMember errors that mean the channel itself is misconfigured
+CHANNEL_ERRORS = (
+    exceptions.ChatNotFound,
+    exceptions.BotKicked,
+    exceptions.ChatAdminRequired,
+    exceptions.NeedAdministratorRightsInTheChannel,
+    exceptions.UnavailableMembers,
+)
+CHANNEL_ERROR_MESSAGES = ("member list is inaccessible", "bot is not a member")
+
+
+async def _fetch_status(channel_id, user_id) -> str:
+    try:
+        member = await Bot.get_current().get_chat_member(channel_id, user_id)
+    except Exception as e:
+        error = str(e).lower()
+        if "member not found" in error:
+            return "left"
+        logger.warning(f"Cannot get status of user {user_id} in channel {channel_id}: {e}")
+        if isinstance(e, CHANNEL_ERRORS) or any(text in error for text in CHANNEL_ERROR_MESSAGES):
+            return CHANNEL_ERROR_STATUS
+        return ERROR_STATUS
+    return member.status
+
+
+class SubscriptionCache:
+    """LRU + TTL cache of get_chat_member statuses"""
+
+    def __init__(
+        self,
+        fetch_status=_fetch_status,
+        max_entries: int = 50000,
+        positive_ttl: float = 300,
+        negative_ttl: float = 30,
+        max_concurrency: int = 16,
+    ):
+        self._fetch_status = fetch_status
+        self.max_entries = max_entries
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+
+        # (channel_id, user_id) -> (status, expires_at); least recent first
+        self._entries = OrderedDict()
+        # key -> [request future, callers waiting for it]
+        self._inflight = {}
+        self._limit = asyncio.Semaphore(max_concurrency)
+        # Authoritative statuses from chat_member updates (membership_index)
+        self.index = None
+        # Members of big channels fetched over MTProto (member_snapshot)
+        self.snapshots = None
+        # Fails lookups in channels that keep erroring fast (channel_breaker)
+        self.breaker = None
+
+        self.hits = 0
+        self.misses = 0
+        self.collapsed = 0
+        self.errors = 0
+        self.early_exits = 0
+        self.index_hits = 0
+        self.snapshot_hits = 0
+
+    def _ttl(self, status: str) -> float:
+        if status in FAILED_STATUSES:
+            return 0
+        return self.positive_ttl if status in SUBSCRIBED_STATUSES else self.negative_ttl
+
+    def _store(self, key, status: str):
+        ttl = self._ttl(status)
+        if ttl <= 0:
+            return
+        self._entries[key] = (status, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _fetch(self, key):
+        channel_id = key[0]
+        breaker = self.breaker
+        if breaker is not None and not breaker.allow(channel_id):
+            return CHANNEL_UNAVAILABLE_STATUS
+        try:
+            async with self._limit:
+                status = await self._fetch_status(*key)
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.abandon(channel_id)
+            raise
+        if status in FAILED_STATUSES:
+            self.errors += 1
+        if breaker is not None:
+            if status == CHANNEL_ERROR_STATUS:
+                breaker.failure(channel_id)
+            elif status == ERROR_STATUS:
+                # Says nothing about the channel: a probe may go again
+                breaker.abandon(channel_id)
+            else:
+                breaker.success(channel_id)
+        self._store(key, status)
+        return status
+
+    def _cached(self, key):
+        if self.index is not None:
+            status = self.index.lookup(*key)
+            if status is not None:
+                self.index_hits += 1
+                return status
+        entry = self._entries.get(key)
+        if entry is not None:
+            status, expires_at = entry
+            if expires_at > time.monotonic():
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return status
+            del self._entries[key]
+        if self.snapshots is not None and self.snapshots.contains(*key):
+            # A snapshot only vouches for members; anyone else is asked
+            self.snapshot_hits += 1
+            return "member"
+        return None
+
+    def _forget(self, key, future):
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] is future:
+            del self._inflight[key]
+
+    async def get_status(self, channel_id, user_id) -> str:
+        key = (channel_id, user_id)
+        status = self._cached(key)
+        if status is not None:
+            return status
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.misses += 1
+            future = asyncio.ensure_future(self._fetch(key))
+            inflight = self._inflight[key] = [future, 0]
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.collapsed += 1
+        future = inflight[0]
+        inflight[1] += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            inflight[1] -= 1
+            if not future.done() and not inflight[1]:
+                # Every caller gave up (e.g. another channel already failed)
+                future.cancel()
+
+    async def is_subscribed(self, channel_id, user_id) -> bool:
+        return await self.get_status(channel_id, user_id) in SUBSCRIBED_STATUSES
+
+    async def is_subscribed_to_all(self, channel_ids, user_id) -> bool:
+        """Whether the user is subscribed to every channel"""
+        return await self.check_all(channel_ids, user_id) in SUBSCRIBED_STATUSES
+
+    async def check_all(self, channel_ids, user_id) -> str:
+        """
+        "member" if the user is subscribed to every channel, otherwise the
+        status of the first channel found that is not: a not-subscribed
+        status, or one of FAILED_STATUSES when the check itself failed.
+
+        Cached answers are used first; the remaining channels are checked
+        concurrently, and the first channel that is not subscribed (or fails)
+        ends the check and cancels the requests still running.
+        """
+        missing = []
+        for channel_id in channel_ids:
+            status = self._cached((channel_id, user_id))
+            if status is None:
+                missing.append(channel_id)
+            elif status not in SUBSCRIBED_STATUSES:
+                self.early_exits += 1
+                return status
+        if not missing:
+            return "member"
+        if len(missing) == 1:
+            status = await self.get_status(missing[0], user_id)
+            return "member" if status in SUBSCRIBED_STATUSES else status
+
+        pending = {
+            asyncio.ensure_future(self.get_status(channel_id, user_id)) for channel_id in missing
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result() not in SUBSCRIBED_STATUSES:
+                        if pending:
+                            self.early_exits += 1
+                        return task.result()
+            return "member"
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def set_status(self, channel_id, user_id, status: str):
+        """Record a status learned elsewhere (e.g. a chat_member update)"""
+        self._store((channel_id, user_id), status)
+
+    def invalidate(self, channel_id, user_id):
+        self._entries.pop((channel_id, user_id), None)
+
+    def flush(self) -> int:
+        """Drop every cached status; returns how many there were"""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def stats(self) -> dict:
+        lookups = self.index_hits + self.snapshot_hits + self.hits + self.misses + self.collapsed
+        return {
+            "size": len(self._entries),
+            "index_hits": self.index_hits,
+            "snapshot_hits": self.snapshot_hits,
+            "hits": self.hits,
+            "misses": self.misses,
+            "collapsed": self.collapsed,
+            "errors": self.errors,
+            "early_exits": self.early_exits,
+            "hit_rate": (
+                round((self.index_hits + self.snapshot_hits + self.hits + self.collapsed) / lookups, 3)
+                if lookups
+                else 0.0
+            ),
+        }
+
+
+subscription_cache = SubscriptionCache(
+    max_entries=runtime_config.SUBSCRIPTION_CACHE_SIZE,
+    positive_ttl=runtime_config.SUBSCRIPTION_POSITIVE_TTL,
+    negative_ttl=runtime_config.SUBSCRIPTION_NEGATIVE_TTL,
+    max_concurrency=runtime_config.SUBSCRIPTION_CHECK_CONCURRENCY,
+)
+
+
+async def flush_subscriptions_command(message: types.Message):
+    stats = subscription_cache.stats()
+    flushed = subscription_cache.flush()
+    await message.answer(
+        SUBSCRIPTION_CACHE_FLUSHED.format(
+            flushed=flushed, hits=stats["hits"], misses=stats["misses"], hit_rate=stats["hit_rate"]
+        )
+    )
+
+
+def register_admin_commands(dp):
+    """/flush_subscriptions for OWNERS in private chats"""
+    from config import OWNERS
+
+    dp.register_message_handler(
+        flush_subscriptions_command,
+        lambda m: m.chat.type == types.ChatType.PRIVATE and m.from_user.id in OWNERS,
+        commands=["flush_subscriptions"],
+        state="*",
+    )
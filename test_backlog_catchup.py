@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test for backlog catch-up on startup
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _keyword(message):
+    return "участвую" in message.text.lower()
+
+
+async def _drain_backlog(store_path):
+    from aiogram import Bot, Dispatcher, types
+    from aiogram.bot import api
+    from catchup import OFFSET_KEY, BacklogCatchUp
+    from fake_telegram import FAKE_TOKEN, FakeTelegramServer, make_comment_update
+    from state_store import StateStore
+    from update_dispatcher import ChatShardedDispatcher
+
+    backlog = [make_comment_update(i + 1, 100 + i) for i in range(250)]
+    # The same users commenting again on the same post
+    backlog += [make_comment_update(251 + i, 100 + i) for i in range(50)]
+    server = FakeTelegramServer(backlog)
+    await server.start()
+    original_url = api.API_URL
+    api.API_URL = server.api_url
+
+    bot = Bot(token=FAKE_TOKEN)
+    dp = Dispatcher(bot)
+    handled = []
+
+    @dp.message_handler(content_types=types.ContentTypes.TEXT)
+    async def on_comment(message: types.Message):
+        handled.append(message.from_user.id)
+
+    store = StateStore(store_path)
+    chat_dispatcher = ChatShardedDispatcher(dp, workers=4)
+    try:
+        offset = await BacklogCatchUp(dp, chat_dispatcher, store, is_participation=_keyword).run()
+        assert offset == 301
+        assert store.get(OFFSET_KEY) == 301
+        assert sorted(handled) == list(range(100, 350))
+
+        # A restart resumes from the persisted offset and replays nothing
+        handled.clear()
+        offset = await BacklogCatchUp(dp, chat_dispatcher, store, is_participation=_keyword).run()
+        assert offset == 301
+        assert handled == []
+        assert server.calls["getUpdates"] == 5
+    finally:
+        await chat_dispatcher.close()
+        store.close()
+        await bot.close()
+        await server.stop()
+        api.API_URL = original_url
+
+
+def test_catch_up_drains_and_deduplicates():
+    """Backlog is drained once, repeated comments collapse, offset persists"""
+    print("🧪 Testing backlog catch-up...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_drain_backlog(os.path.join(tmp, "state.sqlite3")))
+    print("✅ Backlog drained with dedupe and persisted offset")
+
+
+def test_only_participation_comments_collapse():
+    """A question before the keyword comment does not swallow the participation"""
+    print("🧪 Testing comment deduplication...")
+    from aiogram import types
+    from catchup import BacklogCatchUp
+    from fake_telegram import make_comment_update
+
+    async def _scenario():
+        catch_up = BacklogCatchUp(
+            SimpleNamespace(bot=None), store=object(), is_participation=_keyword
+        )
+        raw = [
+            make_comment_update(1, 100, text="nice giveaway, how do I join?"),
+            make_comment_update(2, 100, text="Участвую"),
+            make_comment_update(3, 100, text="Участвую!!"),
+            make_comment_update(4, 100, text="thanks"),
+            make_comment_update(2, 100, text="Участвую"),
+        ]
+        first = await catch_up.deduplicate([types.Update.to_object(u) for u in raw[:2]])
+        rest = await catch_up.deduplicate([types.Update.to_object(u) for u in raw[2:]])
+        kept = [update.message.text for update in first + rest]
+        assert kept == ["nice giveaway, how do I join?", "Участвую", "thanks"], kept
+        assert catch_up.duplicates == 2
+
+    asyncio.run(_scenario())
+    print("✅ Only repeated participation comments were dropped")
+
+
+def main():
+    """Run catch-up tests"""
+    print("🚀 BACKLOG CATCH-UP TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Backlog catch-up", test_catch_up_drains_and_deduplicates),
+        ("Comment deduplication", test_only_participation_comments_collapse),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Test for the per-channel circuit breaker of subscription lookups
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+BROKEN = -1001
+HEALTHY = -1002
+
+
+def _setup(threshold=3, probe_interval=0.05):
+    from channel_breaker import ChannelBreaker
+    from subscription_cache import CHANNEL_ERROR_STATUS, SubscriptionCache
+
+    alerts = []
+    calls = []
+    broken = {BROKEN}
+
+    async def notify(text):
+        alerts.append(text)
+
+    async def fetch_status(channel_id, user_id):
+        calls.append(channel_id)
+        await asyncio.sleep(0)
+        return CHANNEL_ERROR_STATUS if channel_id in broken else "member"
+
+    breaker = ChannelBreaker(threshold, probe_interval, notify=notify)
+    cache = SubscriptionCache(fetch_status=fetch_status)
+    cache.breaker = breaker
+    return cache, breaker, alerts, calls, broken
+
+
+def test_opens_and_fails_fast():
+    """After consecutive failures the channel is not asked any more"""
+    print("🧪 Testing breaker opening...")
+    from subscription_cache import CHANNEL_ERROR_STATUS, CHANNEL_UNAVAILABLE_STATUS
+
+    async def _scenario():
+        cache, breaker, alerts, calls, broken = _setup()
+        for user_id in range(3):
+            assert await cache.get_status(BROKEN, user_id) == CHANNEL_ERROR_STATUS
+        assert breaker.is_open(BROKEN)
+
+        for user_id in range(3, 103):
+            assert await cache.get_status(BROKEN, user_id) == CHANNEL_UNAVAILABLE_STATUS
+            assert await cache.is_subscribed(HEALTHY, user_id)
+        assert calls.count(BROKEN) == 3
+        assert not await cache.is_subscribed_to_all([HEALTHY, BROKEN], 500)
+        # The caller learns why, to answer the participant accordingly
+        assert await cache.check_all([HEALTHY, BROKEN], 501) == CHANNEL_UNAVAILABLE_STATUS
+        assert await cache.check_all([BROKEN], 502) == CHANNEL_UNAVAILABLE_STATUS
+        await asyncio.sleep(0)
+
+        assert len(alerts) == 1 and str(BROKEN) in alerts[0]
+        stats = breaker.stats()
+        assert stats["open_channels"] == [BROKEN] and stats["fast_fails"] >= 100
+        assert not breaker.is_open(HEALTHY)
+        print(f"✅ One alert, {stats['fast_fails']} lookups failed fast")
+
+    asyncio.run(_scenario())
+
+
+def test_success_resets_failures():
+    """Failures must be consecutive to open the breaker"""
+    print("🧪 Testing non-consecutive failures...")
+
+    async def _scenario():
+        cache, breaker, alerts, calls, broken = _setup()
+        for round_ in range(5):
+            broken.add(BROKEN)
+            await cache.get_status(BROKEN, round_ * 10)
+            await cache.get_status(BROKEN, round_ * 10 + 1)
+            broken.discard(BROKEN)
+            await cache.get_status(BROKEN, round_ * 10 + 2)
+        assert not breaker.is_open(BROKEN) and not alerts
+        print("✅ Intermittent failures kept the breaker closed")
+
+    asyncio.run(_scenario())
+
+
+def test_transient_errors_do_not_count():
+    """Timeouts and flood control say nothing about the channel"""
+    print("🧪 Testing transient errors...")
+    from subscription_cache import ERROR_STATUS
+
+    async def _scenario():
+        cache, breaker, alerts, calls, broken = _setup()
+
+        async def flaky(channel_id, user_id):
+            calls.append(channel_id)
+            return ERROR_STATUS
+
+        cache._fetch_status = flaky
+        for user_id in range(20):
+            assert await cache.get_status(BROKEN, user_id) == ERROR_STATUS
+        assert not breaker.is_open(BROKEN) and not alerts
+        assert await cache.check_all([HEALTHY, BROKEN], 99) == ERROR_STATUS
+        print("✅ 20 transient errors kept the breaker closed")
+
+    asyncio.run(_scenario())
+
+
+def test_probes_and_recovery():
+    """An open channel is probed periodically and closes on success"""
+    print("🧪 Testing probes and recovery...")
+    from subscription_cache import CHANNEL_ERROR_STATUS, CHANNEL_UNAVAILABLE_STATUS
+
+    async def _scenario():
+        cache, breaker, alerts, calls, broken = _setup()
+        for user_id in range(3):
+            await cache.get_status(BROKEN, user_id)
+
+        await asyncio.sleep(0.06)
+        # One probe goes through, the concurrent lookups still fail fast
+        statuses = await asyncio.gather(*(cache.get_status(BROKEN, 10 + i) for i in range(5)))
+        assert statuses.count(CHANNEL_ERROR_STATUS) == 1
+        assert statuses.count(CHANNEL_UNAVAILABLE_STATUS) == 4
+        assert breaker.is_open(BROKEN) and calls.count(BROKEN) == 4
+        assert await cache.get_status(BROKEN, 20) == CHANNEL_UNAVAILABLE_STATUS
+
+        # The bot is made admin again: the next probe closes the breaker
+        broken.clear()
+        await asyncio.sleep(0.06)
+        assert await cache.get_status(BROKEN, 21) == "member"
+        assert not breaker.is_open(BROKEN)
+        assert await cache.get_status(BROKEN, 22) == "member"
+        await asyncio.sleep(0)
+
+        assert len(alerts) == 2 and str(BROKEN) in alerts[1]
+        assert breaker.stats()["probes"] == 2 and breaker.stats()["incidents"] == 1
+        print(f"✅ Recovered after probing: {breaker.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def test_cancelled_probe_is_released():
+    """A probe whose caller gave up does not block the next probe"""
+    print("🧪 Testing cancelled probes...")
+
+    async def _scenario():
+        cache, breaker, alerts, calls, broken = _setup(probe_interval=0)
+        for user_id in range(3):
+            await cache.get_status(BROKEN, user_id)
+
+        async def hanging(channel_id, user_id):
+            await asyncio.sleep(10)
+
+        cache._fetch_status = hanging
+        probe = asyncio.ensure_future(cache.get_status(BROKEN, 10))
+        await asyncio.sleep(0.01)
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert not breaker._open[BROKEN].probing
+        assert breaker.allow(BROKEN)
+        print("✅ Cancelled probe released")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run channel breaker tests"""
+    print("🚀 CHANNEL BREAKER TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Opens and fails fast", test_opens_and_fails_fast),
+        ("Success resets failures", test_success_resets_failures),
+        ("Transient errors", test_transient_errors_do_not_count),
+        ("Probes and recovery", test_probes_and_recovery),
+        ("Cancelled probe", test_cancelled_probe_is_released),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
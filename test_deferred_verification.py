@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Test for the deferred ("verify later") subscription check
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = {"give_a": [-1001, -1002], "give_b": [-1003]}
+
+
+class FakeCache:
+    """Statuses by (channel_id, user_id); unknown users are members"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.lookups = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_status(self, channel_id, user_id):
+        self.lookups += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        status = self.statuses.get((channel_id, user_id), "member")
+        # A list is answered one item per lookup, the last one from then on
+        if isinstance(status, list):
+            return status.pop(0) if len(status) > 1 else status[0]
+        return status
+
+
+class FakeGiveaways:
+    """Running verify-later giveaways"""
+
+    def __init__(self, running=("give_a", "give_b")):
+        self.callback_values = set(running)
+
+    def running(self):
+        return list(self.callback_values)
+
+
+async def _open(tmp, statuses, batch_size=50, **kwargs):
+    from deferred_verification import DeferredVerifier
+    from participant_buffer import ParticipantBuffer
+    from participant_sets import ParticipantSets
+    from participant_store import ParticipantStore
+    from tortoise.backends.sqlite.client import SqliteClient
+
+    db = SqliteClient(file_path=":memory:", connection_name="participants")
+    await db.create_connection(with_db=True)
+
+    async def load_members(callback_value):
+        rows = await db.execute_query_dict(
+            "SELECT user_id FROM participant WHERE giveaway_callback_value = ?", [callback_value]
+        )
+        return [row["user_id"] for row in rows]
+
+    sets = ParticipantSets(load_all_members=None, load_members=load_members)
+    store = ParticipantStore(get_db=lambda: db, sets=sets)
+    await store.create_table()
+    buffer = ParticipantBuffer(store, sets, os.path.join(tmp, "journal"), flush_interval=3600)
+
+    async def load_channels(callback_value):
+        return CHANNELS[callback_value]
+
+    cache = FakeCache(statuses)
+    verifier = DeferredVerifier(
+        store,
+        buffer,
+        cache,
+        load_channels,
+        FakeGiveaways(),
+        batch_size=batch_size,
+        interval=0.01,
+        retry_delay=0.01,
+        **kwargs,
+    )
+    return db, store, buffer, cache, verifier
+
+
+def test_background_verification():
+    """Pending participants are decided in batches without blocking joins"""
+    print("🧪 Testing background verification...")
+    from participant_store import ELIGIBLE, INELIGIBLE, PENDING
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            statuses = {(-1002, 3): "left", (-1003, 4): "kicked"}
+            db, store, buffer, cache, verifier = await _open(tmp, statuses, batch_size=4)
+            for user_id in range(6):
+                await store.append("give_a", user_id, status=PENDING)
+            await store.append("give_b", 4, status=PENDING)
+            # Joins without verify-later are eligible straight away
+            await store.append("give_b", 100)
+            assert cache.lookups == 0
+
+            assert await verifier.run_once() == 4
+            assert len(await store.pending()) == 3
+            verifier.start()
+            await asyncio.sleep(0.1)
+            await verifier.drain(1.0)
+
+            assert not await store.pending()
+            assert await store.count("give_a", ELIGIBLE) == 5
+            assert await store.count("give_a", INELIGIBLE) == 1
+            assert await store.count("give_b", ELIGIBLE) == 1
+            assert await store.count("give_b", INELIGIBLE) == 1
+            assert verifier.stats()["ineligible"] == 2
+            await db.close()
+            print(f"✅ Verified in the background: {verifier.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def test_errors_stay_pending():
+    """A participant Telegram could not check is retried, not rejected"""
+    print("🧪 Testing errors during verification...")
+    from participant_store import ELIGIBLE, INELIGIBLE, PENDING
+    from subscription_cache import ERROR_STATUS
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            # User 3 left one channel, so the error on the other does not matter
+            statuses = {(-1001, 1): ERROR_STATUS, (-1001, 3): ERROR_STATUS, (-1002, 3): "left"}
+            db, store, buffer, cache, verifier = await _open(tmp, statuses)
+            await store.append("give_a", 1, status=PENDING)
+            await store.append("give_a", 2, status=PENDING)
+            await store.append("give_a", 3, status=PENDING)
+
+            assert await verifier.run_once() == 2
+            assert await store.count("give_a", INELIGIBLE) == 1
+            pending = await store.pending()
+            assert [row["user_id"] for row in pending] == [1]
+            assert verifier.stats()["retried"] == 1
+
+            del statuses[(-1001, 1)]
+            assert await verifier.run_once() == 1
+            assert await store.count("give_a", ELIGIBLE) == 2
+            await db.close()
+            print("✅ Failed check kept the participant pending until it succeeded")
+
+    asyncio.run(_scenario())
+
+
+def test_undecided_rows_do_not_stall():
+    """Rows that stay undecided are paged past; finished giveaways are skipped"""
+    print("🧪 Testing rounds past undecided participants...")
+    from participant_store import ELIGIBLE, PENDING
+    from subscription_cache import CHANNEL_UNAVAILABLE_STATUS, ERROR_STATUS
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            statuses = {(-1001, 1): ERROR_STATUS, (-1001, 2): CHANNEL_UNAVAILABLE_STATUS}
+            db, store, buffer, cache, verifier = await _open(tmp, statuses, batch_size=2)
+            for user_id in (1, 2, 10, 11, 12):
+                await store.append("give_a", user_id, status=PENDING)
+            await store.append("give_old", 5, status=PENDING)
+            verifier.giveaways.callback_values.discard("give_b")
+
+            for _ in range(5):
+                await verifier.run_once()
+            assert await store.count("give_a", ELIGIBLE) == 3
+            pending = await store.pending()
+            assert sorted(row["user_id"] for row in pending) == [1, 2, 5]
+            assert all(row["attempts"] >= 2 for row in pending if row["user_id"] in (1, 2))
+            # Nobody asks about a giveaway that is no longer running
+            assert [row for row in pending if row["user_id"] == 5][0]["attempts"] == 0
+
+            # The draw goes through every row, not just the first batch
+            await store.append("give_a", 13, status=PENDING)
+            await verifier.verify_giveaway("give_a")
+            assert await store.count("give_a", ELIGIBLE) == 4
+            assert await store.count("give_a", PENDING) == 2
+            await db.close()
+            print(f"✅ Undecided rows did not block the rest: {verifier.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def test_draw_verifies_first():
+    """The draw checks buffered and pending participants, then picks eligible ones"""
+    print("🧪 Testing the draw of a verify-later giveaway...")
+    from participant_store import PENDING
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            statuses = {(-1001, user_id): "left" for user_id in range(0, 20, 2)}
+            db, store, buffer, cache, verifier = await _open(tmp, statuses, batch_size=3)
+            for user_id in range(20):
+                assert await buffer.add("give_a", user_id, status=PENDING)
+            await buffer.add("give_b", 1, status=PENDING)
+
+            await verifier.verify_giveaway("give_a")
+            winners = await store.sample("give_a", 20)
+            assert sorted(row["user_id"] for row in winners) == list(range(1, 20, 2))
+            # Other giveaways are left to the background loop
+            assert [row["giveaway_callback_value"] for row in await store.pending()] == ["give_b"]
+            await buffer.drain(1.0)
+            await db.close()
+            print("✅ Only subscribed participants were drawn")
+
+    asyncio.run(_scenario())
+
+
+def test_draw_retries_and_limits():
+    """The draw is paced, retries transient errors and refuses too many undecided"""
+    print("🧪 Testing retries and limits of the draw...")
+    from participant_store import ELIGIBLE, PENDING
+    from subscription_cache import ERROR_STATUS
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            statuses = {
+                (-1001, 1): [ERROR_STATUS, ERROR_STATUS, "member"],
+                (-1001, 2): ERROR_STATUS,
+            }
+            db, store, buffer, cache, verifier = await _open(
+                tmp, statuses, max_concurrency=3, draw_retries=3, max_undecided=0.1
+            )
+            for user_id in range(1, 21):
+                await store.append("give_a", user_id, status=PENDING)
+
+            # User 2 never answers: 1 of 20 is within the limit
+            winners = await verifier.draw("give_a", 30)
+            assert len(winners) == 19 and 2 not in [row["user_id"] for row in winners]
+            assert await store.count("give_a", ELIGIBLE) == 19
+            # Two channels per participant, three participants at a time
+            assert cache.max_in_flight <= 6
+
+            for user_id in range(3, 6):
+                await store.append("give_b", user_id, status=PENDING)
+                statuses[(-1003, user_id)] = ERROR_STATUS
+            await store.append("give_b", 6, status=PENDING)
+            try:
+                await verifier.draw("give_b", 1)
+            except RuntimeError as e:
+                print(f"✅ Draw refused: {e}")
+            else:
+                raise AssertionError("draw went ahead with 3 of 4 participants undecided")
+            await db.close()
+            print("✅ Draw retried the transient error and stayed paced")
+
+    asyncio.run(_scenario())
+
+
+def test_deferred_giveaways():
+    """The verify-later flag follows the giveaway lifecycle"""
+    print("🧪 Testing verify-later giveaways...")
+    from deferred_verification import DeferredGiveaways
+
+    async def _scenario():
+        flags = {"give_a": True, "give_b": False, "give_c": True}
+
+        async def load_deferred():
+            return ["give_a"]
+
+        async def load_verify_later(callback_value):
+            return flags[callback_value]
+
+        async def save_verify_later(callback_value, enabled):
+            flags[callback_value] = enabled
+
+        giveaways = DeferredGiveaways(load_deferred, load_verify_later, save_verify_later)
+        await giveaways.load()
+        assert giveaways.is_deferred("give_a") and not giveaways.is_deferred("give_c")
+        await giveaways.giveaway_started("give_c")
+        await giveaways.giveaway_started("give_b")
+        assert giveaways.is_deferred("give_c") and not giveaways.is_deferred("give_b")
+        await giveaways.set_verify_later("give_b", True)
+        assert giveaways.is_deferred("give_b") and flags["give_b"]
+        giveaways.giveaway_finished("give_a")
+        assert not giveaways.is_deferred("give_a")
+        print("✅ Verify-later flags tracked")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run deferred verification tests"""
+    print("🚀 DEFERRED VERIFICATION TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Background verification", test_background_verification),
+        ("Errors stay pending", test_errors_stay_pending),
+        ("Undecided rows", test_undecided_rows_do_not_stall),
+        ("Draw verifies first", test_draw_verifies_first),
+        ("Draw retries and limits", test_draw_retries_and_limits),
+        ("Verify-later giveaways", test_deferred_giveaways),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test for the SQLite-backed FSM storage
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _state_survives_restart(path):
+    from fsm_storage import SQLiteStorage
+    from state_store import StateStore
+
+    store = StateStore(path)
+    storage = SQLiteStorage(store)
+    await storage.set_state(chat=1, user=1, state="CreateGiveStates:name")
+    await storage.update_data(chat=1, user=1, data={"name": "Giveaway"}, winners=3)
+    await storage.set_state(chat=2, user=2, state="BotSettingsStates:keyword")
+    await storage.reset_state(chat=2, user=2)
+    await storage.close()
+    store.close()
+
+    store = StateStore(path)
+    restarted = SQLiteStorage(store)
+    assert await restarted.get_state(chat=1, user=1) == "CreateGiveStates:name"
+    assert await restarted.get_data(chat=1, user=1) == {"name": "Giveaway", "winners": 3}
+    assert await restarted.get_state(chat=2, user=2) is None
+    assert store.execute("SELECT COUNT(*) FROM fsm_state")[0][0] == 1
+
+    # Returned data is a copy, like MemoryStorage
+    data = await restarted.get_data(chat=1, user=1)
+    data["name"] = "changed"
+    assert (await restarted.get_data(chat=1, user=1))["name"] == "Giveaway"
+    await restarted.close()
+    store.close()
+
+
+async def _cache_is_bounded(path):
+    from fsm_storage import SQLiteStorage
+    from state_store import StateStore
+
+    store = StateStore(path)
+    storage = SQLiteStorage(store, max_entries=100, idle_ttl=0)
+    for user in range(1000):
+        await storage.get_state(chat=-100, user=user)
+    assert storage.stats()["cached"] <= 100
+
+    await storage.set_state(chat=5, user=5, state="CreateGiveStates:date")
+    await storage.flush()
+    storage._evict()
+    # Evicted from memory but still on disk
+    assert (5, 5) not in [tuple(map(int, key)) for key in storage._cache]
+    assert await storage.get_state(chat=5, user=5) == "CreateGiveStates:date"
+    await storage.close()
+    store.close()
+
+
+async def _unpicklable_record(path):
+    from fsm_storage import SQLiteStorage
+    from state_store import StateStore
+
+    store = StateStore(path)
+    storage = SQLiteStorage(store)
+    await storage.set_state(chat=1, user=1, state="CreateGiveStates:name")
+    await storage.update_data(chat=2, user=2, callback=lambda: None)
+    await storage.flush()
+    stats = storage.stats()
+    assert stats["dirty"] == 0 and stats["unpicklable"] == 1
+    # Still usable in this process
+    assert "callback" in await storage.get_data(chat=2, user=2)
+    await storage.close()
+    store.close()
+
+    store = StateStore(path)
+    restarted = SQLiteStorage(store)
+    assert await restarted.get_state(chat=1, user=1) == "CreateGiveStates:name"
+    assert await restarted.get_data(chat=2, user=2) == {}
+    await restarted.close()
+    store.close()
+
+
+def test_state_survives_restart():
+    """Wizard states are persisted and restored after a restart"""
+    print("🧪 Testing FSM persistence...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_state_survives_restart(os.path.join(tmp, "state.sqlite3")))
+    print("✅ FSM states survive restart")
+
+
+def test_cache_is_bounded():
+    """The in-memory cache stays within its limit and evicts idle states"""
+    print("🧪 Testing FSM cache bounds...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_cache_is_bounded(os.path.join(tmp, "state.sqlite3")))
+    print("✅ FSM cache is bounded")
+
+
+def test_unpicklable_record():
+    """A record that cannot be pickled does not block the others"""
+    print("🧪 Testing unpicklable FSM data...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_unpicklable_record(os.path.join(tmp, "state.sqlite3")))
+    print("✅ Unpicklable record dropped, the rest saved")
+
+
+def main():
+    """Run FSM storage tests"""
+    print("🚀 FSM STORAGE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("FSM persistence", test_state_survives_restart),
+        ("FSM cache bounds", test_cache_is_bounded),
+        ("Unpicklable data", test_unpicklable_record),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
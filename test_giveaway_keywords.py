@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test for per-giveaway keywords and the Aho-Corasick matcher
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_automaton_matches_substring_search():
+    """The automaton finds exactly the patterns a substring search finds"""
+    print("🧪 Testing automaton against brute force...")
+    from giveaway_keywords import AhoCorasick
+
+    rng = random.Random(7)
+    alphabet = "абвуч"
+    automaton = AhoCorasick()
+    patterns = set()
+    for step in range(300):
+        pattern = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+        if pattern in patterns and rng.random() < 0.5:
+            # Stop a giveaway: removal keeps the rest intact
+            automaton.remove(pattern)
+            patterns.discard(pattern)
+        else:
+            automaton.add(pattern)
+            patterns.add(pattern)
+        text = "".join(rng.choice(alphabet + " ") for _ in range(rng.randint(0, 30)))
+        expected = {p for p in patterns if p in text}
+        assert automaton.search(text) == expected, (step, text, patterns)
+    print(f"✅ 300 incremental changes, {len(patterns)} patterns left, all searches exact")
+
+
+class FakeGiveaways:
+    def __init__(self):
+        self.keywords = {"give_a": "Хочу приз", "give_b": "GO", "give_c": None}
+
+    async def load_keywords(self):
+        return {k: v for k, v in self.keywords.items() if v}
+
+    async def load_keyword(self, callback_value):
+        return self.keywords.get(callback_value)
+
+    async def save_keyword(self, callback_value, keyword):
+        self.keywords[callback_value] = keyword
+
+
+class FakeDefaultMatcher:
+    async def get_matcher(self):
+        from keyword_matcher import KeywordMatcher
+
+        return KeywordMatcher("Участвую", 0)
+
+
+async def _per_giveaway_keywords():
+    from giveaway_keywords import GiveawayKeywordIndex
+
+    db = FakeGiveaways()
+    index = GiveawayKeywordIndex(
+        load_keywords=db.load_keywords,
+        load_keyword=db.load_keyword,
+        save_keyword=db.save_keyword,
+        default_matcher=FakeDefaultMatcher(),
+    )
+    await index.load()
+
+    assert index.find("я ХОЧУ ПРИЗ, go go") == {"give_a", "give_b"}
+    assert await index.matches("хочу приз!", "give_a")
+    assert not await index.matches("Участвую", "give_a")
+    # No own keyword: the global one applies
+    assert await index.matches("Участвую", "give_c")
+
+    await index.set_keyword("give_c", "Беру")
+    assert db.keywords["give_c"] == "Беру"
+    assert await index.matches("беру!", "give_c")
+
+    index.giveaway_finished("give_b")
+    assert index.find("go") == set()
+    db.keywords["give_d"] = "go"
+    await index.giveaway_started("give_d")
+    assert index.find("let's GO") == {"give_d"}
+    assert index.stats()["giveaways"] == 3
+
+
+def test_per_giveaway_keywords():
+    """Giveaways match their own phrase or fall back to the global keyword"""
+    print("🧪 Testing per-giveaway keywords...")
+    asyncio.run(_per_giveaway_keywords())
+    print("✅ Per-giveaway keywords matched")
+
+
+def test_cost_stays_flat():
+    """Scan time does not grow with the number of running giveaways"""
+    print("🧪 Testing matching cost...")
+    from giveaway_keywords import AhoCorasick
+
+    text = "Всем привет, я тоже участвую в розыгрыше, удачи всем! " * 2
+    timings = {}
+    for count in (10, 1000):
+        automaton = AhoCorasick()
+        for i in range(count):
+            automaton.add(f"розыгрыш №{i}")
+        automaton.search(text)
+        started = time.perf_counter()
+        for _ in range(2000):
+            automaton.search(text)
+        timings[count] = (time.perf_counter() - started) / 2000 * 1e6
+    print(f"   10 phrases: {timings[10]:.1f}µs, 1000 phrases: {timings[1000]:.1f}µs per message")
+    assert timings[1000] < timings[10] * 3
+    print("✅ Cost is flat in the number of phrases")
+
+
+def main():
+    """Run giveaway keyword tests"""
+    print("🚀 GIVEAWAY KEYWORD TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Automaton correctness", test_automaton_matches_substring_search),
+        ("Per-giveaway keywords", test_per_giveaway_keywords),
+        ("Flat matching cost", test_cost_stays_flat),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test for the (group, post) -> giveaway routing index
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+GROUP = -1001
+OTHER_GROUP = -1002
+
+
+class FakeDatabase:
+    """TelegramChannel rows of running giveaways, counting queries"""
+
+    def __init__(self):
+        self.channels = [(GROUP, 42, "give_a"), (GROUP, 43, "give_b"), (OTHER_GROUP, 7, "give_b")]
+        self.queries = 0
+
+    async def load_routes(self):
+        self.queries += 1
+        return list(self.channels)
+
+    async def load_giveaway_routes(self, callback_value):
+        self.queries += 1
+        return [row for row in self.channels if row[2] == callback_value]
+
+    async def resolve_post(self, group_id, post_id):
+        self.queries += 1
+        for row in self.channels:
+            if row[:2] == (group_id, post_id):
+                return row[2]
+        return None
+
+
+def _index(db, **options):
+    from giveaway_routing import GiveawayRoutingIndex
+
+    return GiveawayRoutingIndex(
+        load_routes=db.load_routes,
+        load_giveaway_routes=db.load_giveaway_routes,
+        resolve_post=db.resolve_post,
+        **options,
+    )
+
+
+async def _lookups():
+    db = FakeDatabase()
+    index = _index(db)
+    await index.load()
+    queries = db.queries
+
+    assert await index.lookup(GROUP, 42) == "give_a"
+    assert await index.lookup(OTHER_GROUP, 7) == "give_b"
+    assert index.has_group(GROUP) and not index.has_group(-1003)
+    assert db.queries == queries
+
+    # Unknown post: one query, then answered from the negative cache
+    for _ in range(100):
+        assert await index.lookup(GROUP, 999) is None
+    assert db.queries == queries + 1
+    assert index.stats()["negative_hits"] == 99
+
+
+def test_lookups():
+    """Known and unknown posts are answered without repeated queries"""
+    print("🧪 Testing routing lookups...")
+    asyncio.run(_lookups())
+    print("✅ Lookups served from memory")
+
+
+async def _start_and_finish():
+    db = FakeDatabase()
+    index = _index(db)
+    await index.load()
+
+    assert await index.lookup(GROUP, 50) is None
+    db.channels.append((GROUP, 50, "give_c"))
+    await index.giveaway_started("give_c")
+    # Starting a giveaway clears the negative entry of its post
+    assert index.get(GROUP, 50) == "give_c"
+
+    index.giveaway_finished("give_b")
+    assert index.get(GROUP, 43) is None
+    assert not index.has_group(OTHER_GROUP)
+    assert index.get(GROUP, 42) == "give_a"
+
+    index.giveaway_deleted("give_a")
+    index.giveaway_finished("give_c")
+    assert not index.has_group(GROUP)
+    assert index.stats()["posts"] == 0
+
+
+def test_start_and_finish():
+    """Starting and finishing giveaways update the index in place"""
+    print("🧪 Testing in-place updates...")
+    asyncio.run(_start_and_finish())
+    print("✅ Index follows giveaway lifecycle")
+
+
+async def _started_elsewhere():
+    db = FakeDatabase()
+    index = _index(db, negative_ttl=0)
+    await index.load()
+
+    assert await index.lookup(GROUP, 60) is None
+    # Another process started a giveaway on this post; negative entry expired
+    db.channels.append((GROUP, 60, "give_d"))
+    assert await index.lookup(GROUP, 60) == "give_d"
+    assert index.get(GROUP, 60) == "give_d"
+
+
+def test_started_elsewhere():
+    """Expired negative entries are looked up again"""
+    print("🧪 Testing negative cache expiry...")
+    asyncio.run(_started_elsewhere())
+    print("✅ Giveaways started elsewhere are picked up")
+
+
+def main():
+    """Run routing index tests"""
+    print("🚀 GIVEAWAY ROUTING TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Lookups", test_lookups),
+        ("Start and finish", test_start_and_finish),
+        ("Started elsewhere", test_started_elsewhere),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test for the graceful shutdown drain
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SlowDispatcher:
+    """Stands in for aiogram's Dispatcher with a fixed handler time"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.done = []
+
+    async def process_update(self, update):
+        await asyncio.sleep(self.delay)
+        self.done.append(update.update_id)
+
+
+async def _drain_reports_completed_and_abandoned():
+    import lifecycle
+    from aiogram import types
+    from update_dispatcher import ChatShardedDispatcher
+
+    lifecycle._drains.clear()
+    lifecycle._drained = False
+
+    handler = SlowDispatcher(0.05)
+    chat_dispatcher = ChatShardedDispatcher(handler, workers=2)
+    lifecycle.register_drain("updates", chat_dispatcher.drain)
+
+    order = []
+
+    async def flush_writes(timeout):
+        order.append("writes")
+        return {"completed": 1, "abandoned": 0}
+
+    async def drain_sends(timeout):
+        order.append("sends")
+        return {"completed": 0, "abandoned": 0}
+
+    lifecycle.register_drain("writes", flush_writes, stage=lifecycle.DRAIN_WRITES)
+    lifecycle.register_drain("sends", drain_sends, stage=lifecycle.DRAIN_SENDS)
+
+    # Same chat: processed one after another, 0.05s each
+    for update_id in range(10):
+        update = types.Update(
+            update_id=update_id,
+            message={"message_id": update_id, "date": 0, "chat": {"id": 1, "type": "group"}},
+        )
+        await chat_dispatcher.submit(update)
+
+    notified = []
+
+    async def notify_winner():
+        await asyncio.sleep(0.01)
+        notified.append(True)
+
+    lifecycle.spawn(notify_winner())
+    lifecycle.spawn(asyncio.sleep(10))
+
+    report = await lifecycle.drain_shutdown(timeout=0.2)
+
+    assert notified == [True]
+    assert report["background tasks"] == {
+        "completed": 1,
+        "abandoned": 1,
+        "seconds": report["background tasks"]["seconds"],
+    }
+    updates = report["updates"]
+    assert updates["completed"] == len(handler.done)
+    assert updates["completed"] + updates["abandoned"] == 10
+    assert updates["abandoned"] > 0
+    assert order == ["sends", "writes"]
+
+    # A second call is a no-op
+    assert await lifecycle.drain_shutdown(timeout=1) == {}
+    lifecycle._drains.clear()
+
+
+def test_drain_reports_completed_and_abandoned():
+    """Shutdown finishes what it can by the deadline and reports the rest"""
+    print("🧪 Testing shutdown drain...")
+    asyncio.run(_drain_reports_completed_and_abandoned())
+    print("✅ Shutdown drain reports completed and abandoned work")
+
+
+def test_keyboard_interrupt_runs_shutdown():
+    """Ctrl+C without signal handlers (Windows) still runs the shutdown"""
+    print("🧪 Testing KeyboardInterrupt shutdown...")
+    import lifecycle
+
+    lifecycle._stop_event = None
+    steps = []
+
+    async def serve():
+        # No install_stop_signals(): as on a Windows event loop
+        stop_event = lifecycle.get_stop_event()
+        try:
+            await stop_event.wait()
+            steps.append("stopped")
+        finally:
+            # Awaits in the shutdown path need the loop to keep running
+            await asyncio.sleep(0.01)
+            steps.append("drained")
+
+    def interrupt():
+        raise KeyboardInterrupt
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.call_later(0.05, interrupt)
+        lifecycle.run_until_stopped(loop, serve())
+    finally:
+        loop.close()
+        lifecycle._stop_event = None
+    assert steps == ["stopped", "drained"], steps
+    print("✅ Interrupted loop drained before exiting")
+
+
+def main():
+    """Run graceful shutdown tests"""
+    print("🚀 GRACEFUL SHUTDOWN TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Shutdown drain", test_drain_reports_completed_and_abandoned),
+        ("KeyboardInterrupt shutdown", test_keyboard_interrupt_runs_shutdown),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
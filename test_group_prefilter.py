@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test for the group comment fast-reject filter
+"""
+
+import asyncio
+import copy
+import logging
+import sys
+
+from fake_telegram import GROUP_ID, POST_ID, make_comment_update
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeRouting:
+    def __init__(self):
+        self.lookups = 0
+
+    async def lookup(self, group_id, post_id):
+        self.lookups += 1
+        return "give_a" if (group_id, post_id) == (GROUP_ID, POST_ID) else None
+
+
+class FakeKeywords:
+    async def matches(self, text, callback_value):
+        return "участвую" in text.casefold()
+
+
+def _message(update_id=1, user_id=10, text="Участвую", **changes):
+    from aiogram import types
+
+    raw = make_comment_update(update_id, user_id, text=text)["message"]
+    for key, value in changes.items():
+        if value is None:
+            raw.pop(key, None)
+        else:
+            raw[key] = value
+    return types.Message(**copy.deepcopy(raw))
+
+
+async def _reasons():
+    from group_prefilter import ANONYMOUS_ADMIN_ID, GroupCommentPrefilter
+
+    routing = FakeRouting()
+    prefilter = GroupCommentPrefilter(routing=routing, keywords=FakeKeywords())
+
+    cases = [
+        (_message(), "passed"),
+        (_message(reply_to_message=None), "no_reply"),
+        (_message(text=None, sticker={"file_id": "s", "file_unique_id": "s", "width": 1,
+                                       "height": 1, "is_animated": False}), "not_text"),
+        (_message(text=None, new_chat_members=[{"id": 5, "is_bot": False, "first_name": "N"}]),
+         "service"),
+        (_message(**{"from": {"id": ANONYMOUS_ADMIN_ID, "is_bot": True,
+                              "first_name": "Group"}}), "anonymous"),
+        (_message(sender_chat={"id": -100, "type": "channel", "title": "C"}), "anonymous"),
+        (_message(**{"from": {"id": 777000, "is_bot": False, "first_name": "Telegram"}}),
+         "service"),
+        (_message(reply_to_message={"message_id": 3, "date": 0,
+                                    "chat": {"id": GROUP_ID, "type": "supergroup"},
+                                    "text": "hi"}), "not_post_reply"),
+        (_message(text="Привет"), "no_keyword"),
+        (_message(chat={"id": 5, "type": "private", "first_name": "U"}), "not_group"),
+    ]
+    for message, expected in cases:
+        result = await prefilter.check(message)
+        if expected == "passed":
+            assert result == {"giveaway_callback_value": "give_a"}, result
+        else:
+            assert result is False, (expected, result)
+            assert prefilter.rejected.get(expected), (expected, prefilter.rejected)
+
+    # Only the two messages that got past the cheap checks touched the index
+    assert routing.lookups == 2
+    stats = prefilter.stats()
+    assert stats["passed"] == 1 and stats["rejected"] == len(cases) - 1, stats
+
+
+def test_reject_reasons():
+    """Each kind of irrelevant message is rejected and counted"""
+    print("🧪 Testing reject reasons...")
+    asyncio.run(_reasons())
+    print("✅ Rejects counted per reason")
+
+
+async def _registered_with_handler():
+    from aiogram import Bot, Dispatcher, types
+    from fake_telegram import FAKE_TOKEN
+    from group_prefilter import GroupCommentPrefilter
+
+    bot = Bot(token=FAKE_TOKEN)
+    dp = Dispatcher(bot)
+    prefilter = GroupCommentPrefilter(routing=FakeRouting(), keywords=FakeKeywords())
+    handled = []
+
+    async def handle_new_users_in_groups(message: types.Message, giveaway_callback_value: str):
+        handled.append((message.from_user.id, giveaway_callback_value))
+
+    dp.register_message_handler(handle_new_users_in_groups, prefilter)
+
+    updates = [make_comment_update(1, 10), make_comment_update(2, 11, text="Привет")]
+    for raw in updates:
+        await dp.process_update(types.Update(**raw))
+    await bot.close()
+
+    assert handled == [(10, "give_a")], handled
+
+
+def test_registered_with_handler():
+    """The handler only runs for candidates and receives the giveaway"""
+    print("🧪 Testing handler registration...")
+    asyncio.run(_registered_with_handler())
+    print("✅ Handler ran once with giveaway_callback_value")
+
+
+def main():
+    """Run group pre-filter tests"""
+    print("🚀 GROUP PRE-FILTER TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Reject reasons", test_reject_reasons),
+        ("Registered with handler", test_registered_with_handler),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
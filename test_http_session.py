@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test for the shared Bot API connection pool
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+
+async def _with_server(scenario):
+    from aiogram.bot import api
+    from fake_telegram import FakeTelegramServer
+
+    server = FakeTelegramServer([])
+    await server.start()
+    original_url = api.API_URL
+    api.API_URL = server.api_url
+    try:
+        await scenario(server)
+    finally:
+        api.API_URL = original_url
+        await server.stop()
+
+
+async def _shared_pool(server):
+    import http_session
+    from fake_telegram import FAKE_TOKEN
+    from http_session import PooledBot
+
+    first = PooledBot(token=FAKE_TOKEN)
+    second = PooledBot(token=FAKE_TOKEN)
+    before = http_session.metrics.stats()
+
+    for _ in range(5):
+        await first.get_me()
+        await second.get_me()
+    assert first.session.connector is second.session.connector
+
+    stats = http_session.metrics.stats()
+    assert stats["requests"] - before["requests"] == 10
+    # Sequential requests of both bots ride on one kept-alive connection
+    assert stats["new_connections"] - before["new_connections"] == 1, stats
+    assert stats["reused_connections"] - before["reused_connections"] == 9, stats
+
+    connector = first.session.connector
+    await first.close()
+    assert not connector.closed, "Pool closed while another bot still uses it"
+    await second.close()
+    assert connector.closed
+
+
+def test_shared_pool():
+    """Bots share one connector and reuse kept-alive connections"""
+    print("🧪 Testing shared pool...")
+    asyncio.run(_with_server(_shared_pool))
+    print("✅ One connection served both bots")
+
+
+async def _idempotent_retry(server):
+    import http_session
+    from aiogram.utils.exceptions import NetworkError
+    from fake_telegram import FAKE_TOKEN
+    from http_session import PooledBot
+
+    bot = PooledBot(token=FAKE_TOKEN, retries=2)
+    retries_before = http_session.metrics.retries
+    try:
+        server.disconnects = 2
+        me = await bot.get_me()
+        assert me.username == "fake_bot"
+        assert http_session.metrics.retries - retries_before == 2
+
+        # A send is not idempotent: the error goes to the caller
+        server.disconnects = 1
+        try:
+            await bot.send_message(1, "hi")
+        except NetworkError:
+            pass
+        else:
+            raise AssertionError("sendMessage was retried")
+        assert http_session.metrics.retries - retries_before == 2
+    finally:
+        await bot.close()
+
+
+def test_idempotent_retry():
+    """Dropped connections are retried for get* calls only"""
+    print("🧪 Testing retries...")
+    asyncio.run(_with_server(_idempotent_retry))
+    print("✅ getMe retried, sendMessage not")
+
+
+def main():
+    """Run connection pool tests"""
+    print("🚀 HTTP POOL TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Shared pool", test_shared_pool),
+        ("Idempotent retry", test_idempotent_retry),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test for the single-instance lease
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_single_holder_and_release():
+    """Only one instance holds the lease; release hands it over"""
+    print("🧪 Testing lease exclusivity...")
+    from instance_lease import InstanceLease
+    from state_store import StateStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StateStore(os.path.join(tmp, "state.sqlite3"))
+        primary = InstanceLease(store, ttl=30)
+        standby = InstanceLease(store, ttl=30)
+
+        assert primary.try_acquire()
+        assert not standby.try_acquire()
+        assert primary.renew()
+        assert standby.holder()[0] == primary.owner
+
+        primary.release()
+        assert standby.try_acquire()
+        assert not primary.renew()
+        store.close()
+    print("✅ Lease is exclusive and released cleanly")
+
+
+async def _standby_takes_over_expired_lease(path):
+    from instance_lease import InstanceLease
+    from state_store import StateStore
+
+    store = StateStore(path)
+    crashed = InstanceLease(store, ttl=0.3)
+    standby = InstanceLease(store, ttl=5, poll_interval=0.05)
+    warmed = []
+
+    async def warm_up():
+        warmed.append(True)
+
+    assert crashed.try_acquire()
+    started = time.monotonic()
+    # The crashed instance never renews, so the lease simply runs out
+    await asyncio.wait_for(standby.acquire(on_standby=warm_up), 2)
+    assert standby.held
+    assert warmed == [True]
+    assert time.monotonic() - started < 1
+
+    # The old holder notices on its next heartbeat
+    lost = []
+    crashed.heartbeat = 0.01
+    await asyncio.wait_for(crashed.keep_alive(lambda: lost.append(True)), 1)
+    assert lost == [True]
+    store.close()
+
+
+def test_standby_takeover():
+    """A standby warms up once and takes over when the lease expires"""
+    print("🧪 Testing standby takeover...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_standby_takes_over_expired_lease(os.path.join(tmp, "state.sqlite3")))
+    print("✅ Standby took over the expired lease")
+
+
+async def _standby_leaves_journal_alone(tmp):
+    import lifecycle
+    from participant_buffer import ParticipantBuffer
+    from participant_sets import ParticipantSets
+    from participant_store import ParticipantStore
+    from tortoise.backends.sqlite.client import SqliteClient
+
+    db = SqliteClient(file_path=os.path.join(tmp, "db.sqlite3"), connection_name="lease")
+    await db.create_connection(with_db=True)
+    store = ParticipantStore(get_db=lambda: db, sets=None)
+    await store.create_table()
+    journal = os.path.join(tmp, "participants.journal")
+
+    # The active instance has acknowledged joins that are only journaled
+    active_sets = ParticipantSets(load_all_members=None, load_members=None)
+    active_sets.giveaway_started("give_a")
+    active = ParticipantBuffer(store, active_sets, journal, flush_interval=3600, flush_rows=10**6)
+    for user_id in range(5):
+        await active.add("give_a", user_id)
+
+    saved = list(lifecycle._warmups)
+    lifecycle._warmups.clear()
+    try:
+        reads = []
+
+        async def read_cache():
+            reads.append(True)
+
+        standby = ParticipantBuffer(
+            store, ParticipantSets(load_all_members=None, load_members=None), journal
+        )
+        lifecycle.register_warmup(read_cache)
+        lifecycle.register_warmup(standby.replay, requires_lease=True)
+
+        # Standby warm-up: read-only
+        await lifecycle.run_warmups(requires_lease=False)
+        assert reads == [True]
+        await active.add("give_a", 5)
+        with open(journal, encoding="utf-8") as f:
+            assert len(f.readlines()) == 6
+
+        # The active instance dies without flushing; the standby gets the lease
+        await lifecycle.run_warmups(requires_lease=True)
+        assert reads == [True]
+        assert await store.count("give_a") == 6
+    finally:
+        lifecycle._warmups[:] = saved
+        if active._journal is not None:
+            active._journal.close()
+        await db.close()
+
+
+def test_standby_leaves_journal_alone():
+    """Write-side warm-ups wait for the lease"""
+    print("🧪 Testing standby warm-ups on a shared journal...")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_standby_leaves_journal_alone(tmp))
+    print("✅ Journal replayed only once the standby held the lease")
+
+
+def main():
+    """Run instance lease tests"""
+    print("🚀 INSTANCE LEASE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Lease exclusivity", test_single_holder_and_release),
+        ("Standby takeover", test_standby_takeover),
+        ("Standby warm-ups", test_standby_leaves_journal_alone),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
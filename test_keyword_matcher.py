@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test for the cached participation keyword matcher
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeSettings:
+    def __init__(self, keyword):
+        self.keyword = keyword
+        self.loads = 0
+
+    async def load(self):
+        self.loads += 1
+        return self.keyword
+
+    async def save(self, keyword):
+        self.keyword = keyword
+        return True
+
+
+async def _cached_until_changed():
+    from keyword_matcher import KeywordMatcherCache
+
+    settings = FakeSettings("Участвую")
+    cache = KeywordMatcherCache(load_keyword=settings.load, save_keyword=settings.save)
+
+    assert await cache.matches("Я участвую!")
+    assert await cache.matches("УЧАСТВУЮ")
+    assert not await cache.matches("Привет")
+    assert not await cache.matches("")
+    assert settings.loads == 1
+
+    # The admin flow changes the keyword: visible on the next message
+    await cache.set_keyword("Go+")
+    assert await cache.matches("go+ go")
+    assert not await cache.matches("Участвую")
+    assert settings.loads == 1
+
+    # Changed behind our back (script), then announced with a version bump
+    settings.keyword = "Хочу"
+    cache.bump_version()
+    assert await cache.matches("хочу приз")
+    assert settings.loads == 2
+
+
+def test_cached_until_changed():
+    """The keyword is loaded once and reloaded only after a version bump"""
+    print("🧪 Testing keyword cache...")
+    asyncio.run(_cached_until_changed())
+    print("✅ Matcher cached per settings version")
+
+
+async def _change_during_load():
+    from keyword_matcher import KeywordMatcherCache
+
+    settings = FakeSettings("old")
+    gate = asyncio.Event()
+
+    async def slow_load():
+        keyword = settings.keyword
+        await gate.wait()
+        return keyword
+
+    cache = KeywordMatcherCache(load_keyword=slow_load, save_keyword=settings.save)
+    loading = asyncio.create_task(cache.get_matcher())
+    await asyncio.sleep(0)
+    await cache.set_keyword("new")
+    gate.set()
+    await loading
+    # The stale load must not overwrite the new keyword
+    assert await cache.get_keyword() == "new"
+
+
+def test_change_during_load():
+    """A keyword change racing a load wins"""
+    print("🧪 Testing change during load...")
+    asyncio.run(_change_during_load())
+    print("✅ Stale matcher was not cached")
+
+
+def main():
+    """Run keyword matcher tests"""
+    print("🚀 KEYWORD MATCHER TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Cached until changed", test_cached_until_changed),
+        ("Change during load", test_change_during_load),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test for the queued, rotating, sampled log pipeline
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+
+import log_setup
+from log_setup import DroppingQueueHandler, SamplingFilter, SizeAndTimeRotatingFileHandler
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [line for line in f.read().splitlines() if line]
+
+
+def test_json_lines_through_queue():
+    """Records reach the file as JSON lines, written by the listener thread"""
+    print("🧪 Testing queued JSON logging...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bot.log")
+        log_setup.setup_logging(
+            level="INFO", path=path, json_lines=True, sampling={}, console=False, per_instance=False
+        )
+        try:
+            logger = logging.getLogger("participation")
+            logger.info("User %s joined", 42, extra={"giveaway": "abc"})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("Check failed")
+        finally:
+            log_setup.stop_logging()
+
+        entries = [json.loads(line) for line in _read_lines(path)]
+        assert entries[0]["message"] == "User 42 joined", entries[0]
+        assert entries[0]["giveaway"] == "abc"
+        assert entries[1]["level"] == "ERROR"
+        assert "ValueError: boom" in entries[1]["exc"]
+    print("✅ JSON lines written with extra fields and tracebacks")
+
+
+def test_sampling():
+    """Sampled loggers keep 1 in N info records but every warning"""
+    print("🧪 Testing per-logger sampling...")
+    sampler = SamplingFilter({"handlers.group": 0.1, "handlers.group.quiet": 0})
+
+    def record(name, level=logging.INFO):
+        return logging.LogRecord(name, level, __file__, 0, "msg", (), None)
+
+    kept = sum(sampler.filter(record("handlers.group")) for _ in range(100))
+    assert kept == 10, kept
+    assert not sampler.filter(record("handlers.group.quiet"))
+    assert sampler.filter(record("handlers.group.quiet", logging.WARNING))
+    assert all(sampler.filter(record("bot")) for _ in range(10))
+    assert sampler.sampled_out == 91
+    print("✅ Sampling keeps 10/100 records and all warnings")
+
+
+def test_full_queue_never_blocks():
+    """A full queue drops records instead of stalling the event loop"""
+    print("🧪 Testing full queue...")
+    handler = DroppingQueueHandler(queue.Queue(10))
+    logger = logging.getLogger("test_full_queue")
+    logger.propagate = False
+    logger.addHandler(handler)
+
+    started = time.perf_counter()
+    for i in range(1000):
+        logger.warning("line %d", i)
+    elapsed = time.perf_counter() - started
+
+    assert handler.queue.qsize() == 10
+    assert handler.dropped == 990
+    print(f"✅ 1000 records in {elapsed * 1000:.1f}ms, {handler.dropped} dropped")
+
+
+def test_rotation_by_size_and_age():
+    """The file rotates when it gets too big and when it gets too old"""
+    print("🧪 Testing rotation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bot.log")
+        handler = SizeAndTimeRotatingFileHandler(path, max_bytes=200, backup_count=2)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for i in range(20):
+            handler.emit(logging.LogRecord("x", logging.INFO, "", 0, "x" * 40, (), None))
+        assert os.path.exists(path + ".1") and os.path.exists(path + ".2")
+        assert not os.path.exists(path + ".3")
+        assert os.path.getsize(path) <= 200
+        handler.close()
+
+        path = os.path.join(tmp, "aged.log")
+        handler = SizeAndTimeRotatingFileHandler(path, max_age=3600)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.emit(logging.LogRecord("x", logging.INFO, "", 0, "first", (), None))
+        handler.opened_at -= 3600
+        handler.emit(logging.LogRecord("x", logging.INFO, "", 0, "second", (), None))
+        handler.close()
+        assert _read_lines(path + ".1") == ["first"]
+        assert _read_lines(path) == ["second"]
+    print("✅ Rotation by size and age works")
+
+
+def test_per_instance_files():
+    """Each process logs to its own file; stale files of old instances are pruned"""
+    print("🧪 Testing per-instance log files...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bot.log")
+        own = log_setup.instance_log_path(path)
+        assert own == os.path.join(tmp, f"bot.{os.getpid()}.log")
+
+        standby = log_setup.instance_log_path(path, pid=1)
+        old = log_setup.instance_log_path(path, pid=2)
+        unrelated = os.path.join(tmp, "bot.log.1")
+        for name in (standby, old, old + ".1", unrelated):
+            with open(name, "w") as f:
+                f.write("x\n")
+        stale = time.time() - 7200
+        for name in (old, old + ".1", unrelated):
+            os.utime(name, (stale, stale))
+
+        log_setup.setup_logging(
+            level="INFO",
+            path=path,
+            max_age=600,
+            backup_count=2,
+            sampling={},
+            console=False,
+            per_instance=True,
+        )
+        try:
+            logging.getLogger("participation").warning("written by this instance")
+        finally:
+            log_setup.stop_logging()
+
+        assert "written by this instance" in _read_lines(own)[0]
+        # The standby's recent file stays, the old instance's files go
+        assert os.path.exists(standby) and not os.path.exists(old)
+        assert not os.path.exists(old + ".1") and os.path.exists(unrelated)
+        assert not os.path.exists(path)
+    print("✅ Log file named after the process, stale instance files pruned")
+
+
+def main():
+    """Run log pipeline tests"""
+    print("🚀 LOG PIPELINE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Queued JSON lines", test_json_lines_through_queue),
+        ("Sampling", test_sampling),
+        ("Full queue", test_full_queue_never_blocks),
+        ("Rotation", test_rotation_by_size_and_age),
+        ("Per-instance files", test_per_instance_files),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
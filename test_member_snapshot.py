@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Test for MTProto member snapshots (against a local fake client)
+"""
+
+import asyncio
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = -1001
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+class FakeClient:
+    """The Pyrogram calls member_snapshot makes, over in-memory members"""
+
+    def __init__(self, members, listing_limit=10000):
+        # user_id -> first name
+        self.members = dict(members)
+        self.listing_limit = listing_limit
+        # Admin log, oldest first: (event id, action, user_id)
+        self.events = []
+        self.last_event_id = 0
+        self.started = self.stopped = False
+        self.listings = 0
+
+    async def start(self):
+        self.started = True
+
+    async def stop(self):
+        self.stopped = True
+
+    async def get_chat_members_count(self, chat_id):
+        return len(self.members)
+
+    async def get_chat_members(self, chat_id, query=""):
+        self.listings += 1
+        found = 0
+        for user_id, name in self.members.items():
+            if name.startswith(query):
+                yield SimpleNamespace(user=SimpleNamespace(id=user_id))
+                found += 1
+                if found == self.listing_limit:
+                    return
+
+    def log(self, action, user_id):
+        from pyrogram.enums import ChatEventAction
+
+        self.last_event_id += 1
+        self.events.append((self.last_event_id, getattr(ChatEventAction, action), user_id))
+        if action == "MEMBER_LEFT":
+            self.members.pop(user_id, None)
+        else:
+            self.members[user_id] = random.choice(LETTERS)
+
+    async def get_chat_event_log(self, chat_id, filters=None):
+        for event_id, action, user_id in reversed(self.events):
+            yield SimpleNamespace(id=event_id, action=action, user=SimpleNamespace(id=user_id))
+
+
+def _members(count, seed=1):
+    rng = random.Random(seed)
+    return {rng.randrange(1, 2**40): rng.choice(LETTERS) + "name" for _ in range(count)}
+
+
+def test_snapshot_lookup():
+    """A memory-mapped snapshot answers membership by binary search"""
+    print("🧪 Testing snapshot lookups...")
+    from array import array
+
+    from member_snapshot import Snapshot
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "1.members")
+        ids = sorted(_members(300000))
+        with open(path, "wb") as f:
+            array("q", ids).tofile(f)
+        snapshot = Snapshot(path)
+        assert len(snapshot) == len(ids)
+        assert all(user_id in snapshot for user_id in ids[::997])
+        assert 0 not in snapshot and 2**41 not in snapshot and ids[0] + 1 not in snapshot
+
+        started = time.perf_counter()
+        for user_id in ids[:100000]:
+            assert user_id in snapshot
+        per_lookup = (time.perf_counter() - started) / 100000
+        snapshot.close()
+
+        empty = os.path.join(tmp, "2.members")
+        open(empty, "wb").close()
+        snapshot = Snapshot(empty)
+        assert len(snapshot) == 0 and 5 not in snapshot
+        snapshot.close()
+        print(f"✅ 300000 members, {per_lookup * 1e6:.1f}us per lookup")
+
+
+def test_full_and_incremental_refresh():
+    """Big channels are swept past the listing limit, then kept fresh from the admin log"""
+    print("🧪 Testing full and incremental refresh...")
+    from member_snapshot import MemberSnapshots
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FakeClient(_members(3000), listing_limit=1000)
+            client.log("MEMBER_JOINED", 7)
+
+            async def load_channels():
+                return [CHANNEL]
+
+            snapshots = MemberSnapshots(tmp, lambda: client, load_channels, min_members=100)
+            await snapshots.refresh_all()
+            assert client.started
+            assert len(snapshots._snapshots[CHANNEL]) == len(client.members)
+            assert all(snapshots.contains(CHANNEL, user_id) for user_id in client.members)
+            assert snapshots.stats()["full_refreshes"] == 1
+
+            leaver = next(iter(client.members))
+            client.log("MEMBER_LEFT", leaver)
+            client.log("MEMBER_JOINED", 11)
+            client.log("MEMBER_JOINED", 12)
+            client.log("MEMBER_LEFT", 12)
+            listings = client.listings
+            await snapshots.refresh_all()
+            assert client.listings == listings
+            assert snapshots.stats()["incremental_refreshes"] == 1
+            assert snapshots.contains(CHANNEL, 11)
+            assert not snapshots.contains(CHANNEL, leaver)
+            assert not snapshots.contains(CHANNEL, 12)
+            assert len(snapshots._snapshots[CHANNEL]) == len(client.members)
+
+            # A restart maps the snapshot already on disk
+            restarted = MemberSnapshots(tmp, lambda: client, load_channels, min_members=100)
+            await restarted.load()
+            assert restarted.contains(CHANNEL, 11)
+
+            # The admin log no longer reaches the last event: full refetch
+            client.events = client.events[-1:]
+            client.log("MEMBER_JOINED", 13)
+            client.events = client.events[-1:]
+            await restarted.refresh_all()
+            assert restarted.stats()["full_refreshes"] == 1
+            assert restarted.contains(CHANNEL, 13)
+
+            await restarted.drain(1.0)
+            await snapshots.drain(1.0)
+            assert client.stopped
+            print(f"✅ Snapshot kept in sync: {snapshots.stats()}")
+
+    import member_snapshot
+
+    # The fake cuts listings at 1000 members
+    member_snapshot.LISTING_LIMIT = 1000
+    try:
+        asyncio.run(_scenario())
+    finally:
+        member_snapshot.LISTING_LIMIT = 10000
+
+
+def test_small_and_finished_channels_dropped():
+    """Small channels get no snapshot; snapshots of unused channels are removed"""
+    print("🧪 Testing dropped snapshots...")
+    from member_snapshot import MemberSnapshots
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FakeClient(_members(500))
+            channels = [CHANNEL]
+
+            async def load_channels():
+                return list(channels)
+
+            snapshots = MemberSnapshots(tmp, lambda: client, load_channels, min_members=100)
+            await snapshots.refresh_all()
+            assert snapshots.stats()["channels"] == 1
+
+            channels.clear()
+            await snapshots.refresh_all()
+            assert snapshots.stats()["channels"] == 0 and not os.listdir(tmp)
+
+            channels.append(CHANNEL)
+            snapshots.min_members = 1000
+            await snapshots.refresh_all()
+            assert snapshots.stats()["channels"] == 0
+            await snapshots.drain(1.0)
+            print("✅ No snapshots kept for small or finished channels")
+
+    asyncio.run(_scenario())
+
+
+def test_stale_snapshot_ignored():
+    """A snapshot not synced for too long vouches for nobody"""
+    print("🧪 Testing stale snapshots...")
+    from member_snapshot import MemberSnapshots
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FakeClient(_members(500))
+
+            async def load_channels():
+                return [CHANNEL]
+
+            snapshots = MemberSnapshots(
+                tmp, lambda: client, load_channels, refresh_interval=60, min_members=100
+            )
+            await snapshots.refresh_all()
+            member = next(iter(client.members))
+            assert snapshots.max_age == 180
+            assert snapshots.contains(CHANNEL, member)
+
+            # Refreshes stopped (session revoked, bot down): the snapshot ages out
+            snapshot = snapshots._snapshots[CHANNEL]
+            snapshot.synced_at -= 200
+            assert not snapshots.contains(CHANNEL, member)
+            assert snapshots.stats()["stale_lookups"] == 1
+
+            # An incremental refresh with nothing new still counts as a sync
+            await snapshots.refresh_all()
+            assert snapshots.stats()["incremental_refreshes"] == 1
+            assert snapshots.contains(CHANNEL, member)
+
+            # A restart long after the last sync does not trust the file
+            meta = snapshots._read_meta(CHANNEL)
+            snapshots._write_meta(CHANNEL, dict(meta, synced_at=meta["synced_at"] - 200))
+            restarted = MemberSnapshots(
+                tmp, lambda: client, load_channels, refresh_interval=60, min_members=100
+            )
+            await restarted.load()
+            assert not restarted.contains(CHANNEL, member)
+            await restarted.drain(1.0)
+            await snapshots.drain(1.0)
+            print("✅ Stale snapshots fall back to getChatMember")
+
+    asyncio.run(_scenario())
+
+
+def test_refresh_while_mapped():
+    """A refresh never replaces or removes a file that is still mapped"""
+    print("🧪 Testing refresh of a mapped snapshot...")
+    from member_snapshot import MemberSnapshots
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FakeClient(_members(500))
+
+            async def load_channels():
+                return [CHANNEL]
+
+            snapshots = MemberSnapshots(tmp, lambda: client, load_channels, min_members=100)
+            real_replace, real_remove = os.replace, os.remove
+
+            def mapped(path):
+                return any(
+                    os.path.samefile(path, snapshot.path)
+                    for snapshot in snapshots._snapshots.values()
+                    if os.path.exists(path) and not snapshot._file.closed
+                )
+
+            # What Windows does to a file that is open and mapped
+            def replace(src, dst):
+                if mapped(dst):
+                    raise PermissionError(f"{dst} is in use")
+                real_replace(src, dst)
+
+            def remove(path):
+                if mapped(path):
+                    raise PermissionError(f"{path} is in use")
+                real_remove(path)
+
+            os.replace, os.remove = replace, remove
+            try:
+                await snapshots.refresh_all()
+                first = snapshots._snapshots[CHANNEL].path
+                client.log("MEMBER_JOINED", 11)
+                await snapshots.refresh_all()
+                assert snapshots.stats()["failed_refreshes"] == 0
+                assert snapshots.stats()["incremental_refreshes"] == 1
+                assert snapshots.contains(CHANNEL, 11)
+                assert snapshots._snapshots[CHANNEL].path != first
+                assert not os.path.exists(first)
+                assert sorted(os.listdir(tmp)) == [f"{CHANNEL}.2.members", f"{CHANNEL}.json"]
+
+                # A restart maps the latest generation
+                restarted = MemberSnapshots(tmp, lambda: client, load_channels, min_members=100)
+                await restarted.load()
+                assert restarted.contains(CHANNEL, 11)
+                await restarted.drain(1.0)
+            finally:
+                os.replace, os.remove = real_replace, real_remove
+            await snapshots.drain(1.0)
+            print("✅ New generation mapped, old file removed after closing")
+
+    asyncio.run(_scenario())
+
+
+def test_subscription_cache_uses_snapshot():
+    """Snapshot members need no getChatMember; everyone else is still asked"""
+    print("🧪 Testing subscription checks against a snapshot...")
+    from member_snapshot import MemberSnapshots
+    from subscription_cache import SubscriptionCache
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            client = FakeClient(_members(2000))
+
+            async def load_channels():
+                return [CHANNEL]
+
+            snapshots = MemberSnapshots(tmp, lambda: client, load_channels, min_members=100)
+            await snapshots.refresh_all()
+
+            fetched = []
+
+            async def fetch_status(channel_id, user_id):
+                fetched.append(user_id)
+                return "left"
+
+            cache = SubscriptionCache(fetch_status=fetch_status)
+            cache.snapshots = snapshots
+            members = list(client.members)[:50]
+            for user_id in members:
+                assert await cache.is_subscribed(CHANNEL, user_id)
+            assert not fetched
+            assert not await cache.is_subscribed(CHANNEL, 42)
+            assert fetched == [42]
+            # A fresher answer wins over the snapshot
+            cache.set_status(CHANNEL, members[0], "left")
+            assert not await cache.is_subscribed(CHANNEL, members[0])
+            assert cache.stats()["snapshot_hits"] == 50
+            await snapshots.drain(1.0)
+            print(f"✅ Cache stats: {cache.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run member snapshot tests"""
+    print("🚀 MEMBER SNAPSHOT TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Snapshot lookup", test_snapshot_lookup),
+        ("Full and incremental refresh", test_full_and_incremental_refresh),
+        ("Dropped snapshots", test_small_and_finished_channels_dropped),
+        ("Stale snapshots", test_stale_snapshot_ignored),
+        ("Refresh while mapped", test_refresh_while_mapped),
+        ("Subscription cache", test_subscription_cache_uses_snapshot),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
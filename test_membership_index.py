@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Test for the chat_member membership index
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _member_update(update_id, channel_id, user_id, status, date, key="chat_member"):
+    from aiogram import types
+
+    user = {"id": user_id, "is_bot": False, "first_name": "U"}
+    return types.Update.to_object(
+        {
+            "update_id": update_id,
+            key: {
+                "chat": {"id": channel_id, "type": "channel", "title": "Sponsor"},
+                "from": user,
+                "date": date,
+                "old_chat_member": {"user": user, "status": "left"},
+                "new_chat_member": {"user": user, "status": status},
+            },
+        }
+    )
+
+
+def test_updates_feed_subscription_checks():
+    """Known users are answered from the index without getChatMember"""
+    print("🧪 Testing index-backed subscription checks...")
+    from membership_index import MembershipIndex, MembershipUpdatesMiddleware
+    from state_store import StateStore
+    from subscription_cache import SubscriptionCache
+    from update_dispatcher import get_update_key
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            store = StateStore(os.path.join(tmp, "state.sqlite3"))
+            index = MembershipIndex(store, flush_interval=0.05)
+            middleware = MembershipUpdatesMiddleware(index)
+            calls = []
+
+            async def fetch_status(channel_id, user_id):
+                calls.append((channel_id, user_id))
+                return "member"
+
+            cache = SubscriptionCache(fetch_status)
+            cache.index = index
+
+            updates = [
+                _member_update(1, -1001, 7, "member", 100),
+                _member_update(2, -1001, 8, "member", 100),
+                _member_update(3, -1001, 8, "left", 105),
+                # Older than what is recorded: ignored
+                _member_update(4, -1001, 7, "left", 90),
+            ]
+            assert get_update_key(updates[0]) == -1001
+            for update in updates:
+                await middleware.on_pre_process_update(update, {})
+
+            assert await cache.is_subscribed(-1001, 7)
+            assert not await cache.is_subscribed(-1001, 8)
+            assert not calls
+            # Unknown users still go to Telegram
+            assert await cache.is_subscribed_to_all([-1001, -1002], 7)
+            assert calls == [(-1002, 7)]
+            assert index.stats()["stale_events"] == 1
+            assert cache.stats()["index_hits"] == 3
+
+            # Persisted: a restart starts with the same knowledge
+            await asyncio.sleep(0.1)
+            restarted = MembershipIndex(StateStore(os.path.join(tmp, "state.sqlite3")))
+            await restarted.load()
+            assert restarted.lookup(-1001, 7) == "member"
+            assert restarted.lookup(-1001, 8) == "left"
+
+            # The bot lost admin rights: the channel can no longer be trusted
+            await middleware.on_pre_process_update(
+                _member_update(5, -1001, 42, "left", 110, key="my_chat_member"), {}
+            )
+            assert index.lookup(-1001, 7) is None
+            assert (await index.drain(1.0))["abandoned"] == 0
+            reloaded = MembershipIndex(StateStore(os.path.join(tmp, "state.sqlite3")))
+            await reloaded.load()
+            assert reloaded.stats()["members"] == 0
+            print(f"✅ Index stats: {index.stats()}, cache: {cache.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def test_expiry_and_gaps():
+    """Old entries expire; missed updates clear the index"""
+    print("🧪 Testing expiry and update gaps...")
+    import membership_index
+    import runtime_config
+    from membership_index import HEARTBEAT_KEY, MembershipIndex, MembershipUpdatesMiddleware
+    from state_store import StateStore
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.sqlite3")
+            index = MembershipIndex(StateStore(path), ttl=3600)
+            middleware = MembershipUpdatesMiddleware(index)
+            for user_id in (7, 8):
+                update = _member_update(user_id, -1001, user_id, "member", 100)
+                await middleware.on_pre_process_update(update, {})
+            await middleware.on_pre_process_update(_member_update(9, -1002, 9, "member", 100), {})
+            members = index._channels[-1001]
+            members[8] = members[8][:2] + (members[8][2] - 7200,)
+            index._dirty[(-1001, 8)] = members[8]
+            assert index.lookup(-1001, 7) == "member"
+            assert index.lookup(-1001, 8) is None and index.stats()["expired"] == 1
+            await index.drain(1.0)
+
+            # Expired rows are not loaded back
+            restarted = MembershipIndex(StateStore(path), ttl=3600)
+            await restarted.load()
+            assert restarted.stats()["members"] == 2 and restarted.stats()["resets"] == 0
+
+            # A channel dropped while the disk is read stays dropped
+            slow = MembershipIndex(StateStore(path), ttl=3600)
+            load_rows = slow._load_rows
+
+            def _slow_load_rows():
+                import time
+
+                time.sleep(0.1)
+                return load_rows()
+
+            slow._load_rows = _slow_load_rows
+            loading = asyncio.ensure_future(slow.load())
+            await asyncio.sleep(0.05)
+            removed = _member_update(10, -1001, 42, "left", 110, key="my_chat_member")
+            slow.apply_bot_status(removed.values["my_chat_member"])
+            await loading
+            assert slow.lookup(-1001, 7) is None and slow.lookup(-1002, 9) == "member"
+
+            # Down for longer than Telegram keeps pending updates
+            store = StateStore(path)
+            last_seen = store.get(HEARTBEAT_KEY)
+            store.set(HEARTBEAT_KEY, last_seen - membership_index.PENDING_UPDATES_KEPT - 60)
+            after_downtime = MembershipIndex(store, ttl=3600)
+            await after_downtime.load()
+            assert after_downtime.stats()["members"] == 0 and after_downtime.stats()["resets"] == 1
+
+            # Pending updates skipped on start
+            await middleware.on_pre_process_update(_member_update(11, -1001, 7, "member", 120), {})
+            await index.drain(1.0)
+            catch_up = runtime_config.CATCH_UP_ON_START
+            runtime_config.CATCH_UP_ON_START = False
+            try:
+                skipped = MembershipIndex(StateStore(path), ttl=3600)
+                await skipped.load()
+            finally:
+                runtime_config.CATCH_UP_ON_START = catch_up
+            assert skipped.stats()["members"] == 0 and skipped.stats()["resets"] == 1
+            for each in (restarted, slow, after_downtime, skipped):
+                await each.drain(1.0)
+            print("✅ Expired and possibly missed changes are not trusted")
+
+    asyncio.run(_scenario())
+
+
+def test_allowed_updates():
+    """chat_member updates are requested only when enabled"""
+    print("🧪 Testing allowed_updates...")
+    import runtime_config
+    from membership_index import allowed_updates
+
+    enabled = runtime_config.MEMBERSHIP_UPDATES
+    try:
+        runtime_config.MEMBERSHIP_UPDATES = True
+        assert "chat_member" in allowed_updates() and "message" in allowed_updates()
+        runtime_config.MEMBERSHIP_UPDATES = False
+        assert allowed_updates() is None
+    finally:
+        runtime_config.MEMBERSHIP_UPDATES = enabled
+    print("✅ allowed_updates follows MEMBERSHIP_UPDATES")
+
+
+def main():
+    """Run membership index tests"""
+    print("🚀 MEMBERSHIP INDEX TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Index-backed checks", test_updates_feed_subscription_checks),
+        ("Expiry and gaps", test_expiry_and_gaps),
+        ("Allowed updates", test_allowed_updates),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
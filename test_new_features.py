@@ -1,289 +1,289 @@
-#!/usr/bin/env python3
-"""
-Тестирование новой функциональности:
-1. Гибкая проверка ключевых слов в комментариях
-2. Настройки бота с изменяемым ключевым словом
-3. Досрочное завершение конкурса
-"""
-
-import asyncio
-import logging
-import re
-import sys
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("test_new_features.log", encoding="utf-8"),
-    ],
-)
-
-logger = logging.getLogger(__name__)
-
-
-async def test_flexible_keyword_matching():
-    """Тест гибкой проверки ключевых слов"""
-    print("🔍 ТЕСТ: Гибкая проверка ключевых слов")
-    print("=" * 50)
-
-    test_keyword = "Участвую"
-
-    # Тестовые сообщения
-    test_messages = [
-        "Участвую",  # Точное совпадение
-        "участвую",  # Нижний регистр
-        "УЧАСТВУЮ",  # Верхний регистр
-        "Привет! Участвую в розыгрыше!",  # С дополнительным текстом
-        "Хочу участвую тоже",  # В середине предложения
-        "УчАсТвУю",  # Смешанный регистр
-        "Не хочу участвовать",  # Не должно совпадать
-        "Участвование",  # Не должно совпадать
-        "",  # Пустое сообщение
-        "Hello world",  # Другой текст
-    ]
-
-    expected_results = [True, True, True, True, True, True, False, False, False, False]
-
-    # Создаем паттерн для поиска (как в реальном коде)
-    keyword_pattern = re.compile(re.escape(test_keyword), re.IGNORECASE)
-
-    print(f"🔑 Ключевое слово: '{test_keyword}'")
-    print()
-
-    for i, message in enumerate(test_messages):
-        result = bool(keyword_pattern.search(message)) if message else False
-        expected = expected_results[i]
-        status = "✅" if result == expected else "❌"
-
-        print(f"{status} Сообщение: '{message}'")
-        print(f"   Результат: {result}, Ожидалось: {expected}")
-        print()
-
-    print("=" * 50)
-
-
-async def test_bot_settings():
-    """Тест настроек бота"""
-    print("⚙️ ТЕСТ: Настройки бота")
-    print("=" * 50)
-
-    try:
-        from database import BotSettings, initialize_database
-
-        # Инициализируем базу данных
-        await initialize_database()
-
-        # Тест 1: Получение настроек по умолчанию
-        print("📋 Тест 1: Получение настроек по умолчанию")
-        default_keyword = await BotSettings.get_participation_keyword()
-        print(f"   Ключевое слово по умолчанию: '{default_keyword}'")
-        assert default_keyword == "Участвую", (
-            f"Expected 'Участвую', got '{default_keyword}'"
-        )
-        print("   ✅ Успешно")
-        print()
-
-        # Тест 2: Изменение ключевого слова
-        print("📝 Тест 2: Изменение ключевого слова")
-        new_keyword = "Хочу выиграть"
-        success = await BotSettings.set_participation_keyword(new_keyword)
-        print(f"   Установка нового ключевого слова: {success}")
-        assert success, "Failed to set new keyword"
-
-        # Проверяем, что изменения сохранились
-        current_keyword = await BotSettings.get_participation_keyword()
-        print(f"   Текущее ключевое слово: '{current_keyword}'")
-        assert current_keyword == new_keyword, (
-            f"Expected '{new_keyword}', got '{current_keyword}'"
-        )
-        print("   ✅ Успешно")
-        print()
-
-        # Тест 3: Возврат к исходному значению
-        print("🔄 Тест 3: Возврат к исходному значению")
-        await BotSettings.set_participation_keyword("Участвую")
-        restored_keyword = await BotSettings.get_participation_keyword()
-        print(f"   Восстановленное ключевое слово: '{restored_keyword}'")
-        assert restored_keyword == "Участвую", (
-            f"Expected 'Участвую', got '{restored_keyword}'"
-        )
-        print("   ✅ Успешно")
-
-    except ImportError as e:
-        print(f"❌ Ошибка импорта: {e}")
-    except Exception as e:
-        print(f"❌ Ошибка: {e}")
-
-    print("=" * 50)
-
-
-async def test_early_finish_logic():
-    """Тест логики досрочного завершения"""
-    print("🏁 ТЕСТ: Логика досрочного завершения")
-    print("=" * 50)
-
-    try:
-        from database import GiveAway, initialize_database
-
-        # Инициализируем базу данных
-        await initialize_database()
-
-        print("📋 Тест полей модели GiveAway")
-
-        # Проверяем, что поле early_finish есть в модели
-        giveaway_fields = [field.model_field_name for field in GiveAway._meta.fields]
-        print(f"   Поля модели: {giveaway_fields}")
-
-        assert "early_finish" in giveaway_fields, (
-            "Field 'early_finish' not found in GiveAway model"
-        )
-        print("   ✅ Поле early_finish найдено")
-        print()
-
-        print("🎲 Симуляция досрочного завершения")
-        # Создаем тестовых участников
-        test_participants = [
-            {"user_id": 123456, "username": "user1"},
-            {"user_id": 123457, "username": "user2"},
-            {"user_id": 123458, "username": "user3"},
-            {"user_id": 123459, "username": "user4"},
-            {"user_id": 123460, "username": "user5"},
-        ]
-
-        # Симулируем выбор победителей
-        import random
-
-        winners_count = 2
-        selected_winners = random.sample(
-            test_participants, min(winners_count, len(test_participants))
-        )
-
-        print(f"   Участников: {len(test_participants)}")
-        print(f"   Количество победителей: {winners_count}")
-        print(f"   Выбранные победители: {[w['username'] for w in selected_winners]}")
-        print("   ✅ Логика выбора работает")
-
-    except ImportError as e:
-        print(f"❌ Ошибка импорта: {e}")
-    except Exception as e:
-        print(f"❌ Ошибка: {e}")
-
-    print("=" * 50)
-
-
-async def test_integration():
-    """Интеграционный тест всей функциональности"""
-    print("🔗 ИНТЕГРАЦИОННЫЙ ТЕСТ")
-    print("=" * 50)
-
-    try:
-        from database import BotSettings, initialize_database
-
-        await initialize_database()
-
-        # 1. Меняем ключевое слово
-        test_keyword = "Тестирую"
-        await BotSettings.set_participation_keyword(test_keyword)
-        current_keyword = await BotSettings.get_participation_keyword()
-
-        print(f"1. Установлено новое ключевое слово: '{current_keyword}'")
-        assert current_keyword == test_keyword
-
-        # 2. Тестируем поиск с новым ключевым словом
-        keyword_pattern = re.compile(re.escape(current_keyword), re.IGNORECASE)
-        test_message = "Привет всем! Тестирую новую функцию"
-        found = bool(keyword_pattern.search(test_message))
-
-        print(f"2. Поиск в сообщении '{test_message}': {found}")
-        assert found, "Keyword should be found in message"
-
-        # 3. Восстанавливаем исходное значение
-        await BotSettings.set_participation_keyword("Участвую")
-        restored = await BotSettings.get_participation_keyword()
-
-        print(f"3. Восстановлено исходное ключевое слово: '{restored}'")
-        assert restored == "Участвую"
-
-        print("   ✅ Интеграционный тест прошел успешно")
-
-    except Exception as e:
-        print(f"❌ Ошибка интеграционного теста: {e}")
-
-    print("=" * 50)
-
-
-async def main():
-    """Главная функция тестирования"""
-    print("🚀 ЗАПУСК ТЕСТИРОВАНИЯ НОВОЙ ФУНКЦИОНАЛЬНОСТИ")
-    print("=" * 60)
-    print()
-
-    try:
-        # Тесты
-        await test_flexible_keyword_matching()
-        print()
-
-        await test_bot_settings()
-        print()
-
-        await test_early_finish_logic()
-        print()
-
-        await test_integration()
-        print()
-
-        print("🎉 ВСЕ ТЕСТЫ ЗАВЕРШЕНЫ!")
-        print("=" * 60)
-        print()
-
-        print("📋 КРАТКОЕ ОПИСАНИЕ РЕАЛИЗОВАННОЙ ФУНКЦИОНАЛЬНОСТИ:")
-        print()
-        print("1. 🔍 ГИБКАЯ ПРОВЕРКА КЛЮЧЕВЫХ СЛОВ:")
-        print("   ✅ Ключевое слово теперь ищется в любом месте комментария")
-        print("   ✅ Поиск не зависит от регистра (case-insensitive)")
-        print("   ✅ Поддерживается поиск среди других слов")
-        print()
-
-        print("2. ⚙️ НАСТРОЙКИ БОТА:")
-        print("   ✅ Добавлена модель BotSettings в базу данных")
-        print("   ✅ Ключевое слово можно изменить через настройки")
-        print("   ✅ Создан интерфейс для админов в Telegram")
-        print("   ✅ Настройки сохраняются между перезапусками")
-        print()
-
-        print("3. 🏁 ДОСРОЧНОЕ ЗАВЕРШЕНИЕ:")
-        print("   ✅ Добавлено поле early_finish в модель GiveAway")
-        print("   ✅ Кнопка досрочного завершения в управлении розыгрышами")
-        print("   ✅ Подтверждение перед досрочным завершением")
-        print("   ✅ Автоматический выбор и уведомление победителей")
-        print("   ✅ Обновление постов в каналах о завершении")
-        print()
-
-        print("📁 ДОБАВЛЕННЫЕ ФАЙЛЫ:")
-        print("   • database/models/bot_settings.py - Модель настроек")
-        print("   • handlers/admin/bot_settings.py - Хендлеры настроек")
-        print("   • handlers/admin/early_finish_giveaway.py - Досрочное завершение")
-        print("   • states/admin/bot_settings.py - Состояния для настроек")
-        print()
-
-        print("🔧 ИЗМЕНЕННЫЕ ФАЙЛЫ:")
-        print("   • handlers/admin/functions_for_active_gives/handle_group_users.py")
-        print("   • database/models/giveaway.py")
-        print("   • keyboards/admin/inline/menu.py")
-        print("   • keyboards/admin/inline/active_gives.py")
-        print("   • texts.py")
-        print("   • database/settings.py")
-        print()
-
-    except Exception as e:
-        logger.error(f"Ошибка во время тестирования: {e}")
-        import traceback
-
-        logger.error(f"Полная информация об ошибке:\n{traceback.format_exc()}")
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+#!/usr/bin/env python3
+"""
+Тестирование новой функциональности:
+1. Гибкая проверка ключевых слов в комментариях
+2. Настройки бота с изменяемым ключевым словом
+3. Досрочное завершение конкурса
+"""
+
+import asyncio
+import logging
+import re
+import sys
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler("test_new_features.log", encoding="utf-8"),
+    ],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def test_flexible_keyword_matching():
+    """Тест гибкой проверки ключевых слов"""
+    print("🔍 ТЕСТ: Гибкая проверка ключевых слов")
+    print("=" * 50)
+
+    test_keyword = "Участвую"
+
+    # Тестовые сообщения
+    test_messages = [
+        "Участвую",  # Точное совпадение
+        "участвую",  # Нижний регистр
+        "УЧАСТВУЮ",  # Верхний регистр
+        "Привет! Участвую в розыгрыше!",  # С дополнительным текстом
+        "Хочу участвую тоже",  # В середине предложения
+        "УчАсТвУю",  # Смешанный регистр
+        "Не хочу участвовать",  # Не должно совпадать
+        "Участвование",  # Не должно совпадать
+        "",  # Пустое сообщение
+        "Hello world",  # Другой текст
+    ]
+
+    expected_results = [True, True, True, True, True, True, False, False, False, False]
+
+    # Создаем паттерн для поиска (как в реальном коде)
+    keyword_pattern = re.compile(re.escape(test_keyword), re.IGNORECASE)
+
+    print(f"🔑 Ключевое слово: '{test_keyword}'")
+    print()
+
+    for i, message in enumerate(test_messages):
+        result = bool(keyword_pattern.search(message)) if message else False
+        expected = expected_results[i]
+        status = "✅" if result == expected else "❌"
+
+        print(f"{status} Сообщение: '{message}'")
+        print(f"   Результат: {result}, Ожидалось: {expected}")
+        print()
+
+    print("=" * 50)
+
+
+async def test_bot_settings():
+    """Тест настроек бота"""
+    print("⚙️ ТЕСТ: Настройки бота")
+    print("=" * 50)
+
+    try:
+        from database import BotSettings, initialize_database
+
+        # Инициализируем базу данных
+        await initialize_database()
+
+        # Тест 1: Получение настроек по умолчанию
+        print("📋 Тест 1: Получение настроек по умолчанию")
+        default_keyword = await BotSettings.get_participation_keyword()
+        print(f"   Ключевое слово по умолчанию: '{default_keyword}'")
+        assert default_keyword == "Участвую", (
+            f"Expected 'Участвую', got '{default_keyword}'"
+        )
+        print("   ✅ Успешно")
+        print()
+
+        # Тест 2: Изменение ключевого слова
+        print("📝 Тест 2: Изменение ключевого слова")
+        new_keyword = "Хочу выиграть"
+        success = await BotSettings.set_participation_keyword(new_keyword)
+        print(f"   Установка нового ключевого слова: {success}")
+        assert success, "Failed to set new keyword"
+
+        # Проверяем, что изменения сохранились
+        current_keyword = await BotSettings.get_participation_keyword()
+        print(f"   Текущее ключевое слово: '{current_keyword}'")
+        assert current_keyword == new_keyword, (
+            f"Expected '{new_keyword}', got '{current_keyword}'"
+        )
+        print("   ✅ Успешно")
+        print()
+
+        # Тест 3: Возврат к исходному значению
+        print("🔄 Тест 3: Возврат к исходному значению")
+        await BotSettings.set_participation_keyword("Участвую")
+        restored_keyword = await BotSettings.get_participation_keyword()
+        print(f"   Восстановленное ключевое слово: '{restored_keyword}'")
+        assert restored_keyword == "Участвую", (
+            f"Expected 'Участвую', got '{restored_keyword}'"
+        )
+        print("   ✅ Успешно")
+
+    except ImportError as e:
+        print(f"❌ Ошибка импорта: {e}")
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+
+    print("=" * 50)
+
+
+async def test_early_finish_logic():
+    """Тест логики досрочного завершения"""
+    print("🏁 ТЕСТ: Логика досрочного завершения")
+    print("=" * 50)
+
+    try:
+        from database import GiveAway, initialize_database
+
+        # Инициализируем базу данных
+        await initialize_database()
+
+        print("📋 Тест полей модели GiveAway")
+
+        # Проверяем, что поле early_finish есть в модели
+        giveaway_fields = [field.model_field_name for field in GiveAway._meta.fields]
+        print(f"   Поля модели: {giveaway_fields}")
+
+        assert "early_finish" in giveaway_fields, (
+            "Field 'early_finish' not found in GiveAway model"
+        )
+        print("   ✅ Поле early_finish найдено")
+        print()
+
+        print("🎲 Симуляция досрочного завершения")
+        # Создаем тестовых участников
+        test_participants = [
+            {"user_id": 123456, "username": "user1"},
+            {"user_id": 123457, "username": "user2"},
+            {"user_id": 123458, "username": "user3"},
+            {"user_id": 123459, "username": "user4"},
+            {"user_id": 123460, "username": "user5"},
+        ]
+
+        # Симулируем выбор победителей
+        import random
+
+        winners_count = 2
+        selected_winners = random.sample(
+            test_participants, min(winners_count, len(test_participants))
+        )
+
+        print(f"   Участников: {len(test_participants)}")
+        print(f"   Количество победителей: {winners_count}")
+        print(f"   Выбранные победители: {[w['username'] for w in selected_winners]}")
+        print("   ✅ Логика выбора работает")
+
+    except ImportError as e:
+        print(f"❌ Ошибка импорта: {e}")
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+
+    print("=" * 50)
+
+
+async def test_integration():
+    """Интеграционный тест всей функциональности"""
+    print("🔗 ИНТЕГРАЦИОННЫЙ ТЕСТ")
+    print("=" * 50)
+
+    try:
+        from database import BotSettings, initialize_database
+
+        await initialize_database()
+
+        # 1. Меняем ключевое слово
+        test_keyword = "Тестирую"
+        await BotSettings.set_participation_keyword(test_keyword)
+        current_keyword = await BotSettings.get_participation_keyword()
+
+        print(f"1. Установлено новое ключевое слово: '{current_keyword}'")
+        assert current_keyword == test_keyword
+
+        # 2. Тестируем поиск с новым ключевым словом
+        keyword_pattern = re.compile(re.escape(current_keyword), re.IGNORECASE)
+        test_message = "Привет всем! Тестирую новую функцию"
+        found = bool(keyword_pattern.search(test_message))
+
+        print(f"2. Поиск в сообщении '{test_message}': {found}")
+        assert found, "Keyword should be found in message"
+
+        # 3. Восстанавливаем исходное значение
+        await BotSettings.set_participation_keyword("Участвую")
+        restored = await BotSettings.get_participation_keyword()
+
+        print(f"3. Восстановлено исходное ключевое слово: '{restored}'")
+        assert restored == "Участвую"
+
+        print("   ✅ Интеграционный тест прошел успешно")
+
+    except Exception as e:
+        print(f"❌ Ошибка интеграционного теста: {e}")
+
+    print("=" * 50)
+
+
+async def main():
+    """Главная функция тестирования"""
+    print("🚀 ЗАПУСК ТЕСТИРОВАНИЯ НОВОЙ ФУНКЦИОНАЛЬНОСТИ")
+    print("=" * 60)
+    print()
+
+    try:
+        # Тесты
+        await test_flexible_keyword_matching()
+        print()
+
+        await test_bot_settings()
+        print()
+
+        await test_early_finish_logic()
+        print()
+
+        await test_integration()
+        print()
+
+        print("🎉 ВСЕ ТЕСТЫ ЗАВЕРШЕНЫ!")
+        print("=" * 60)
+        print()
+
+        print("📋 КРАТКОЕ ОПИСАНИЕ РЕАЛИЗОВАННОЙ ФУНКЦИОНАЛЬНОСТИ:")
+        print()
+        print("1. 🔍 ГИБКАЯ ПРОВЕРКА КЛЮЧЕВЫХ СЛОВ:")
+        print("   ✅ Ключевое слово теперь ищется в любом месте комментария")
+        print("   ✅ Поиск не зависит от регистра (case-insensitive)")
+        print("   ✅ Поддерживается поиск среди других слов")
+        print()
+
+        print("2. ⚙️ НАСТРОЙКИ БОТА:")
+        print("   ✅ Добавлена модель BotSettings в базу данных")
+        print("   ✅ Ключевое слово можно изменить через настройки")
+        print("   ✅ Создан интерфейс для админов в Telegram")
+        print("   ✅ Настройки сохраняются между перезапусками")
+        print()
+
+        print("3. 🏁 ДОСРОЧНОЕ ЗАВЕРШЕНИЕ:")
+        print("   ✅ Добавлено поле early_finish в модель GiveAway")
+        print("   ✅ Кнопка досрочного завершения в управлении розыгрышами")
+        print("   ✅ Подтверждение перед досрочным завершением")
+        print("   ✅ Автоматический выбор и уведомление победителей")
+        print("   ✅ Обновление постов в каналах о завершении")
+        print()
+
+        print("📁 ДОБАВЛЕННЫЕ ФАЙЛЫ:")
+        print("   • database/models/bot_settings.py - Модель настроек")
+        print("   • handlers/admin/bot_settings.py - Хендлеры настроек")
+        print("   • handlers/admin/early_finish_giveaway.py - Досрочное завершение")
+        print("   • states/admin/bot_settings.py - Состояния для настроек")
+        print()
+
+        print("🔧 ИЗМЕНЕННЫЕ ФАЙЛЫ:")
+        print("   • handlers/admin/functions_for_active_gives/handle_group_users.py")
+        print("   • database/models/giveaway.py")
+        print("   • keyboards/admin/inline/menu.py")
+        print("   • keyboards/admin/inline/active_gives.py")
+        print("   • texts.py")
+        print("   • database/settings.py")
+        print()
+
+    except Exception as e:
+        logger.error(f"Ошибка во время тестирования: {e}")
+        import traceback
+
+        logger.error(f"Полная информация об ошибке:\n{traceback.format_exc()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
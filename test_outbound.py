@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test for outbound pacing, priorities and flood control
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+
+async def _with_paced_bot(scenario, **scheduler_options):
+    from aiogram.bot import api
+    from fake_telegram import FAKE_TOKEN, FakeTelegramServer
+    from outbound import OutboundScheduler, PacedBot
+
+    server = FakeTelegramServer([])
+    await server.start()
+    original_url = api.API_URL
+    api.API_URL = server.api_url
+    bot = PacedBot(token=FAKE_TOKEN, scheduler=OutboundScheduler(**scheduler_options))
+    try:
+        await scenario(bot, server)
+    finally:
+        await bot.close()
+        api.API_URL = original_url
+        await server.stop()
+
+
+async def _per_chat_pacing(bot, server):
+    # Open the pooled connection first so it does not skew the timings
+    await bot.send_message(6, "warm-up")
+    await asyncio.gather(*(bot.send_message(7, f"reply {i}") for i in range(3)))
+    times = [sent_at for _, chat_id, sent_at in server.sent if chat_id == 7]
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert len(times) == 3
+    assert min(gaps) >= 0.09, gaps
+
+    # Other chats are not held up by chat 7
+    started = time.monotonic()
+    await bot.send_message(8, "hello")
+    assert time.monotonic() - started < 0.05
+
+
+def test_per_chat_pacing():
+    """Sends to one chat are spaced out, other chats are not affected"""
+    print("🧪 Testing per-chat pacing...")
+    asyncio.run(_with_paced_bot(_per_chat_pacing, global_rate=1000, private_rate=10))
+    print("✅ Per-chat limit enforced")
+
+
+async def _interactive_first(bot, server):
+    from outbound import BULK, INTERACTIVE, outbound_priority
+
+    with outbound_priority(BULK):
+        mailing = [asyncio.create_task(bot.send_message(100 + i, "results")) for i in range(10)]
+    await asyncio.sleep(0)
+    with outbound_priority(INTERACTIVE):
+        await bot.send_message(1, "admin panel")
+    await asyncio.gather(*mailing)
+
+    order = [chat_id for _, chat_id, _ in server.sent]
+    # The global burst (5) went out before the admin click; it is next
+    assert order.index(1) <= 5, order
+    stats = bot.scheduler.stats()
+    assert stats["sent"] == 11 and stats["queued"] == 0
+    assert stats["max_wait_ms"] > 0
+
+
+def test_interactive_priority():
+    """Interactive sends jump the queue of a bulk mailing"""
+    print("🧪 Testing priorities...")
+    asyncio.run(_with_paced_bot(_interactive_first, global_rate=5))
+    print("✅ Interactive reply overtook the bulk mailing")
+
+
+async def _retry_after(bot, server):
+    server.flood[-100500] = [1, 1]
+    started = time.monotonic()
+    await bot.send_message(-100500, "results")
+    elapsed = time.monotonic() - started
+
+    assert 1.0 <= elapsed < 2.0, elapsed
+    stats = bot.scheduler.stats()
+    assert stats["retry_after"] == 1 and stats["sent"] == 1
+    # The flooded chat runs at half speed until sends succeed again
+    bucket = bot.scheduler._chat_bucket(-100500)
+    assert bucket.rate < bucket.base_rate
+
+
+def test_retry_after():
+    """A 429 pauses the chat, then the send is retried"""
+    print("🧪 Testing RetryAfter...")
+    asyncio.run(_with_paced_bot(_retry_after))
+    print("✅ RetryAfter honoured and retried")
+
+
+async def _drain(bot, server):
+    sends = [asyncio.create_task(bot.send_message(9, str(i))) for i in range(4)]
+    await asyncio.sleep(0)
+    result = await bot.scheduler.drain(0.25)
+    # 10/s for chat 9: the first ones went out, the last one is still queued
+    assert result["completed"] >= 2 and result["abandoned"] >= 1, result
+    await asyncio.gather(*sends)
+    assert (await bot.scheduler.drain(0.1))["abandoned"] == 0
+
+
+def test_drain():
+    """Shutdown drain reports queued sends it could not finish"""
+    print("🧪 Testing outbound drain...")
+    asyncio.run(_with_paced_bot(_drain, private_rate=10))
+    print("✅ Drain reports completed and abandoned sends")
+
+
+async def _group_replies(bot, server):
+    import outbound
+
+    # Replies from a handler of an update in group -100600 that ignores them
+    outbound._update_chat.set(-100600)
+    started = time.monotonic()
+    with outbound.outbound_detached():
+        results = [await bot.send_message(-100600, f"reply {i}") for i in range(6)]
+    assert time.monotonic() - started < 0.5
+    assert sum(1 for result in results if result.message_id) == 2
+    stats = bot.scheduler.stats()
+    assert stats["detached"] == 2 and stats["dropped"] == 2, stats
+
+    # A handler that did not opt in waits and gets the real message
+    message = await bot.send_message(-100600, "pinned results")
+    assert message.message_id
+    assert bot.scheduler.stats()["detached"] == 2
+
+    # Sends to other chats still wait for their turn and return the message
+    message = await bot.send_message(-100700, "results")
+    assert message.message_id
+
+    result = await bot.scheduler.drain(5.0)
+    assert result["abandoned"] == 0
+    assert [chat_id for _, chat_id, _ in server.sent].count(-100600) == 5
+
+
+def test_group_replies_do_not_block():
+    """A handler does not wait out its group's pacing"""
+    print("🧪 Testing background group replies...")
+    asyncio.run(
+        _with_paced_bot(
+            _group_replies,
+            group_per_minute=120,
+            group_burst=2,
+            group_max_wait=0.2,
+            group_max_queue=2,
+        )
+    )
+    print("✅ Group replies past the wait went out in the background")
+
+
+def main():
+    """Run outbound pacing tests"""
+    print("🚀 OUTBOUND PACING TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Per-chat pacing", test_per_chat_pacing),
+        ("Interactive priority", test_interactive_priority),
+        ("RetryAfter", test_retry_after),
+        ("Drain", test_drain),
+        ("Group replies", test_group_replies_do_not_block),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
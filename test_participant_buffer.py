@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Test for the write-behind participant buffer
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _open_store(path=":memory:"):
+    from participant_sets import ParticipantSets
+    from participant_store import ParticipantStore
+    from tortoise.backends.sqlite.client import SqliteClient
+
+    db = SqliteClient(file_path=path, connection_name="participants")
+    await db.create_connection(with_db=True)
+
+    async def load_members(callback_value):
+        rows = await db.execute_query_dict(
+            "SELECT user_id FROM participant WHERE giveaway_callback_value = ?", [callback_value]
+        )
+        return [row["user_id"] for row in rows]
+
+    sets = ParticipantSets(load_all_members=None, load_members=load_members)
+    store = ParticipantStore(get_db=lambda: db, sets=sets)
+    await store.create_table()
+    return db, store, sets
+
+
+def test_batched_flushes():
+    """Joins are acknowledged at once and written in few transactions"""
+    print("🧪 Testing batched flushes...")
+    from participant_buffer import ParticipantBuffer
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = os.path.join(tmp, "participants.journal")
+            db, store, sets = await _open_store()
+            buffer = ParticipantBuffer(store, sets, journal, flush_interval=0.05, flush_rows=200)
+
+            accepted = await asyncio.gather(
+                *(buffer.add("give_a", user_id % 1000, f"u{user_id}") for user_id in range(1200))
+            )
+            assert sum(accepted) == 1000
+            assert buffer.stats()["duplicates"] == 200
+            await asyncio.sleep(0.2)
+
+            assert await store.count("give_a") == 1000
+            stats = buffer.stats()
+            assert stats["depth"] == 0 and stats["flushes"] <= 10, stats
+            assert os.path.getsize(journal) == 0
+
+            assert await buffer.add("give_a", 5000)
+            result = await buffer.drain(1.0)
+            assert result == {"completed": 1, "abandoned": 0}
+            assert await store.count("give_a") == 1001
+            await db.close()
+            print(f"✅ 1000 joins in {stats['flushes']} transactions, stats: {buffer.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def test_crash_replay():
+    """Rows acknowledged before a crash are written on the next start"""
+    print("🧪 Testing journal replay after a crash...")
+    from participant_buffer import ParticipantBuffer
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = os.path.join(tmp, "participants.journal")
+            db, store, sets = await _open_store()
+            crashed = ParticipantBuffer(store, sets, journal, flush_interval=3600, flush_rows=10**6)
+            for user_id in range(50):
+                await crashed.add("give_a", user_id)
+            # The process dies: nothing flushed, the last line half written
+            crashed._flush_task.cancel()
+            crashed._journal.write('["give_a", 99')
+            crashed._journal.close()
+            assert await store.count("give_a") == 0
+
+            restarted = ParticipantBuffer(store, sets, journal)
+            await restarted.replay()
+            assert await store.count("give_a") == 50
+            assert os.path.getsize(journal) == 0
+            # A second replay (crash right after the previous one) is harmless
+            await restarted.replay()
+            assert await store.count("give_a") == 50
+            await db.close()
+            print("✅ 50 acknowledged joins replayed, torn line skipped")
+
+    asyncio.run(_scenario())
+
+
+def test_failed_flush_is_retried():
+    """A failed transaction keeps the rows pending and journaled"""
+    print("🧪 Testing failed flush retry...")
+    from participant_buffer import ParticipantBuffer
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = os.path.join(tmp, "participants.journal")
+            db, store, sets = await _open_store()
+            real_append_many = store.append_many
+            failures = [1]
+
+            async def flaky_append_many(rows):
+                if failures:
+                    failures.pop()
+                    raise RuntimeError("database is locked")
+                await real_append_many(rows)
+
+            store.append_many = flaky_append_many
+            buffer = ParticipantBuffer(store, sets, journal, flush_interval=3600, flush_rows=10**6)
+            for user_id in range(10):
+                await buffer.add("give_a", user_id)
+            await buffer.flush()
+            assert buffer.depth() == 10 and buffer.stats()["failed_flushes"] == 1
+            with open(journal, encoding="utf-8") as f:
+                assert len(f.readlines()) == 10
+            await buffer.flush()
+            assert buffer.depth() == 0 and await store.count("give_a") == 10
+            await buffer.drain(1.0)
+            await db.close()
+            print("✅ Rows survived a failed transaction and were written on retry")
+
+    asyncio.run(_scenario())
+
+
+def test_drain_waits_for_running_flush():
+    """The drain never cancels a flush in the middle of its transaction"""
+    print("🧪 Testing drain during a flush...")
+    from participant_buffer import ParticipantBuffer
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = os.path.join(tmp, "participants.journal")
+            db, store, sets = await _open_store()
+            real_append_many = store.append_many
+            writes = []
+
+            async def slow_append_many(rows):
+                writes.append("started")
+                await asyncio.sleep(0.2)
+                await real_append_many(rows)
+                writes.append("finished")
+
+            store.append_many = slow_append_many
+            buffer = ParticipantBuffer(store, sets, journal, flush_interval=0.01, flush_rows=10**6)
+            for user_id in range(10):
+                await buffer.add("give_a", user_id)
+            while not writes:
+                await asyncio.sleep(0.01)
+            # Joined while the first batch is being written
+            await buffer.add("give_a", 100)
+
+            result = await buffer.drain(1.0)
+            assert result == {"completed": 11, "abandoned": 0}, result
+            assert writes == ["started", "finished", "started", "finished"]
+            assert await store.count("give_a") == 11
+            assert os.path.getsize(journal) == 0
+            await db.close()
+            print("✅ Running flush committed, the rest flushed after it")
+
+    asyncio.run(_scenario())
+
+
+def test_throughput():
+    """Buffered joins beat one transaction per join on a file database"""
+    print("🧪 Comparing per-join commits with the buffer...")
+    from participant_buffer import ParticipantBuffer
+
+    async def _scenario():
+        with tempfile.TemporaryDirectory() as tmp:
+            db, store, sets = await _open_store(os.path.join(tmp, "db.sqlite3"))
+            joins = 500
+
+            started = time.perf_counter()
+            for user_id in range(joins):
+                await store.append("give_a", user_id)
+            per_join = joins / (time.perf_counter() - started)
+
+            buffer = ParticipantBuffer(store, sets, os.path.join(tmp, "journal"), flush_rows=200)
+            started = time.perf_counter()
+            for user_id in range(joins):
+                await buffer.add("give_b", user_id)
+            await buffer.drain(10.0)
+            buffered = joins / (time.perf_counter() - started)
+
+            assert await store.count("give_b") == joins
+            await db.close()
+            print(f"   per-join commits: {per_join:.0f} joins/s, buffered: {buffered:.0f} joins/s")
+            assert buffered > per_join
+            print("✅ Buffer is faster")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run participant buffer tests"""
+    print("🚀 PARTICIPANT BUFFER TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Batched flushes", test_batched_flushes),
+        ("Crash replay", test_crash_replay),
+        ("Failed flush retry", test_failed_flush_is_retried),
+        ("Drain during flush", test_drain_waits_for_running_flush),
+        ("Throughput", test_throughput),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
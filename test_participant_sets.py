@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test for the in-memory participant sets
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeStatistics:
+    def __init__(self):
+        self.members = {"give_a": list(range(1, 50001)), "give_b": [7, 8]}
+        self.running = {"give_a"}
+        self.single_loads = 0
+
+    async def load_all_members(self):
+        return {k: v for k, v in self.members.items() if k in self.running}
+
+    async def load_members(self, callback_value):
+        self.single_loads += 1
+        await asyncio.sleep(0.01)
+        return list(self.members.get(callback_value, []))
+
+
+def test_duplicate_checks():
+    """Warm-up fills the sets, checks are answered from memory"""
+    print("🧪 Testing duplicate checks...")
+    from participant_sets import ParticipantSets
+
+    async def _scenario():
+        stats = FakeStatistics()
+        sets = ParticipantSets(stats.load_all_members, stats.load_members)
+        await sets.load()
+        assert await sets.is_participant("give_a", 49999)
+        assert not await sets.is_participant("give_a", 50001)
+
+        sets.add("give_a", 50001)
+        assert await sets.is_participant("give_a", 50001)
+        assert await sets.count("give_a") == 50001
+        sets.discard("give_a", 50001)
+        assert not await sets.is_participant("give_a", 50001)
+
+        started = time.perf_counter()
+        for user_id in range(100000):
+            await sets.is_participant("give_a", user_id)
+        elapsed = time.perf_counter() - started
+        assert stats.single_loads == 0
+        print(f"✅ 100k checks on 50k participants in {elapsed * 1000:.0f}ms, no database reads")
+
+    asyncio.run(_scenario())
+
+
+def test_lazy_load_and_lifecycle():
+    """Unknown giveaways load once, finished ones are dropped"""
+    print("🧪 Testing lazy loads and giveaway lifecycle...")
+    from participant_sets import ParticipantSets
+
+    async def _scenario():
+        stats = FakeStatistics()
+        sets = ParticipantSets(stats.load_all_members, stats.load_members)
+        await sets.load()
+
+        # give_b was started by another process: concurrent checks share one load
+        results = await asyncio.gather(*(sets.is_participant("give_b", 7) for _ in range(10)))
+        assert all(results) and stats.single_loads == 1
+        assert not await sets.is_participant("give_b", 9)
+
+        # A new giveaway starts empty and needs no load
+        sets.giveaway_started("give_c")
+        assert not await sets.is_participant("give_c", 1)
+        assert stats.single_loads == 1
+
+        sets.giveaway_finished("give_a")
+        assert sets.stats()["giveaways"] == 2
+        print(f"✅ One shared load for 10 concurrent checks, stats: {sets.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def test_add_before_load():
+    """add() never creates a partial set of an unloaded giveaway"""
+    print("🧪 Testing adds to unloaded giveaways...")
+    from participant_sets import ParticipantSets
+
+    async def _scenario():
+        stats = FakeStatistics()
+        sets = ParticipantSets(stats.load_all_members, stats.load_members)
+        await sets.load()
+
+        # participant_store.append() wrote the row, then told the sets
+        stats.members["give_b"].append(99)
+        sets.add("give_b", 99)
+        assert sets.stats()["giveaways"] == 1
+        assert await sets.is_participant("give_b", 7)
+        assert await sets.is_participant("give_b", 99)
+
+        # Written after the load read the table: merged in when it finishes
+        stats.members["give_d"] = [1]
+        loading = asyncio.ensure_future(sets.is_participant("give_d", 1))
+        await asyncio.sleep(0)
+        sets.add("give_d", 5)
+        assert await loading
+        assert await sets.is_participant("give_d", 5)
+        assert stats.single_loads == 2
+        print(f"✅ Unloaded giveaways stay unloaded until checked, stats: {sets.stats()}")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run participant set tests"""
+    print("🚀 PARTICIPANT SET TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Duplicate checks", test_duplicate_checks),
+        ("Lazy load and lifecycle", test_lazy_load_and_lifecycle),
+        ("Add before load", test_add_before_load),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test for the participant table, its API and the members migration
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _memory_db():
+    from tortoise.backends.sqlite.client import SqliteClient
+
+    db = SqliteClient(file_path=":memory:", connection_name="participants")
+    await db.create_connection(with_db=True)
+    return db
+
+
+def test_append_count_page_sample():
+    """Joins are single inserts, duplicates are rejected by the index"""
+    print("🧪 Testing participant store API...")
+    from participant_sets import ParticipantSets
+    from participant_store import ParticipantStore
+
+    async def _scenario():
+        db = await _memory_db()
+        sets = ParticipantSets(load_all_members=None, load_members=None)
+        sets.giveaway_started("give_a")
+        sets.giveaway_started("give_b")
+        store = ParticipantStore(get_db=lambda: db, sets=sets)
+        await store.create_table()
+
+        for user_id in range(1, 251):
+            assert await store.append("give_a", user_id, f"user{user_id}")
+        assert not await store.append("give_a", 5, "user5")
+        assert await store.append("give_b", 5, "user5")
+        assert await store.count("give_a") == 250
+        assert await store.count("give_b") == 1
+        assert await sets.is_participant("give_a", 250)
+
+        seen = []
+        after_id = 0
+        while True:
+            rows = await store.page("give_a", after_id, 100)
+            if not rows:
+                break
+            seen.extend(row["user_id"] for row in rows)
+            after_id = rows[-1]["id"]
+        assert seen == list(range(1, 251))
+
+        winners = await store.sample("give_a", 10)
+        assert len({row["user_id"] for row in winners}) == 10
+        assert len(await store.sample("give_b", 10)) == 1
+
+        members = await store.members("give_a")
+        assert members[0]["user_id"] == 1 and members[0]["username"] == "user1"
+        assert members[0]["join_date"]
+
+        assert await store.remove("give_a", 5)
+        assert await store.count("give_a") == 249
+        assert not await sets.is_participant("give_a", 5)
+        await db.close()
+        print("✅ 250 joins, duplicate rejected, pages, samples and removal correct")
+
+    asyncio.run(_scenario())
+
+
+def test_concurrent_joins_are_not_lost():
+    """Concurrent appends no longer overwrite each other"""
+    print("🧪 Testing concurrent joins...")
+    from participant_store import ParticipantStore
+
+    async def _scenario():
+        db = await _memory_db()
+        store = ParticipantStore(get_db=lambda: db, sets=None)
+        await store.create_table()
+        results = await asyncio.gather(
+            *(store.append("give_a", user_id % 500, None) for user_id in range(1000))
+        )
+        assert sum(results) == 500
+        assert await store.count("give_a") == 500
+        await db.close()
+        print("✅ 1000 concurrent joins of 500 users: 500 rows, no lost updates")
+
+    asyncio.run(_scenario())
+
+
+def test_members_migration():
+    """The migration copies JSON members in chunks and can be re-run"""
+    print("🧪 Testing members migration...")
+    from migrate_database import create_participant_table, migrate_members_to_participants
+
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    cursor.execute(
+        "CREATE TABLE giveawaystatistic (giveaway_callback_value TEXT PRIMARY KEY, "
+        "members JSON, post_link TEXT NOT NULL, winners JSON)"
+    )
+    big = [
+        {"username": f"u{i}", "user_id": i, "join_date": "2025-11-01 12:00:00"} for i in range(2500)
+    ]
+    cursor.executemany(
+        "INSERT INTO giveawaystatistic VALUES (?, ?, '', '[]')",
+        [
+            ("give_a", json.dumps(big)),
+            ("give_b", json.dumps([{"user_id": 1}, {"user_id": 1}, "junk"])),
+            ("give_c", None),
+        ],
+    )
+    create_participant_table(cursor)
+    migrate_members_to_participants(conn, chunk_size=300)
+    migrate_members_to_participants(conn, chunk_size=300)
+
+    counts = dict(
+        cursor.execute(
+            "SELECT giveaway_callback_value, COUNT(*) FROM participant GROUP BY giveaway_callback_value"
+        ).fetchall()
+    )
+    assert counts == {"give_a": 2500, "give_b": 1}, counts
+    joined_at = cursor.execute(
+        "SELECT joined_at FROM participant WHERE user_id = 7 AND giveaway_callback_value = 'give_a'"
+    ).fetchone()[0]
+    assert joined_at == "2025-11-01 12:00:00"
+    conn.close()
+    print(f"✅ Migrated and re-ran without duplicates: {counts}")
+
+
+def main():
+    """Run participant store tests"""
+    print("🚀 PARTICIPANT STORE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Store API", test_append_count_page_sample),
+        ("Concurrent joins", test_concurrent_joins_are_not_lost),
+        ("Members migration", test_members_migration),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
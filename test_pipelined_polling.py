@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test for the pipelined long-polling engine
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_adaptive_limit_and_timeout():
+    """Full batches drop the timeout, empty batches restore long polling"""
+    print("🧪 Testing adaptive limit/timeout...")
+    from polling import PipelinedPoller
+
+    class FakeDispatcher:
+        bot = None
+
+    poller = PipelinedPoller(FakeDispatcher(), min_limit=10, max_limit=100, max_timeout=20)
+
+    poller.adapt(100)
+    assert poller.limit == 100 and poller.timeout == 0
+
+    poller.adapt(0)
+    assert poller.limit == 10 and poller.timeout == 20
+
+    poller.adapt(10)
+    assert poller.limit == 100 and poller.timeout == 0
+
+    poller.adapt(5)
+    assert 10 <= poller.limit <= 100 and poller.timeout == 1
+    print("✅ Limit and timeout follow the backlog")
+
+
+async def _fetch_overlaps_processing():
+    from aiogram import Bot, Dispatcher, types
+    from aiogram.bot import api
+    from fake_telegram import FAKE_TOKEN, FakeTelegramServer, make_comment_update
+    from polling import PipelinedPoller
+
+    server = FakeTelegramServer([make_comment_update(i + 1, 500 + i) for i in range(5)])
+    await server.start()
+    original_url = api.API_URL
+    api.API_URL = server.api_url
+
+    bot = Bot(token=FAKE_TOKEN)
+    dp = Dispatcher(bot)
+    release = asyncio.Event()
+    handled = []
+
+    @dp.message_handler(content_types=types.ContentTypes.TEXT)
+    async def on_comment(message: types.Message):
+        await release.wait()
+        handled.append(message.from_user.id)
+
+    poller = PipelinedPoller(dp, min_limit=2, max_limit=2, max_timeout=1)
+    polling = asyncio.create_task(poller.run())
+    try:
+        for _ in range(50):
+            if poller.fetched == 5:
+                break
+            await asyncio.sleep(0.02)
+
+        # Every batch was fetched while the first one is still blocked
+        assert poller.fetched == 5
+        assert poller.batches == 3
+        assert handled == []
+
+        release.set()
+        await poller.wait_processed()
+        assert sorted(handled) == [500, 501, 502, 503, 504]
+    finally:
+        poller.stop()
+        await polling
+        await bot.close()
+        await server.stop()
+        api.API_URL = original_url
+
+
+def test_fetch_overlaps_processing():
+    """The next batch is fetched while the previous one is being handled"""
+    print("🧪 Testing fetch/processing overlap...")
+    asyncio.run(_fetch_overlaps_processing())
+    print("✅ Fetching does not wait for handlers")
+
+
+def main():
+    """Run pipelined polling tests"""
+    print("🚀 PIPELINED POLLING TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Adaptive limit/timeout", test_adaptive_limit_and_timeout),
+        ("Fetch/processing overlap", test_fetch_overlaps_processing),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test for coalesced participation replies
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeBot:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((chat_id, text))
+
+
+class FakeUser:
+    def __init__(self, user_id):
+        self.id = user_id
+
+    def get_mention(self, as_html=None):
+        return f'<a href="tg://user?id={self.id}">user{self.id}</a>'
+
+
+class FakeChat:
+    def __init__(self, chat_id):
+        self.id = chat_id
+
+
+class FakeMessage:
+    def __init__(self, bot, chat_id, user_id):
+        self.bot = bot
+        self.chat = FakeChat(chat_id)
+        self.from_user = FakeUser(user_id)
+
+    async def reply(self, text):
+        self.bot.sent.append((self.chat.id, text))
+
+
+def test_calm_group_gets_replies():
+    """Below the threshold every comment is answered"""
+    print("🧪 Testing per-user replies in a calm group...")
+    from reply_coalescer import ReplyCoalescer
+    from texts import PARTICIPATION_SUCCESS
+
+    async def _scenario():
+        bot = FakeBot()
+        coalescer = ReplyCoalescer("summary", storm_threshold=5, storm_window=60)
+        for user_id in range(4):
+            await coalescer.success(FakeMessage(bot, -100, user_id))
+        assert bot.sent == [(-100, PARTICIPATION_SUCCESS)] * 4
+        assert not coalescer.in_storm(-100)
+        print("✅ 4 comments, 4 replies")
+
+    asyncio.run(_scenario())
+
+
+def test_storm_summary_and_silent():
+    """Above the threshold successes are summarized or silently accepted"""
+    print("🧪 Testing storm modes...")
+    from reply_coalescer import SUMMARY_MAX_MENTIONS, ReplyCoalescer
+
+    async def _scenario():
+        bot = FakeBot()
+        coalescer = ReplyCoalescer("summary", storm_threshold=5, storm_window=60, summary_interval=0.05)
+        for user_id in range(100):
+            await coalescer.success(FakeMessage(bot, -100, user_id))
+        # A quieter group is unaffected
+        await coalescer.success(FakeMessage(bot, -200, 1))
+        assert len(bot.sent) == 4 + 1
+        await asyncio.sleep(0.1)
+        assert len(bot.sent) == 6, bot.sent
+        chat_id, summary = bot.sent[-1]
+        assert chat_id == -100 and "(96)" in summary
+        assert summary.count("tg://user?id=") == SUMMARY_MAX_MENTIONS
+        assert "и ещё 66" in summary
+
+        silent_bot = FakeBot()
+        silent = ReplyCoalescer("silent", storm_threshold=5, storm_window=60)
+        for user_id in range(100):
+            await silent.success(FakeMessage(silent_bot, -100, user_id))
+        assert len(silent_bot.sent) == 4 and silent.stats()["silenced"] == 96
+        print("✅ 100 comments: 4 replies + 1 summary, or 4 replies in silent mode")
+
+    asyncio.run(_scenario())
+
+
+def test_failure_cooldown():
+    """Repeated failures of one user are answered once per cooldown"""
+    print("🧪 Testing failure reply cooldown...")
+    from reply_coalescer import ReplyCoalescer
+    from texts import ALREADY_PARTICIPATING, NOT_SUBSCRIBED
+
+    async def _scenario():
+        bot = FakeBot()
+        coalescer = ReplyCoalescer("summary", storm_threshold=1000, cooldown=0.1)
+        for _ in range(10):
+            await coalescer.not_subscribed(FakeMessage(bot, -100, 7))
+            await coalescer.already_participating(FakeMessage(bot, -100, 8))
+        await coalescer.not_subscribed(FakeMessage(bot, -100, 9))
+        assert bot.sent == [(-100, NOT_SUBSCRIBED), (-100, ALREADY_PARTICIPATING), (-100, NOT_SUBSCRIBED)]
+        assert coalescer.stats()["cooled_down"] == 18
+
+        await asyncio.sleep(0.15)
+        await coalescer.not_subscribed(FakeMessage(bot, -100, 7))
+        assert len(bot.sent) == 4
+        print("✅ 21 failures, 3 replies; replies resume after the cooldown")
+
+    asyncio.run(_scenario())
+
+
+def test_drain_sends_pending_summary():
+    """Shutdown posts the summary instead of dropping it"""
+    print("🧪 Testing summary drain...")
+    from reply_coalescer import ReplyCoalescer
+
+    async def _scenario():
+        bot = FakeBot()
+        coalescer = ReplyCoalescer("summary", storm_threshold=2, summary_interval=3600)
+        for user_id in range(5):
+            await coalescer.success(FakeMessage(bot, -100, user_id))
+        assert len(bot.sent) == 1
+        result = await coalescer.drain(1.0)
+        assert result == {"completed": 1, "abandoned": 0}
+        assert len(bot.sent) == 2 and "(4)" in bot.sent[-1][1]
+        print("✅ Pending summary posted on shutdown")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run reply coalescer tests"""
+    print("🚀 REPLY COALESCER TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Calm group", test_calm_group_gets_replies),
+        ("Storm modes", test_storm_summary_and_silent),
+        ("Failure cooldown", test_failure_cooldown),
+        ("Summary drain", test_drain_sends_pending_summary),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test for the --profile-startup phase timings
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+from startup_profile import StartupProfiler
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _overlapped_phases(profiler):
+    # Same shape as app.initialize(): a task timed next to a blocking phase
+    database = asyncio.create_task(profiler.timed("database init", asyncio.sleep(0.1)))
+    await asyncio.sleep(0)
+    with profiler.phase("import handlers"):
+        time.sleep(0.05)
+    await database
+    profiler.mark_ready()
+
+
+def test_phases_are_timed():
+    """Concurrent phases are timed separately and ready covers both"""
+    print("🧪 Testing startup phases...")
+    profiler = StartupProfiler(started_at=time.perf_counter())
+    asyncio.run(_overlapped_phases(profiler))
+
+    phases = {phase["name"]: phase for phase in profiler.phases}
+    assert set(phases) == {"database init", "import handlers"}
+    assert 0.09 <= phases["database init"]["duration"] < 0.5
+    assert 0.04 <= phases["import handlers"]["duration"] < 0.09
+    # Handler import ran while the database was still initialising
+    assert phases["import handlers"]["start"] < phases["database init"]["start"] + 0.05
+
+    total = profiler.ready_at - profiler.started_at
+    assert total < 0.15, f"Phases did not overlap ({total:.3f}s)"
+    print(f"✅ Ready after {total:.3f}s")
+
+
+def test_report():
+    """The report lists every phase and the ready time"""
+    print("🧪 Testing startup report...")
+    profiler = StartupProfiler(started_at=time.perf_counter())
+    with profiler.phase("import bot"):
+        pass
+    profiler.mark_ready()
+    report = profiler.report()
+    print(report)
+    assert "import bot" in report
+    assert "ready" in report
+    assert "modules loaded in total" in report
+    print("✅ Report is complete")
+
+
+def main():
+    """Run startup profile tests"""
+    print("🚀 STARTUP PROFILE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Phase timings", test_phases_are_timed),
+        ("Report", test_report),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
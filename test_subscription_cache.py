@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Test for the channel subscription cache
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeTelegram:
+    """get_chat_member stand-in with a round-trip delay"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.calls = 0
+
+    async def fetch_status(self, channel_id, user_id):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return self.statuses.get((channel_id, user_id), "left")
+
+
+def test_hits_and_collapsing():
+    """Repeated and concurrent lookups cost one request"""
+    print("🧪 Testing cache hits and collapsed lookups...")
+    from subscription_cache import SubscriptionCache
+
+    async def _scenario():
+        telegram = FakeTelegram({(-1001, 7): "member", (-1002, 7): "creator"})
+        cache = SubscriptionCache(telegram.fetch_status)
+
+        results = await asyncio.gather(*(cache.is_subscribed(-1001, 7) for _ in range(10)))
+        assert all(results) and telegram.calls == 1
+        for _ in range(20):
+            assert await cache.is_subscribed(-1001, 7)
+        assert await cache.get_status(-1002, 7) == "creator"
+        assert not await cache.is_subscribed(-1003, 7)
+        assert telegram.calls == 3
+
+        stats = cache.stats()
+        assert stats["collapsed"] == 9 and stats["hits"] == 20 and stats["misses"] == 3
+        print(f"✅ 32 lookups, 3 requests, stats: {stats}")
+
+    asyncio.run(_scenario())
+
+
+def test_ttls_and_errors():
+    """Negative results expire sooner, errors are not cached"""
+    print("🧪 Testing positive/negative TTLs and errors...")
+    from subscription_cache import ERROR_STATUS, SubscriptionCache
+
+    async def _scenario():
+        telegram = FakeTelegram({(-1001, 1): "member", (-1001, 3): ERROR_STATUS})
+        cache = SubscriptionCache(telegram.fetch_status, positive_ttl=0.3, negative_ttl=0.05)
+
+        assert await cache.is_subscribed(-1001, 1)
+        assert not await cache.is_subscribed(-1001, 2)
+        assert await cache.get_status(-1001, 3) == ERROR_STATUS
+        assert telegram.calls == 3
+
+        await asyncio.sleep(0.1)
+        # User 2 subscribed after the NOT_SUBSCRIBED reply
+        telegram.statuses[(-1001, 2)] = "member"
+        assert await cache.is_subscribed(-1001, 2)
+        assert await cache.is_subscribed(-1001, 1)
+        await cache.get_status(-1001, 3)
+        assert telegram.calls == 5, telegram.calls
+        assert cache.stats()["errors"] == 2
+        print("✅ Negative entry refetched after its TTL, positive one still cached")
+
+    asyncio.run(_scenario())
+
+
+def test_lru_bound_and_flush():
+    """The cache never grows past max_entries; flush empties it"""
+    print("🧪 Testing LRU bound and admin flush...")
+    from subscription_cache import SubscriptionCache, flush_subscriptions_command
+
+    async def _scenario():
+        telegram = FakeTelegram({})
+        cache = SubscriptionCache(telegram.fetch_status, max_entries=100)
+        await asyncio.gather(*(cache.get_status(-1001, user_id) for user_id in range(300)))
+        assert cache.stats()["size"] == 100
+        # The most recent entries survived
+        calls = telegram.calls
+        await cache.get_status(-1001, 299)
+        assert telegram.calls == calls
+        await cache.get_status(-1001, 0)
+        assert telegram.calls == calls + 1
+
+        cache.set_status(-1001, 5000, "member")
+        assert await cache.is_subscribed(-1001, 5000)
+        assert cache.flush() == 100
+
+        import subscription_cache as module
+
+        answers = []
+
+        class FakeMessage:
+            async def answer(self, text):
+                answers.append(text)
+
+        module.subscription_cache.set_status(-1001, 1, "member")
+        await flush_subscriptions_command(FakeMessage())
+        assert "Удалено записей: 1" in answers[0]
+        assert module.subscription_cache.stats()["size"] == 0
+        print("✅ Size capped at 100, /flush_subscriptions empties the cache")
+
+    asyncio.run(_scenario())
+
+
+class SlowChannels:
+    """Channels answering after different delays; records cancellations"""
+
+    def __init__(self, delays, statuses):
+        self.delays = delays
+        self.statuses = statuses
+        self.calls = 0
+        self.cancelled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_status(self, channel_id, user_id):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[channel_id])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return self.statuses.get(channel_id, "member")
+
+
+def test_all_channels_concurrently():
+    """Sponsor channels are checked at once; the first failure ends the check"""
+    print("🧪 Testing concurrent multi-channel checks...")
+    from subscription_cache import SubscriptionCache
+
+    async def _scenario():
+        channels = [-1001, -1002, -1003, -1004, -1005]
+        delays = {channel_id: 0.1 for channel_id in channels}
+
+        telegram = SlowChannels(delays, {})
+        cache = SubscriptionCache(telegram.fetch_status)
+        started = time.monotonic()
+        assert await cache.is_subscribed_to_all(channels, 7)
+        elapsed = time.monotonic() - started
+        assert elapsed < 0.2, elapsed
+        assert telegram.max_in_flight == 5
+        print(f"   5 subscribed channels checked in {elapsed * 1000:.0f}ms (sequential: 500ms)")
+
+        delays[-1003] = 0.01
+        telegram = SlowChannels(delays, {-1003: "left"})
+        cache = SubscriptionCache(telegram.fetch_status)
+        started = time.monotonic()
+        assert not await cache.is_subscribed_to_all(channels, 8)
+        elapsed = time.monotonic() - started
+        assert elapsed < 0.05, elapsed
+        await asyncio.sleep(0)
+        assert telegram.cancelled == 4 and cache.stats()["early_exits"] == 1
+        print(f"   Not subscribed to one channel: answered in {elapsed * 1000:.0f}ms, 4 requests cancelled")
+
+        # A cached failure answers without any request
+        calls = telegram.calls
+        assert not await cache.is_subscribed_to_all(channels, 8)
+        assert telegram.calls == calls
+
+        # The limiter bounds requests in flight
+        telegram = SlowChannels({channel_id: 0.01 for channel_id in range(40)}, {})
+        cache = SubscriptionCache(telegram.fetch_status, max_concurrency=4)
+        assert await cache.is_subscribed_to_all(range(40), 9)
+        assert telegram.max_in_flight == 4
+        print("✅ Concurrent checks, early exit with cancellation, bounded concurrency")
+
+    asyncio.run(_scenario())
+
+
+def main():
+    """Run subscription cache tests"""
+    print("🚀 SUBSCRIPTION CACHE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Hits and collapsing", test_hits_and_collapsing),
+        ("TTLs and errors", test_ttls_and_errors),
+        ("LRU bound and flush", test_lru_bound_and_flush),
+        ("All channels concurrently", test_all_channels_concurrently),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test for the per-chat ordered update dispatcher
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _make_update(update_id, chat_id, text):
+    from aiogram import types
+
+    return types.Update(
+        **{
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "supergroup"},
+                "from": {"id": 1, "is_bot": False, "first_name": "U"},
+                "text": text,
+            },
+        }
+    )
+
+
+class RecordingDispatcher:
+    """Stands in for aiogram's Dispatcher.process_update"""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.log = []
+
+    async def process_update(self, update):
+        chat_id = update.message.chat.id
+        await asyncio.sleep(self.delays.get(chat_id, 0))
+        self.log.append((chat_id, update.message.text))
+
+
+async def _ordering_and_isolation():
+    from update_dispatcher import ChatShardedDispatcher
+
+    # Chat 1 is slow, chat 2 is fast
+    recorder = RecordingDispatcher({1: 0.05, 2: 0})
+    chat_dispatcher = ChatShardedDispatcher(recorder, workers=4)
+
+    for i in range(3):
+        await chat_dispatcher.submit(_make_update(i, 1, f"slow-{i}"))
+    for i in range(3):
+        await chat_dispatcher.submit(_make_update(10 + i, 2, f"fast-{i}"))
+
+    assert await chat_dispatcher.join(timeout=2)
+    await chat_dispatcher.close()
+
+    slow = [text for chat_id, text in recorder.log if chat_id == 1]
+    fast = [text for chat_id, text in recorder.log if chat_id == 2]
+    assert slow == ["slow-0", "slow-1", "slow-2"]
+    assert fast == ["fast-0", "fast-1", "fast-2"]
+    # The fast chat finished before the slow chat's first update
+    assert recorder.log[:3] == [(2, "fast-0"), (2, "fast-1"), (2, "fast-2")]
+
+    stats = chat_dispatcher.stats()
+    assert stats["processed"] == 6 and stats["pending"] == 0
+
+
+async def _back_pressure():
+    from update_dispatcher import ChatShardedDispatcher
+
+    recorder = RecordingDispatcher({1: 0.02})
+    chat_dispatcher = ChatShardedDispatcher(recorder, workers=2, max_pending=2)
+
+    for i in range(5):
+        await chat_dispatcher.submit(_make_update(i, 1, f"m-{i}"))
+        assert chat_dispatcher.pending <= 2
+
+    assert await chat_dispatcher.join(timeout=2)
+    await chat_dispatcher.close()
+    assert chat_dispatcher.blocked_submits > 0
+    assert [text for _, text in recorder.log] == [f"m-{i}" for i in range(5)]
+
+
+def test_ordering_and_isolation():
+    """Order is kept per chat and a slow chat does not block others"""
+    print("🧪 Testing per-chat ordering...")
+    asyncio.run(_ordering_and_isolation())
+    print("✅ Per-chat order kept, chats isolated")
+
+
+def test_back_pressure():
+    """Submitting waits when the queue limit is reached"""
+    print("🧪 Testing back-pressure...")
+    asyncio.run(_back_pressure())
+    print("✅ Queue limit enforced")
+
+
+def main():
+    """Run update dispatcher tests"""
+    print("🚀 UPDATE DISPATCHER TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Per-chat ordering", test_ordering_and_isolation),
+        ("Back-pressure", test_back_pressure),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test for webhook ingestion mode
+"""
+
+import asyncio
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _ack_before_handler_finishes():
+    from aiogram import Bot, Dispatcher, types
+    from aiohttp.test_utils import TestClient, TestServer
+    from fake_telegram import FAKE_TOKEN, make_comment_update
+    from webhook import SECRET_TOKEN_HEADER, WebhookIngestion
+
+    bot = Bot(token=FAKE_TOKEN)
+    dp = Dispatcher(bot)
+    release = asyncio.Event()
+    handled = []
+
+    @dp.message_handler(content_types=types.ContentTypes.TEXT)
+    async def on_comment(message: types.Message):
+        await release.wait()
+        handled.append(message.from_user.id)
+
+    ingestion = WebhookIngestion(dp, "/webhook", secret_token="s3cret")
+    client = TestClient(TestServer(ingestion.build_app()))
+    await client.start_server()
+    headers = {SECRET_TOKEN_HEADER: "s3cret"}
+    try:
+        # Forged updates without (or with a wrong) secret are refused
+        response = await client.post("/webhook", json=make_comment_update(1, 777))
+        assert response.status == 403
+        response = await client.post(
+            "/webhook", json=make_comment_update(1, 777), headers={SECRET_TOKEN_HEADER: "guess"}
+        )
+        assert response.status == 403
+        assert ingestion.received == 0 and ingestion.forbidden == 2
+
+        response = await client.post("/webhook", json=make_comment_update(1, 777), headers=headers)
+        # Acknowledged while the handler is still blocked
+        assert response.status == 200
+        assert ingestion.received == 1
+        assert ingestion.in_flight == 1
+        assert handled == []
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert handled == [777]
+        assert ingestion.in_flight == 0
+
+        response = await client.post("/webhook", data=b"not json", headers=headers)
+        assert response.status == 400
+    finally:
+        await client.close()
+        await bot.close()
+
+
+async def _register_with_secret():
+    import runtime_config
+    from aiogram import Bot, Dispatcher
+    from aiogram.bot import api
+    from fake_telegram import FAKE_TOKEN, FakeTelegramServer
+    from lifecycle import request_stop
+    from webhook import serve_webhook
+
+    server = FakeTelegramServer([])
+    await server.start()
+    original_url = api.API_URL
+    api.API_URL = server.api_url
+    bot = Bot(token=FAKE_TOKEN)
+    dp = Dispatcher(bot)
+    original_secret = runtime_config.WEBHOOK_SECRET
+    runtime_config.WEBHOOK_SECRET = ""
+    try:
+        # Nobody could know a random secret if someone else sets the webhook
+        try:
+            await serve_webhook(dp, webhook_url="", port=18443)
+            raise AssertionError("webhook served without a secret")
+        except RuntimeError:
+            pass
+
+        serving = asyncio.ensure_future(
+            serve_webhook(dp, webhook_url="https://example.org", host="127.0.0.1", port=18443)
+        )
+        while server.webhook is None:
+            await asyncio.sleep(0.01)
+        assert server.webhook["url"] == "https://example.org/webhook"
+        assert len(server.webhook["secret_token"]) >= 32
+        request_stop("test finished")
+        await serving
+    finally:
+        runtime_config.WEBHOOK_SECRET = original_secret
+        await bot.close()
+        await server.stop()
+        api.API_URL = original_url
+
+
+def test_webhook_registers_secret():
+    """setWebhook carries a secret token; none configured is refused without WEBHOOK_URL"""
+    print("🧪 Testing webhook secret registration...")
+    asyncio.run(_register_with_secret())
+    print("✅ Webhook registered with a random secret token")
+
+
+def test_webhook_acknowledges_immediately():
+    """Updates are acknowledged before their handler completes"""
+    print("🧪 Testing webhook acknowledgement...")
+    asyncio.run(_ack_before_handler_finishes())
+    print("✅ Webhook acknowledges immediately and processes in background")
+
+
+def main():
+    """Run webhook mode tests"""
+    print("🚀 WEBHOOK MODE TESTS")
+    print("=" * 50)
+
+    tests = [
+        ("Webhook acknowledgement", test_webhook_acknowledges_immediately),
+        ("Webhook secret", test_webhook_registers_secret),
+    ]
+    failed_tests = []
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            print(f"✅ {test_name} - PASSED")
+        except Exception as e:
+            print(f"❌ {test_name} - ERROR: {e}")
+            failed_tests.append(test_name)
+
+    return not failed_tests
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
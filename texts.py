@@ -1,454 +1,488 @@
-#!/usr/bin/env python3
-"""
-Централизованные текстовые константы для бота розыгрышей
-Все тексты интерфейса на русском языке
-"""
-
-# =============================================================================
-# ОСНОВНЫЕ СООБЩЕНИЯ БОТА
-# =============================================================================
-
-# Главное меню
-MAIN_MENU_TEXT = "🎯 <b>Главное меню</b>\n\nВыберите действие:"
-
-# Стартовое сообщение
-START_TEXT = "Главное меню"
-
-# Ключевое слово для участия в комментариях
-PARTICIPATION_KEYWORD = "Участвую"
-
-# =============================================================================
-# НАСТРОЙКИ БОТА
-# =============================================================================
-
-# Меню настроек
-SETTINGS_MENU_TEXT = (
-    "⚙️ <b>Настройки бота</b>\n\nЗдесь вы можете изменить параметры работы бота:"
-)
-
-# Текущее ключевое слово
-CURRENT_KEYWORD_TEXT = "🔑 <b>Текущее ключевое слово:</b> <code>{keyword}</code>"
-
-# Ввод нового ключевого слова
-ENTER_NEW_KEYWORD = (
-    "🔑 <b>Введите новое ключевое слово для участия в комментариях:</b>\n\n"
-    "<i>Текущее ключевое слово:</i> <code>{current_keyword}</code>\n\n"
-    "💡 <i>Пользователи должны будут писать это слово в комментариях для участия в розыгрышах</i>"
-)
-
-# Проверка ключевого слова
-INVALID_KEYWORD = (
-    "❌ <b>Неверное ключевое слово!</b>\n\n"
-    "Ключевое слово не должно быть пустым и не должно превышать 100 символов.\n\n"
-    "Попробуйте еще раз:"
-)
-
-# Успешное обновление
-KEYWORD_UPDATED_SUCCESS = (
-    "✅ <b>Ключевое слово успешно обновлено!</b>\n\n"
-    "🔑 <b>Новое ключевое слово:</b> <code>{keyword}</code>\n\n"
-    "Теперь пользователи должны писать это слово в комментариях для участия в розыгрышах."
-)
-
-# =============================================================================
-# ОТМЕНА ДЕЙСТВИЙ
-# =============================================================================
-
-# Отмена действия
-CANCEL_ACTION = "❌ Действие отменено"
-
-# =============================================================================
-# ДОСРОЧНОЕ ЗАВЕРШЕНИЕ РОЗЫГРЫШЕЙ
-# =============================================================================
-
-# Подтверждение досрочного завершения
-CONFIRM_EARLY_FINISH = (
-    "🏁 <b>Досрочное завершение розыгрыша</b>\n\n"
-    "📝 <b>Розыгрыш:</b> <code>{name}</code>\n"
-    "👥 <b>Участников:</b> <code>{participants}</code>\n"
-    "🏆 <b>Количество победителей:</b> <code>{winners_count}</code>\n\n"
-    "⚠️ <b>Вы действительно хотите завершить этот розыгрыш досрочно?</b>\n\n"
-    "<i>Это действие нельзя отменить. Будут выбраны победители из текущих участников.</i>"
-)
-
-# Успешное досрочное завершение
-EARLY_FINISH_SUCCESS = (
-    "✅ <b>Розыгрыш досрочно завершен!</b>\n\n"
-    "📝 <b>Розыгрыш:</b> <code>{name}</code>\n"
-    "👥 <b>Участников было:</b> <code>{participants}</code>\n"
-    "🏆 <b>Выбрано победителей:</b> <code>{winners_count}</code>\n\n"
-    "🎉 Победители уведомлены, результаты опубликованы в каналах!"
-)
-
-# Отмена досрочного завершения
-EARLY_FINISH_CANCELLED = "❌ Досрочное завершение отменено"
-
-# Розыгрыш не найден
-GIVEAWAY_NOT_FOUND = "❌ Розыгрыш не найден"
-
-# =============================================================================
-# СОЗДАНИЕ РОЗЫГРЫША
-# =============================================================================
-
-# Выбор типа розыгрыша
-SELECT_GIVEAWAY_TYPE = "🎲 <b>Выберите тип розыгрыша:</b>"
-
-# Ввод названия
-ENTER_GIVEAWAY_NAME = "📝 <b>Введите название розыгрыша:</b>"
-
-# Дублирование названия
-DUPLICATE_NAME_ERROR = (
-    "❌ <b>Розыгрыш с таким названием уже существует!</b>\n\nПопробуйте еще раз:"
-)
-
-# Ввод текста розыгрыша
-ENTER_GIVEAWAY_TEXT = "📄 <b>Введите текст для розыгрыша:</b>\n\n<i>💡 Можно использовать HTML разметку</i>"
-
-# Ошибка разметки
-MARKUP_ERROR = "❌ <b>Ошибка в разметке текста!</b>\n\n<i>💡 Возможно вы забыли закрыть тег</i>\n\nПопробуйте еще раз:"
-
-# Медиафайлы
-ASK_ABOUT_MEDIA = "🖼 <b>Хотите добавить медиафайл для розыгрыша?</b>"
-SELECT_MEDIA_TYPE = "📎 <b>Выберите тип медиафайла:</b>"
-SEND_VIDEO = "🎬 <b>Отправьте видео для розыгрыша:</b>"
-SEND_PHOTO = "🖼 <b>Отправьте фото для розыгрыша:</b>"
-
-# Дата и время
-SELECT_END_DATE = "📅 <b>Выберите дату завершения розыгрыша:</b>"
-SELECTED_DATE = "📅 <b>Выбранная дата:</b> {date}"
-ENTER_TIME = (
-    "🕐 <b>Введите время завершения розыгрыша:</b>\n\n<i>💡 Например: 19:23</i>"
-)
-INVALID_TIME_FORMAT = "❌ <b>Неверный формат времени!</b>\n\nПопробуйте еще раз:"
-
-# Капча
-ASK_ABOUT_CAPTCHA = (
-    "🤖 <b>Хотите добавить капчу для розыгрыша?</b>\n\n<i>💡 Защита от ботов</i>"
-)
-
-# Количество победителей
-ENTER_WINNERS_COUNT = "🏆 <b>Введите количество победителей:</b>"
-
-# Успешное создание
-GIVEAWAY_CREATED = "✅ <b>Розыгрыш успешно создан!</b>"
-
-# =============================================================================
-# УПРАВЛЕНИЕ РОЗЫГРЫШАМИ
-# =============================================================================
-
-# Созданные розыгрыши
-CREATED_GIVEAWAYS_TITLE = "📝 <b>Созданные розыгрыши</b>"
-NO_CREATED_GIVEAWAYS = (
-    "📝 <b>У вас нет созданных розыгрышей</b>\n\nСоздайте свой первый розыгрыш!"
-)
-
-# Активные розыгрыши
-ACTIVE_GIVEAWAYS_TITLE = "🎯 <b>Активные розыгрыши</b>"
-NO_ACTIVE_GIVEAWAYS = (
-    "🎯 <b>У вас нет активных розыгрышей</b>\n\nЗапустите один из созданных розыгрышей!"
-)
-
-# Информация о розыгрыше
-GIVEAWAY_INFO = """
-🎲 <b>{name}</b>
-
-📝 <b>Тип:</b> {type}
-🏆 <b>Победителей:</b> {winners_count}
-📅 <b>Завершение:</b> {end_date}
-🤖 <b>Капча:</b> {captcha}
-📊 <b>Статус:</b> {status}
-"""
-
-# Запуск розыгрыша
-START_GIVEAWAY_CONFIRM = "🚀 <b>Запустить розыгрыш?</b>\n\nПосле запуска изменить можно будет только дату окончания."
-GIVEAWAY_STARTED = "✅ <b>Розыгрыш запущен!</b>"
-
-# Остановка розыгрыша
-STOP_GIVEAWAY_CONFIRM = "⏹ <b>Остановить розыгрыш?</b>\n\nОстановленный розыгрыш нельзя будет запустить заново."
-GIVEAWAY_STOPPED = "⏹ <b>Розыгрыш остановлен!</b>"
-
-# Удаление розыгрыша
-DELETE_GIVEAWAY_CONFIRM = (
-    "🗑 <b>Удалить розыгрыш?</b>\n\n❗️ <b>Это действие необратимо!</b>"
-)
-GIVEAWAY_DELETED = "🗑 <b>Розыгрыш удален!</b>"
-
-# =============================================================================
-# УЧАСТИЕ В РОЗЫГРЫШАХ
-# =============================================================================
-
-# Успешное участие
-PARTICIPATION_SUCCESS = (
-    "✅ <b>Спасибо за участие!</b>\n\nВы успешно участвуете в розыгрыше. Удачи! 🍀"
-)
-
-# Повторное участие
-ALREADY_PARTICIPATING = "⚠️ <b>Вы уже участвуете в этом розыгрыше!</b>"
-
-# Не подписан на каналы
-NOT_SUBSCRIBED = "❌ <b>Вы не подписаны на все каналы!</b>\n\nДля участия в розыгрыше необходимо подписаться на все указанные каналы."
-
-# Подписка на результаты
-SUBSCRIBED_TO_RESULTS = (
-    "💎 <b>Вы подписались на результаты розыгрыша!</b>\n\nОжидайте уведомления."
-)
-
-# =============================================================================
-# РЕЗУЛЬТАТЫ РОЗЫГРЫШЕЙ
-# =============================================================================
-
-# Заголовок результатов
-RESULTS_TITLE = "🏆 <b>Результаты розыгрыша:</b>\n\n"
-
-# Шаблон места победителя
-WINNER_PLACE = "{place} место - @{username}"
-
-# Окончание розыгрыша
-GIVEAWAY_ENDED = "🎊 <b>Розыгрыш завершен!</b>\n\nПобедители определены!"
-
-# Уведомление об окончании
-ENDING_SOON = "⏰ <b>Розыгрыш скоро завершится!</b>\n\nУспейте принять участие!"
-
-# =============================================================================
-# УПРАВЛЕНИЕ КАНАЛАМИ
-# =============================================================================
-
-# Каналы для розыгрыша
-CHANNELS_FOR_GIVEAWAY = "📺 <b>Каналы для розыгрыша</b>"
-NO_CHANNELS = "📺 <b>Каналы не добавлены</b>\n\nДобавьте каналы для проверки подписки."
-SELECT_CHANNEL = "📺 <b>Выберите канал для просмотра:</b>"
-
-# Добавление канала
-ADD_CHANNEL = "➕ <b>Добавить канал</b>"
-ENTER_CHANNEL_ID = "📺 <b>Введите ID канала или @username:</b>\n\n<i>💡 Например: @mychannel или -100xxxxxxxxx</i>"
-ENTER_CHANNEL_NAME = "📝 <b>Введите название канала:</b>"
-CHANNEL_ADDED = "✅ <b>Канал добавлен!</b>"
-CHANNEL_EXISTS = "⚠️ <b>Этот канал уже добавлен!</b>"
-
-# Удаление канала
-DELETE_CHANNEL_CONFIRM = "🗑 <b>Удалить канал?</b>\n\n{channel_name}"
-CHANNEL_DELETED = "🗑 <b>Канал удален!</b>"
-
-# =============================================================================
-# КНОПКИ КЛАВИАТУР
-# =============================================================================
-
-# Главное меню
-BTN_CREATE_GIVEAWAY = "🎲 Создать розыгрыш"
-BTN_CREATED_GIVEAWAYS = "📝 Созданные розыгрыши"
-BTN_ACTIVE_GIVEAWAYS = "🎯 Активные розыгрыши"
-
-# Типы розыгрышей
-BTN_COMMENT_GIVEAWAY = "💬 По комментариям"
-BTN_BUTTON_GIVEAWAY = "🔘 По кнопке"
-
-# Медиафайлы
-BTN_YES = "✅ Да"
-BTN_NO = "❌ Нет"
-BTN_ADD_PHOTO = "🖼 Фото"
-BTN_ADD_VIDEO = "🎬 Видео"
-
-# Навигация
-BTN_BACK = "« Назад"
-BTN_CANCEL = "❌ Отмена"
-BTN_CONTINUE = "Продолжить »"
-BTN_EDIT = "✏️ Изменить"
-BTN_CONFIRM = "✅ Подтвердить"
-
-# Управление розыгрышем
-BTN_START_GIVEAWAY = "🚀 Запустить"
-BTN_STOP_GIVEAWAY = "⏹ Остановить"
-BTN_DELETE_GIVEAWAY = "🗑 Удалить"
-BTN_EDIT_DATE = "📅 Изменить дату"
-BTN_VIEW_PARTICIPANTS = "👥 Участники"
-BTN_VIEW_RESULTS = "🏆 Результаты"
-
-# Каналы
-BTN_ADD_CHANNEL = "➕ Добавить канал"
-BTN_MANAGE_CHANNELS = "📺 Управление каналами"
-BTN_DELETE_CHANNEL = "🗑 Удалить"
-BTN_VIEW_CHANNEL = "👁 Просмотр"
-
-# Пагинация
-BTN_PREV_PAGE = "⬅️"
-BTN_NEXT_PAGE = "➡️"
-BTN_PAGE_INFO = "Страница {current}/{total}"
-
-# =============================================================================
-# ОШИБКИ И СИСТЕМНЫЕ СООБЩЕНИЯ
-# =============================================================================
-
-# Общие ошибки
-ERROR_UNKNOWN = "❌ <b>Произошла неизвестная ошибка!</b>\n\nПопробуйте позже или обратитесь к администратору."
-ERROR_ACCESS_DENIED = (
-    "🚫 <b>Доступ запрещен!</b>\n\nУ вас нет прав для выполнения этого действия."
-)
-ERROR_NOT_FOUND = "❌ <b>Не найдено!</b>\n\nЗапрашиваемый объект не существует."
-ERROR_INVALID_FORMAT = (
-    "❌ <b>Неверный формат!</b>\n\nПроверьте правильность ввода данных."
-)
-
-# Ошибки каналов
-ERROR_CHANNEL_NOT_FOUND = (
-    "❌ <b>Канал не найден!</b>\n\nПроверьте правильность ID канала."
-)
-ERROR_BOT_NOT_ADMIN = "❌ <b>Бот не является администратором канала!</b>\n\nДобавьте бота как администратора канала."
-ERROR_NO_PERMISSIONS = (
-    "❌ <b>Недостаточно прав!</b>\n\nУ бота нет необходимых разрешений в канале."
-)
-
-# Ошибки розыгрышей
-ERROR_GIVEAWAY_NOT_FOUND = "❌ <b>Розыгрыш не найден!</b>"
-ERROR_GIVEAWAY_ALREADY_STARTED = "⚠️ <b>Розыгрыш уже запущен!</b>"
-ERROR_GIVEAWAY_ALREADY_ENDED = "⚠️ <b>Розыгрыш уже завершен!</b>"
-ERROR_NO_PARTICIPANTS = "⚠️ <b>Нет участников!</b>\n\nНевозможно определить победителей."
-
-# Системные сообщения
-LOADING = "⏳ Загрузка..."
-PROCESSING = "⏳ Обработка..."
-PLEASE_WAIT = "⏳ Пожалуйста, подождите..."
-
-# =============================================================================
-# ФОРМАТИРОВАНИЕ ДАННЫХ
-# =============================================================================
-
-
-def format_giveaway_type(giveaway_type: str) -> str:
-    """Форматирование типа розыгрыша"""
-    return {"button": "🔘 По кнопке", "comments": "💬 По комментариям"}.get(
-        giveaway_type, giveaway_type
-    )
-
-
-def format_yes_no(value: bool) -> str:
-    """Форматирование да/нет"""
-    return "✅ Да" if value else "❌ Нет"
-
-
-def format_giveaway_status(is_active: bool) -> str:
-    """Форматирование статуса розыгрыша"""
-    return "🎯 Активный" if is_active else "📝 Создан"
-
-
-def format_datetime(dt) -> str:
-    """Форматирование даты и времени"""
-    return dt.strftime("%d.%m.%Y в %H:%M")
-
-
-def format_date(dt) -> str:
-    """Форматирование даты"""
-    return dt.strftime("%d.%m.%Y")
-
-
-def format_participants_count(count: int) -> str:
-    """Форматирование количества участников"""
-    if count == 0:
-        return "Участников нет"
-    elif count == 1:
-        return "1 участник"
-    elif 2 <= count <= 4:
-        return f"{count} участника"
-    else:
-        return f"{count} участников"
-
-
-def format_winners_count(count: int) -> str:
-    """Форматирование количества победителей"""
-    if count == 1:
-        return "1 победитель"
-    elif 2 <= count <= 4:
-        return f"{count} победителя"
-    else:
-        return f"{count} победителей"
-
-
-# =============================================================================
-# ШАБЛОНЫ СООБЩЕНИЙ
-# =============================================================================
-
-
-def get_giveaway_info_text(giveaway_data: dict) -> str:
-    """Получить полную информацию о розыгрыше"""
-    return f"""
-🎲 <b>{giveaway_data.get("name", "Без названия")}</b>
-
-📝 <b>Тип:</b> {format_giveaway_type(giveaway_data.get("type", "unknown"))}
-🏆 <b>Победителей:</b> {giveaway_data.get("winners_count", 0)}
-📅 <b>Завершение:</b> {format_datetime(giveaway_data.get("over_date", ""))}
-🤖 <b>Капча:</b> {format_yes_no(giveaway_data.get("captcha", False))}
-📊 <b>Статус:</b> {format_giveaway_status(giveaway_data.get("run_status", False))}
-
-📄 <b>Описание:</b>
-{giveaway_data.get("text", "Описание отсутствует")}
-"""
-
-
-def get_channel_info_text(channel_data: dict) -> str:
-    """Получить информацию о канале"""
-    return f"""
-📺 <b>{channel_data.get("name", "Без названия")}</b>
-
-🆔 <b>ID:</b> <code>{channel_data.get("channel_id", "Неизвестно")}</code>
-"""
-
-
-def get_results_text(winners_data: list) -> str:
-    """Получить текст с результатами розыгрыша"""
-    if not winners_data:
-        return "🏆 <b>Результаты розыгрыша:</b>\n\n❌ Победители не определены"
-
-    text = "🏆 <b>Результаты розыгрыша:</b>\n\n"
-
-    for i, winner in enumerate(winners_data, 1):
-        username = winner.get("username", f"ID{winner.get('user_id', 'неизвестен')}")
-        text += f"🥇 <b>{i} место</b> - @{username}\n"
-
-    return text
-
-
-# =============================================================================
-# КОМАНДЫ БОТА
-# =============================================================================
-
-COMMANDS_DESCRIPTION = {
-    "start": "Запустить бота и открыть главное меню",
-    "help": "Показать справку по использованию бота",
-    "menu": "Открыть главное меню",
-}
-
-HELP_TEXT = """
-🤖 <b>Справка по использованию бота</b>
-
-<b>Основные функции:</b>
-🎲 Создание розыгрышей двух типов
-📺 Управление каналами для проверки подписки
-🏆 Автоматическое определение победителей
-📊 Просмотр статистики участников
-
-<b>Типы розыгрышей:</b>
-🔘 <b>По кнопке</b> - пользователи участвуют нажатием на кнопку
-💬 <b>По комментариям</b> - участие через комментарии с ключевым словом
-
-<b>Команды:</b>
-/start - Главное меню
-/help - Эта справка
-
-<b>Поддержка:</b> @support_username
-"""
-
-ABOUT_TEXT = """
-🎯 <b>Бот для проведения розыгрышей</b>
-
-Версия: 2.0
-Разработчик: @developer_username
-
-Возможности:
-✅ Розыгрыши по кнопке и комментариям
-✅ Проверка подписки на каналы
-✅ Капча против ботов
-✅ Медиафайлы в розыгрышах
-✅ Автоматическое определение победителей
-✅ Уведомления о результатах
-
-© 2024 Все права защищены
-"""
+#!/usr/bin/env python3
+"""
+Централизованные текстовые константы для бота розыгрышей
+Все тексты интерфейса на русском языке
+"""
+
+# =============================================================================
+# ОСНОВНЫЕ СООБЩЕНИЯ БОТА
+# =============================================================================
+
+# Главное меню
+MAIN_MENU_TEXT = "🎯 <b>Главное меню</b>\n\nВыберите действие:"
+
+# Стартовое сообщение
+START_TEXT = "Главное меню"
+
+# Ключевое слово для участия в комментариях
+PARTICIPATION_KEYWORD = "Участвую"
+
+# =============================================================================
+# НАСТРОЙКИ БОТА
+# =============================================================================
+
+# Меню настроек
+SETTINGS_MENU_TEXT = (
+    "⚙️ <b>Настройки бота</b>\n\nЗдесь вы можете изменить параметры работы бота:"
+)
+
+# Текущее ключевое слово
+CURRENT_KEYWORD_TEXT = "🔑 <b>Текущее ключевое слово:</b> <code>{keyword}</code>"
+
+# Ввод нового ключевого слова
+ENTER_NEW_KEYWORD = (
+    "🔑 <b>Введите новое ключевое слово для участия в комментариях:</b>\n\n"
+    "<i>Текущее ключевое слово:</i> <code>{current_keyword}</code>\n\n"
+    "💡 <i>Пользователи должны будут писать это слово в комментариях для участия в розыгрышах</i>"
+)
+
+# Проверка ключевого слова
+INVALID_KEYWORD = (
+    "❌ <b>Неверное ключевое слово!</b>\n\n"
+    "Ключевое слово не должно быть пустым и не должно превышать 100 символов.\n\n"
+    "Попробуйте еще раз:"
+)
+
+# Успешное обновление
+KEYWORD_UPDATED_SUCCESS = (
+    "✅ <b>Ключевое слово успешно обновлено!</b>\n\n"
+    "🔑 <b>Новое ключевое слово:</b> <code>{keyword}</code>\n\n"
+    "Теперь пользователи должны писать это слово в комментариях для участия в розыгрышах."
+)
+
+# =============================================================================
+# ОТМЕНА ДЕЙСТВИЙ
+# =============================================================================
+
+# Отмена действия
+CANCEL_ACTION = "❌ Действие отменено"
+
+# =============================================================================
+# ДОСРОЧНОЕ ЗАВЕРШЕНИЕ РОЗЫГРЫШЕЙ
+# =============================================================================
+
+# Подтверждение досрочного завершения
+CONFIRM_EARLY_FINISH = (
+    "🏁 <b>Досрочное завершение розыгрыша</b>\n\n"
+    "📝 <b>Розыгрыш:</b> <code>{name}</code>\n"
+    "👥 <b>Участников:</b> <code>{participants}</code>\n"
+    "🏆 <b>Количество победителей:</b> <code>{winners_count}</code>\n\n"
+    "⚠️ <b>Вы действительно хотите завершить этот розыгрыш досрочно?</b>\n\n"
+    "<i>Это действие нельзя отменить. Будут выбраны победители из текущих участников.</i>"
+)
+
+# Успешное досрочное завершение
+EARLY_FINISH_SUCCESS = (
+    "✅ <b>Розыгрыш досрочно завершен!</b>\n\n"
+    "📝 <b>Розыгрыш:</b> <code>{name}</code>\n"
+    "👥 <b>Участников было:</b> <code>{participants}</code>\n"
+    "🏆 <b>Выбрано победителей:</b> <code>{winners_count}</code>\n\n"
+    "🎉 Победители уведомлены, результаты опубликованы в каналах!"
+)
+
+# Отмена досрочного завершения
+EARLY_FINISH_CANCELLED = "❌ Досрочное завершение отменено"
+
+# Розыгрыш не найден
+GIVEAWAY_NOT_FOUND = "❌ Розыгрыш не найден"
+
+# =============================================================================
+# СОЗДАНИЕ РОЗЫГРЫША
+# =============================================================================
+
+# Выбор типа розыгрыша
+SELECT_GIVEAWAY_TYPE = "🎲 <b>Выберите тип розыгрыша:</b>"
+
+# Ввод названия
+ENTER_GIVEAWAY_NAME = "📝 <b>Введите название розыгрыша:</b>"
+
+# Дублирование названия
+DUPLICATE_NAME_ERROR = (
+    "❌ <b>Розыгрыш с таким названием уже существует!</b>\n\nПопробуйте еще раз:"
+)
+
+# Ввод текста розыгрыша
+ENTER_GIVEAWAY_TEXT = "📄 <b>Введите текст для розыгрыша:</b>\n\n<i>💡 Можно использовать HTML разметку</i>"
+
+# Ошибка разметки
+MARKUP_ERROR = "❌ <b>Ошибка в разметке текста!</b>\n\n<i>💡 Возможно вы забыли закрыть тег</i>\n\nПопробуйте еще раз:"
+
+# Медиафайлы
+ASK_ABOUT_MEDIA = "🖼 <b>Хотите добавить медиафайл для розыгрыша?</b>"
+SELECT_MEDIA_TYPE = "📎 <b>Выберите тип медиафайла:</b>"
+SEND_VIDEO = "🎬 <b>Отправьте видео для розыгрыша:</b>"
+SEND_PHOTO = "🖼 <b>Отправьте фото для розыгрыша:</b>"
+
+# Дата и время
+SELECT_END_DATE = "📅 <b>Выберите дату завершения розыгрыша:</b>"
+SELECTED_DATE = "📅 <b>Выбранная дата:</b> {date}"
+ENTER_TIME = (
+    "🕐 <b>Введите время завершения розыгрыша:</b>\n\n<i>💡 Например: 19:23</i>"
+)
+INVALID_TIME_FORMAT = "❌ <b>Неверный формат времени!</b>\n\nПопробуйте еще раз:"
+
+# Капча
+ASK_ABOUT_CAPTCHA = (
+    "🤖 <b>Хотите добавить капчу для розыгрыша?</b>\n\n<i>💡 Защита от ботов</i>"
+)
+
+# Количество победителей
+ENTER_WINNERS_COUNT = "🏆 <b>Введите количество победителей:</b>"
+
+# Успешное создание
+GIVEAWAY_CREATED = "✅ <b>Розыгрыш успешно создан!</b>"
+
+# =============================================================================
+# УПРАВЛЕНИЕ РОЗЫГРЫШАМИ
+# =============================================================================
+
+# Созданные розыгрыши
+CREATED_GIVEAWAYS_TITLE = "📝 <b>Созданные розыгрыши</b>"
+NO_CREATED_GIVEAWAYS = (
+    "📝 <b>У вас нет созданных розыгрышей</b>\n\nСоздайте свой первый розыгрыш!"
+)
+
+# Активные розыгрыши
+ACTIVE_GIVEAWAYS_TITLE = "🎯 <b>Активные розыгрыши</b>"
+NO_ACTIVE_GIVEAWAYS = (
+    "🎯 <b>У вас нет активных розыгрышей</b>\n\nЗапустите один из созданных розыгрышей!"
+)
+
+# Информация о розыгрыше
+GIVEAWAY_INFO = """
+🎲 <b>{name}</b>
+
+📝 <b>Тип:</b> {type}
+🏆 <b>Победителей:</b> {winners_count}
+📅 <b>Завершение:</b> {end_date}
+🤖 <b>Капча:</b> {captcha}
+📊 <b>Статус:</b> {status}
+"""
+
+# Запуск розыгрыша
+START_GIVEAWAY_CONFIRM = "🚀 <b>Запустить розыгрыш?</b>\n\nПосле запуска изменить можно будет только дату окончания."
+GIVEAWAY_STARTED = "✅ <b>Розыгрыш запущен!</b>"
+
+# Остановка розыгрыша
+STOP_GIVEAWAY_CONFIRM = "⏹ <b>Остановить розыгрыш?</b>\n\nОстановленный розыгрыш нельзя будет запустить заново."
+GIVEAWAY_STOPPED = "⏹ <b>Розыгрыш остановлен!</b>"
+
+# Удаление розыгрыша
+DELETE_GIVEAWAY_CONFIRM = (
+    "🗑 <b>Удалить розыгрыш?</b>\n\n❗️ <b>Это действие необратимо!</b>"
+)
+GIVEAWAY_DELETED = "🗑 <b>Розыгрыш удален!</b>"
+
+# =============================================================================
+# УЧАСТИЕ В РОЗЫГРЫШАХ
+# =============================================================================
+
+# Успешное участие
+PARTICIPATION_SUCCESS = (
+    "✅ <b>Спасибо за участие!</b>\n\nВы успешно участвуете в розыгрыше. Удачи! 🍀"
+)
+
+# Сводка принятых заявок (вместо ответа на каждый комментарий при наплыве)
+PARTICIPATION_SUMMARY = "✅ <b>Приняты заявки на участие ({count}):</b>\n\n{mentions}\n\nУдачи! 🍀"
+PARTICIPATION_SUMMARY_MORE = "и ещё {count}"
+
+# Очистка кэша подписок (/flush_subscriptions)
+SUBSCRIPTION_CACHE_FLUSHED = (
+    "🧹 <b>Кэш подписок очищен</b>\n\n"
+    "Удалено записей: {flushed}\n"
+    "Попаданий: {hits}, промахов: {misses} (hit rate {hit_rate:.0%})"
+)
+
+# Оповещения OWNERS о недоступных каналах (проверка подписки)
+CHANNEL_BREAKER_OPENED = (
+    "⚠️ <b>Канал недоступен для проверки подписки</b>\n\n"
+    "Канал: <code>{channel_id}</code>\n"
+    "Ошибок подряд: {failures}\n\n"
+    "Проверьте, что канал существует и бот в нём администратор. "
+    "Пока канал недоступен, проверки в нём не выполняются; "
+    "повторная попытка раз в {probe_interval} с."
+)
+CHANNEL_BREAKER_CLOSED = (
+    "✅ <b>Канал снова доступен</b>\n\n"
+    "Канал: <code>{channel_id}</code>\n"
+    "Проверки подписки возобновлены. Канал был недоступен {duration} с, "
+    "отклонено проверок: {fast_fails}."
+)
+
+# Канал розыгрыша недоступен для проверки подписки
+CHANNEL_UNAVAILABLE = (
+    "⚠️ <b>Сейчас не удаётся проверить подписку</b>\n\n"
+    "Один из каналов розыгрыша временно недоступен. Организаторы уже оповещены, "
+    "попробуйте позже."
+)
+
+# Повторное участие
+ALREADY_PARTICIPATING = "⚠️ <b>Вы уже участвуете в этом розыгрыше!</b>"
+
+# Не подписан на каналы
+NOT_SUBSCRIBED = "❌ <b>Вы не подписаны на все каналы!</b>\n\nДля участия в розыгрыше необходимо подписаться на все указанные каналы."
+
+# Подписка на результаты
+SUBSCRIBED_TO_RESULTS = (
+    "💎 <b>Вы подписались на результаты розыгрыша!</b>\n\nОжидайте уведомления."
+)
+
+# =============================================================================
+# РЕЗУЛЬТАТЫ РОЗЫГРЫШЕЙ
+# =============================================================================
+
+# Заголовок результатов
+RESULTS_TITLE = "🏆 <b>Результаты розыгрыша:</b>\n\n"
+
+# Шаблон места победителя
+WINNER_PLACE = "{place} место - @{username}"
+
+# Окончание розыгрыша
+GIVEAWAY_ENDED = "🎊 <b>Розыгрыш завершен!</b>\n\nПобедители определены!"
+
+# Уведомление об окончании
+ENDING_SOON = "⏰ <b>Розыгрыш скоро завершится!</b>\n\nУспейте принять участие!"
+
+# =============================================================================
+# УПРАВЛЕНИЕ КАНАЛАМИ
+# =============================================================================
+
+# Каналы для розыгрыша
+CHANNELS_FOR_GIVEAWAY = "📺 <b>Каналы для розыгрыша</b>"
+NO_CHANNELS = "📺 <b>Каналы не добавлены</b>\n\nДобавьте каналы для проверки подписки."
+SELECT_CHANNEL = "📺 <b>Выберите канал для просмотра:</b>"
+
+# Добавление канала
+ADD_CHANNEL = "➕ <b>Добавить канал</b>"
+ENTER_CHANNEL_ID = "📺 <b>Введите ID канала или @username:</b>\n\n<i>💡 Например: @mychannel или -100xxxxxxxxx</i>"
+ENTER_CHANNEL_NAME = "📝 <b>Введите название канала:</b>"
+CHANNEL_ADDED = "✅ <b>Канал добавлен!</b>"
+CHANNEL_EXISTS = "⚠️ <b>Этот канал уже добавлен!</b>"
+
+# Удаление канала
+DELETE_CHANNEL_CONFIRM = "🗑 <b>Удалить канал?</b>\n\n{channel_name}"
+CHANNEL_DELETED = "🗑 <b>Канал удален!</b>"
+
+# =============================================================================
+# КНОПКИ КЛАВИАТУР
+# =============================================================================
+
+# Главное меню
+BTN_CREATE_GIVEAWAY = "🎲 Создать розыгрыш"
+BTN_CREATED_GIVEAWAYS = "📝 Созданные розыгрыши"
+BTN_ACTIVE_GIVEAWAYS = "🎯 Активные розыгрыши"
+
+# Типы розыгрышей
+BTN_COMMENT_GIVEAWAY = "💬 По комментариям"
+BTN_BUTTON_GIVEAWAY = "🔘 По кнопке"
+
+# Медиафайлы
+BTN_YES = "✅ Да"
+BTN_NO = "❌ Нет"
+BTN_ADD_PHOTO = "🖼 Фото"
+BTN_ADD_VIDEO = "🎬 Видео"
+
+# Навигация
+BTN_BACK = "« Назад"
+BTN_CANCEL = "❌ Отмена"
+BTN_CONTINUE = "Продолжить »"
+BTN_EDIT = "✏️ Изменить"
+BTN_CONFIRM = "✅ Подтвердить"
+
+# Управление розыгрышем
+BTN_START_GIVEAWAY = "🚀 Запустить"
+BTN_STOP_GIVEAWAY = "⏹ Остановить"
+BTN_DELETE_GIVEAWAY = "🗑 Удалить"
+BTN_EDIT_DATE = "📅 Изменить дату"
+BTN_VIEW_PARTICIPANTS = "👥 Участники"
+BTN_VIEW_RESULTS = "🏆 Результаты"
+
+# Каналы
+BTN_ADD_CHANNEL = "➕ Добавить канал"
+BTN_MANAGE_CHANNELS = "📺 Управление каналами"
+BTN_DELETE_CHANNEL = "🗑 Удалить"
+BTN_VIEW_CHANNEL = "👁 Просмотр"
+
+# Пагинация
+BTN_PREV_PAGE = "⬅️"
+BTN_NEXT_PAGE = "➡️"
+BTN_PAGE_INFO = "Страница {current}/{total}"
+
+# =============================================================================
+# ОШИБКИ И СИСТЕМНЫЕ СООБЩЕНИЯ
+# =============================================================================
+
+# Общие ошибки
+ERROR_UNKNOWN = "❌ <b>Произошла неизвестная ошибка!</b>\n\nПопробуйте позже или обратитесь к администратору."
+ERROR_ACCESS_DENIED = (
+    "🚫 <b>Доступ запрещен!</b>\n\nУ вас нет прав для выполнения этого действия."
+)
+ERROR_NOT_FOUND = "❌ <b>Не найдено!</b>\n\nЗапрашиваемый объект не существует."
+ERROR_INVALID_FORMAT = (
+    "❌ <b>Неверный формат!</b>\n\nПроверьте правильность ввода данных."
+)
+
+# Ошибки каналов
+ERROR_CHANNEL_NOT_FOUND = (
+    "❌ <b>Канал не найден!</b>\n\nПроверьте правильность ID канала."
+)
+ERROR_BOT_NOT_ADMIN = "❌ <b>Бот не является администратором канала!</b>\n\nДобавьте бота как администратора канала."
+ERROR_NO_PERMISSIONS = (
+    "❌ <b>Недостаточно прав!</b>\n\nУ бота нет необходимых разрешений в канале."
+)
+
+# Ошибки розыгрышей
+ERROR_GIVEAWAY_NOT_FOUND = "❌ <b>Розыгрыш не найден!</b>"
+ERROR_GIVEAWAY_ALREADY_STARTED = "⚠️ <b>Розыгрыш уже запущен!</b>"
+ERROR_GIVEAWAY_ALREADY_ENDED = "⚠️ <b>Розыгрыш уже завершен!</b>"
+ERROR_NO_PARTICIPANTS = "⚠️ <b>Нет участников!</b>\n\nНевозможно определить победителей."
+
+# Системные сообщения
+LOADING = "⏳ Загрузка..."
+PROCESSING = "⏳ Обработка..."
+PLEASE_WAIT = "⏳ Пожалуйста, подождите..."
+
+# =============================================================================
+# ФОРМАТИРОВАНИЕ ДАННЫХ
+# =============================================================================
+
+
+def format_giveaway_type(giveaway_type: str) -> str:
+    """Форматирование типа розыгрыша"""
+    return {"button": "🔘 По кнопке", "comments": "💬 По комментариям"}.get(
+        giveaway_type, giveaway_type
+    )
+
+
+def format_yes_no(value: bool) -> str:
+    """Форматирование да/нет"""
+    return "✅ Да" if value else "❌ Нет"
+
+
+def format_giveaway_status(is_active: bool) -> str:
+    """Форматирование статуса розыгрыша"""
+    return "🎯 Активный" if is_active else "📝 Создан"
+
+
+def format_datetime(dt) -> str:
+    """Форматирование даты и времени"""
+    return dt.strftime("%d.%m.%Y в %H:%M")
+
+
+def format_date(dt) -> str:
+    """Форматирование даты"""
+    return dt.strftime("%d.%m.%Y")
+
+
+def format_participants_count(count: int) -> str:
+    """Форматирование количества участников"""
+    if count == 0:
+        return "Участников нет"
+    elif count == 1:
+        return "1 участник"
+    elif 2 <= count <= 4:
+        return f"{count} участника"
+    else:
+        return f"{count} участников"
+
+
+def format_winners_count(count: int) -> str:
+    """Форматирование количества победителей"""
+    if count == 1:
+        return "1 победитель"
+    elif 2 <= count <= 4:
+        return f"{count} победителя"
+    else:
+        return f"{count} победителей"
+
+
+# =============================================================================
+# ШАБЛОНЫ СООБЩЕНИЙ
+# =============================================================================
+
+
+def get_giveaway_info_text(giveaway_data: dict) -> str:
+    """Получить полную информацию о розыгрыше"""
+    return f"""
+🎲 <b>{giveaway_data.get("name", "Без названия")}</b>
+
+📝 <b>Тип:</b> {format_giveaway_type(giveaway_data.get("type", "unknown"))}
+🏆 <b>Победителей:</b> {giveaway_data.get("winners_count", 0)}
+📅 <b>Завершение:</b> {format_datetime(giveaway_data.get("over_date", ""))}
+🤖 <b>Капча:</b> {format_yes_no(giveaway_data.get("captcha", False))}
+📊 <b>Статус:</b> {format_giveaway_status(giveaway_data.get("run_status", False))}
+
+📄 <b>Описание:</b>
+{giveaway_data.get("text", "Описание отсутствует")}
+"""
+
+
+def get_channel_info_text(channel_data: dict) -> str:
+    """Получить информацию о канале"""
+    return f"""
+📺 <b>{channel_data.get("name", "Без названия")}</b>
+
+🆔 <b>ID:</b> <code>{channel_data.get("channel_id", "Неизвестно")}</code>
+"""
+
+
+def get_results_text(winners_data: list) -> str:
+    """Получить текст с результатами розыгрыша"""
+    if not winners_data:
+        return "🏆 <b>Результаты розыгрыша:</b>\n\n❌ Победители не определены"
+
+    text = "🏆 <b>Результаты розыгрыша:</b>\n\n"
+
+    for i, winner in enumerate(winners_data, 1):
+        username = winner.get("username", f"ID{winner.get('user_id', 'неизвестен')}")
+        text += f"🥇 <b>{i} место</b> - @{username}\n"
+
+    return text
+
+
+# =============================================================================
+# КОМАНДЫ БОТА
+# =============================================================================
+
+COMMANDS_DESCRIPTION = {
+    "start": "Запустить бота и открыть главное меню",
+    "help": "Показать справку по использованию бота",
+    "menu": "Открыть главное меню",
+}
+
+HELP_TEXT = """
+🤖 <b>Справка по использованию бота</b>
+
+<b>Основные функции:</b>
+🎲 Создание розыгрышей двух типов
+📺 Управление каналами для проверки подписки
+🏆 Автоматическое определение победителей
+📊 Просмотр статистики участников
+
+<b>Типы розыгрышей:</b>
+🔘 <b>По кнопке</b> - пользователи участвуют нажатием на кнопку
+💬 <b>По комментариям</b> - участие через комментарии с ключевым словом
+
+<b>Команды:</b>
+/start - Главное меню
+/help - Эта справка
+
+<b>Поддержка:</b> @support_username
+"""
+
+ABOUT_TEXT = """
+🎯 <b>Бот для проведения розыгрышей</b>
+
+Версия: 2.0
+Разработчик: @developer_username
+
+Возможности:
+✅ Розыгрыши по кнопке и комментариям
+✅ Проверка подписки на каналы
+✅ Капча против ботов
+✅ Медиафайлы в розыгрышах
+✅ Автоматическое определение победителей
+✅ Уведомления о результатах
+
+© 2024 Все права защищены
+"""
@@ -0,0 +1,223 @@
+"""
+Per-chat ordered, bounded-concurrency update dispatching.
+
+Every update is queued on a lane keyed by its chat. A fixed pool of workers
+takes lanes that have pending work, one update at a time, so updates within
+a chat are handled strictly in order while different chats run in parallel.
+A slow subscription check in one group no longer holds up another.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+
+from aiogram import Dispatcher, types
+
+logger = logging.getLogger(__name__)
+
+
+def get_update_key(update: types.Update):
+    """Return the ordering key of an update (chat id where there is one)"""
+    for message in (
+        update.message,
+        update.edited_message,
+        update.channel_post,
+        update.edited_channel_post,
+    ):
+        if message:
+            return message.chat.id
+
+    if update.callback_query:
+        if update.callback_query.message:
+            return update.callback_query.message.chat.id
+        return update.callback_query.from_user.id
+
+    for query in (
+        update.inline_query,
+        update.chosen_inline_result,
+        update.shipping_query,
+        update.pre_checkout_query,
+    ):
+        if query:
+            return query.from_user.id
+
+    if update.poll_answer:
+        return update.poll_answer.user.id
+
+    # Not modelled by aiogram 2.9: joins and leaves of one channel stay in order
+    for raw_key in ("chat_member", "my_chat_member"):
+        member_update = update.values.get(raw_key)
+        if member_update:
+            return member_update["chat"]["id"]
+
+    # No chat to keep order within
+    return ("update", update.update_id)
+
+
+class ChatShardedDispatcher:
+    """Routes updates into per-chat lanes served by a bounded worker pool"""
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        workers: int = 32,
+        max_pending: int = 10000,
+        max_per_chat: int = 1000,
+    ):
+        self.dispatcher = dispatcher
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_per_chat = max_per_chat
+
+        self._lanes = {}
+        self._ready = None
+        self._space = None
+        self._idle = None
+        self._worker_tasks = []
+        self._pending = 0
+        self._pending_ids = []
+        self._done_ids = set()
+
+        self.submitted = 0
+        self.processed = 0
+        self.failed = 0
+        self.blocked_submits = 0
+        self.blocked_seconds = 0.0
+        self.max_pending_seen = 0
+        self.total_wait_seconds = 0.0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def active_chats(self) -> int:
+        return len(self._lanes)
+
+    @property
+    def oldest_pending_update_id(self):
+        """Lowest update_id that is queued or still being processed"""
+        while self._pending_ids and self._pending_ids[0] in self._done_ids:
+            self._done_ids.discard(heapq.heappop(self._pending_ids))
+        return self._pending_ids[0] if self._pending_ids else None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._worker_tasks)
+
+    def start(self):
+        if self._worker_tasks:
+            return
+        self._ready = asyncio.Queue()
+        self._space = asyncio.Condition()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker_tasks = [
+            asyncio.get_running_loop().create_task(self._worker())
+            for _ in range(self.workers)
+        ]
+        logger.info(f"Update dispatcher started with {self.workers} workers")
+
+    def _has_space(self, key) -> bool:
+        lane = self._lanes.get(key)
+        if lane is not None and len(lane) >= self.max_per_chat:
+            return False
+        return self._pending < self.max_pending
+
+    async def submit(self, update: types.Update):
+        """Queue an update, waiting while the queue limits are reached"""
+        if not self._worker_tasks:
+            self.start()
+
+        key = get_update_key(update)
+        if not self._has_space(key):
+            self.blocked_submits += 1
+            started = time.monotonic()
+            async with self._space:
+                await self._space.wait_for(lambda: self._has_space(key))
+            self.blocked_seconds += time.monotonic() - started
+
+        self.submitted += 1
+        self._pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self._pending)
+        self._idle.clear()
+        heapq.heappush(self._pending_ids, update.update_id)
+
+        lane = self._lanes.get(key)
+        if lane is None:
+            # A new lane is ready right away; an existing one is either queued
+            # in _ready already or being worked on and will be requeued
+            lane = self._lanes[key] = deque()
+            self._ready.put_nowait(key)
+        lane.append((update, time.monotonic()))
+
+    async def _worker(self):
+        while True:
+            key = await self._ready.get()
+            lane = self._lanes[key]
+            update, queued_at = lane.popleft()
+            self.total_wait_seconds += time.monotonic() - queued_at
+
+            try:
+                await self.dispatcher.process_update(update)
+            except asyncio.CancelledError:
+                # Abandoned on shutdown: it stays counted as pending
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Error processing update {update.update_id}: {e}")
+
+            self.processed += 1
+            self._pending -= 1
+            self._done_ids.add(update.update_id)
+            if lane:
+                # Go to the back of the line so busy chats cannot starve others
+                self._ready.put_nowait(key)
+            else:
+                del self._lanes[key]
+            if not self._pending:
+                self._idle.set()
+            async with self._space:
+                self._space.notify_all()
+
+    async def join(self, timeout: float = None) -> bool:
+        """Wait until every queued update is processed"""
+        if not self._worker_tasks:
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def drain(self, timeout: float) -> dict:
+        """Finish queued updates within timeout, then stop the workers"""
+        processed_before = self.processed
+        await self.join(timeout)
+        abandoned = self._pending
+        await self.close()
+        return {"completed": self.processed - processed_before, "abandoned": abandoned}
+
+    async def close(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info(f"Update dispatcher stopped: {self.stats()}")
+
+    def stats(self) -> dict:
+        """Back-pressure metrics"""
+        processed = self.processed or 1
+        return {
+            "pending": self._pending,
+            "active_chats": len(self._lanes),
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "failed": self.failed,
+            "max_pending_seen": self.max_pending_seen,
+            "blocked_submits": self.blocked_submits,
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "avg_queue_wait_ms": round(self.total_wait_seconds / processed * 1000, 2),
+        }
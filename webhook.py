@@ -0,0 +1,177 @@
+"""
+Webhook ingestion mode.
+
+Telegram pushes updates to an aiohttp endpoint. Every update is acknowledged
+as soon as it is parsed and handled in its own task, so a slow handler never
+holds back the next delivery.
+
+The endpoint is public, so setWebhook registers a secret_token (WEBHOOK_SECRET,
+or a random one per start when the bot registers the webhook itself) and
+requests without the matching X-Telegram-Bot-Api-Secret-Token header are
+refused: otherwise anyone could post forged updates, e.g. from an OWNERS id.
+"""
+
+import hmac
+import json
+import logging
+import secrets
+
+import runtime_config
+from aiogram import Bot, Dispatcher, types
+from aiogram.bot import api
+from aiohttp import web
+from catchup import BacklogCatchUp
+from lifecycle import get_stop_event, install_stop_signals, spawn
+from membership_index import allowed_updates
+from update_dispatcher import ChatShardedDispatcher
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class WebhookIngestion:
+    """aiohttp endpoint that hands every update to the dispatcher in the background"""
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        path: str = "/webhook",
+        chat_dispatcher: ChatShardedDispatcher = None,
+        secret_token: str = None,
+    ):
+        self.dispatcher = dispatcher
+        self.path = path
+        self.chat_dispatcher = chat_dispatcher
+        self.secret_token = secret_token
+        self.received = 0
+        self.failed = 0
+        self.forbidden = 0
+        self._tasks = set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def _authorized(self, request: web.Request) -> bool:
+        if not self.secret_token:
+            return True
+        token = request.headers.get(SECRET_TOKEN_HEADER, "")
+        return hmac.compare_digest(token.encode(), self.secret_token.encode())
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            self.forbidden += 1
+            logger.warning(f"Rejected webhook request without a valid secret from {request.remote}")
+            return web.Response(status=403)
+        try:
+            data = await request.json()
+            update = types.Update(**data)
+        except Exception as e:
+            logger.warning(f"Rejected malformed webhook payload: {e}")
+            return web.Response(status=400)
+
+        self.received += 1
+        if self.chat_dispatcher:
+            # Blocks only when the queue limits are hit, which slows Telegram down
+            await self.chat_dispatcher.submit(update)
+        else:
+            self.submit(update)
+        # Telegram only needs a 2xx to consider the update delivered
+        return web.Response(status=200)
+
+    def submit(self, update: types.Update):
+        task = spawn(self._process(update))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, update: types.Update):
+        try:
+            await self.dispatcher.process_update(update)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Error processing update {update.update_id}: {e}")
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(self.path, self.handle)
+        return app
+
+
+async def serve_webhook(
+    dispatcher: Dispatcher,
+    on_startup=None,
+    on_shutdown=None,
+    webhook_url: str = None,
+    path: str = None,
+    host: str = None,
+    port: int = None,
+    chat_dispatcher: ChatShardedDispatcher = None,
+    catch_up: bool = False,
+    secret_token: str = None,
+):
+    """Run the webhook server until SIGINT/SIGTERM"""
+    webhook_url = webhook_url if webhook_url is not None else runtime_config.WEBHOOK_URL
+    path = path or runtime_config.WEBHOOK_PATH
+    host = host or runtime_config.WEBAPP_HOST
+    port = port or runtime_config.WEBAPP_PORT
+    secret_token = secret_token or runtime_config.WEBHOOK_SECRET
+    if not secret_token:
+        if not webhook_url:
+            raise RuntimeError(
+                "WEBHOOK_SECRET is required when the webhook is registered externally"
+            )
+        # We register the webhook ourselves, so a fresh secret per start will do
+        secret_token = secrets.token_urlsafe(32)
+
+    Dispatcher.set_current(dispatcher)
+    Bot.set_current(dispatcher.bot)
+
+    ingestion = WebhookIngestion(dispatcher, path, chat_dispatcher, secret_token)
+    if chat_dispatcher:
+        chat_dispatcher.start()
+    runner = web.AppRunner(ingestion.build_app())
+    await runner.setup()
+
+    stop_event = get_stop_event()
+    install_stop_signals(stop_event)
+
+    if on_startup:
+        await on_startup(dispatcher)
+
+    try:
+        if catch_up and webhook_url:
+            # getUpdates only works without a webhook: drain, then register it
+            await dispatcher.bot.delete_webhook()
+            await BacklogCatchUp(dispatcher, chat_dispatcher).run()
+
+        await web.TCPSite(runner, host, port).start()
+        logger.info(f"Webhook server listening on {host}:{port}{path}")
+
+        if webhook_url:
+            # aiogram 2.9's set_webhook predates secret_token
+            payload = {
+                "url": webhook_url.rstrip("/") + path,
+                "max_connections": runtime_config.WEBHOOK_MAX_CONNECTIONS,
+                "secret_token": secret_token,
+            }
+            if allowed_updates() is not None:
+                payload["allowed_updates"] = json.dumps(allowed_updates())
+            await dispatcher.bot.request(api.Methods.SET_WEBHOOK, payload)
+            logger.info(f"Webhook registered at {webhook_url.rstrip('/')}{path}")
+        else:
+            logger.warning("WEBHOOK_URL is empty, expecting the webhook to be set externally")
+
+        await stop_event.wait()
+    finally:
+        logger.info("Stopping webhook server...")
+        # Stop accepting new updates first; on_shutdown drains the rest
+        await runner.cleanup()
+        logger.info(
+            f"Webhook stats: received={ingestion.received}, failed={ingestion.failed}, "
+            f"forbidden={ingestion.forbidden}, in_flight={ingestion.in_flight}"
+        )
+        if on_shutdown:
+            await on_shutdown(dispatcher)
+        if chat_dispatcher:
+            await chat_dispatcher.close()